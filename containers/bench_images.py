@@ -0,0 +1,188 @@
+"""
+    Build the python-module and python-script images, the tutorial's
+    Dockerfile and the slim multi-stage Dockerfile.slim of each, locally
+    (no registry), and compare:
+      - image size,
+      - pull-equivalent cost: the layers' gzipped size (what a registry
+        sends) and the time to decompress and extract them (what each node
+        does on a pull), from `docker save`,
+      - cold-start latency: `docker run --rm` of the image's command
+        (`janis -v`, `hello.py`), first run and the median of --runs.
+
+    Each image must also import the standard library modules that need
+    shared libraries (STDLIB_IMPORTS), so a slim image that's fast only
+    because it's broken fails instead of winning.
+
+    Usage: python3 bench_images.py [--runs 5] [--only python-module] [-o images.json]
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import tarfile
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (build context, command to time)
+IMAGES = {
+    "python-module": ("python-module", ["janis", "-v"]),
+    "python-script": ("python-script", ["hello.py"]),
+}
+DOCKERFILES = ["Dockerfile", "Dockerfile.slim"]
+
+# Standard library modules backed by a shared library (libffi, expat, bzip2,
+# xz, sqlite, readline, ncurses, openssl, zlib) the base image has to provide
+STDLIB_IMPORTS = [
+    "ctypes", "pyexpat", "xml.etree.ElementTree", "bz2", "lzma", "sqlite3",
+    "readline", "curses", "ssl", "zlib",
+]
+IMPORT_CHECK = """
+import importlib, sys
+for module in sys.argv[1:]:
+    try:
+        importlib.import_module(module)
+    except ImportError as e:
+        print(f"{module}: {e}")
+"""
+
+
+def docker(*args, **kwargs):
+    return subprocess.run(["docker", *args], check=True, **kwargs)
+
+
+def build(context, dockerfile, tag):
+    docker(
+        "build", "-q", "-t", tag, "-f", os.path.join(context, dockerfile), context,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def image_size(tag):
+    result = docker(
+        "image", "inspect", "--format", "{{.Size}}", tag,
+        stdout=subprocess.PIPE, universal_newlines=True,
+    )
+    return int(result.stdout)
+
+
+def layers(saved):
+    """
+    Yields the raw layer tars of a `docker save` archive
+    """
+    with tarfile.open(saved) as archive:
+        manifest = json.load(archive.extractfile("manifest.json"))
+        for layer in manifest[0]["Layers"]:
+            yield archive.extractfile(layer).read()
+
+
+def pull_cost(tag, workdir):
+    """
+    Returns (gzipped bytes, seconds to decompress and extract every layer)
+    """
+    saved = os.path.join(workdir, "image.tar")
+    docker("save", "-o", saved, tag)
+    # registries store and send gzipped layers, default level like docker push
+    compressed = [
+        layer if layer[:2] == b"\x1f\x8b" else gzip.compress(layer, compresslevel=6)
+        for layer in layers(saved)
+    ]
+    os.remove(saved)
+
+    rootfs = os.path.join(workdir, "rootfs")
+    start = time.perf_counter()
+    for layer in compressed:
+        with tarfile.open(fileobj=io.BytesIO(gzip.decompress(layer))) as tar:
+            # whiteouts and device files don't matter for timing, skip them
+            members = [m for m in tar if m.isfile() or m.isdir() or m.issym()]
+            tar.extractall(rootfs, members=members)
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(rootfs)
+    return sum(len(layer) for layer in compressed), elapsed
+
+
+def failed_imports(tag):
+    """
+    Returns ["module: error"] for the STDLIB_IMPORTS the image's python can't import
+    """
+    result = docker(
+        "run", "--rm", "--entrypoint", "python", tag, "-c", IMPORT_CHECK, *STDLIB_IMPORTS,
+        stdout=subprocess.PIPE, universal_newlines=True,
+    )
+    return result.stdout.splitlines()
+
+
+def cold_start(tag, command, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        docker(
+            "run", "--rm", tag, *command,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return times[0], statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--only", choices=sorted(IMAGES), action="append")
+    parser.add_argument("-o", "--output", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    if not shutil.which("docker"):
+        raise SystemExit("Needs docker")
+
+    results, broken = [], []
+    for name in args.only or sorted(IMAGES):
+        context, command = IMAGES[name]
+        for dockerfile in DOCKERFILES:
+            tag = f"janis-bench/{name}:{dockerfile.lower().replace('.', '-')}"
+            build(os.path.join(HERE, context), dockerfile, tag)
+            failed = failed_imports(tag)
+            if failed:
+                broken.append(f"{name}/{dockerfile}: {'; '.join(failed)}")
+            workdir = tempfile.mkdtemp(prefix="bench-images-")
+            try:
+                compressed, extract = pull_cost(tag, workdir)
+            finally:
+                shutil.rmtree(workdir)
+            first, median = cold_start(tag, command, args.runs)
+            results.append(
+                {
+                    "image": name,
+                    "dockerfile": dockerfile,
+                    "size_bytes": image_size(tag),
+                    "compressed_bytes": compressed,
+                    "extract_seconds": extract,
+                    "first_start_seconds": first,
+                    "median_start_seconds": median,
+                }
+            )
+
+    print(
+        f"{'image':<15}{'dockerfile':<17}{'size MB':>9}{'gz MB':>8}"
+        f"{'extract s':>11}{'1st run s':>11}{'median s':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['image']:<15}{r['dockerfile']:<17}{r['size_bytes'] / 1e6:>9.1f}"
+            f"{r['compressed_bytes'] / 1e6:>8.1f}{r['extract_seconds']:>11.2f}"
+            f"{r['first_start_seconds']:>11.2f}{r['median_start_seconds']:>10.2f}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if broken:
+        raise SystemExit("Images missing standard library modules:\n" + "\n".join(broken))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+    Check janis_entry.py without janis: drives its main() with a stand-in
+    janis_assistant.cli (that records the arguments janis would get) and an
+    index of a stand-in tool module, over the argument shapes resolve_tool
+    claims to handle and the ones it should leave to janis.
+
+    Usage: python3 check_entry.py
+
+    Exits non-zero if any check fails.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+__dir = os.path.dirname(os.path.abspath(__file__))
+
+# records what janis would have been called with, and whether --name
+# names a class in the file passed with it
+STUB_CLI = """\
+import importlib.util, json, os, sys
+
+def process_args():
+    argv = sys.argv[1:]
+    defined = None
+    path = next((a for a in argv if a.endswith(".py")), None)
+    if "--name" in argv and path:
+        name = argv[argv.index("--name") + 1]
+        spec = importlib.util.spec_from_file_location("tool", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        defined = hasattr(module, name)
+    with open(os.environ["CHECK_RECORD"], "w") as f:
+        json.dump({"argv": argv, "defined": defined}, f)
+    return 0
+"""
+STUB_TOOL = """\
+class BwaMemLatest:
+    pass
+"""
+VERSIONS = {"janis-core": "v0.0.0", "janis-assistant": "v0.0.0"}
+
+
+def check(name, condition):
+    print(f"{'ok' if condition else 'FAILED':<8}{name}", flush=True)
+    return condition
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="check-entry-")
+    try:
+        os.makedirs(os.path.join(workdir, "janis_assistant"))
+        open(os.path.join(workdir, "janis_assistant", "__init__.py"), "w").close()
+        with open(os.path.join(workdir, "janis_assistant", "cli.py"), "w") as f:
+            f.write(STUB_CLI)
+        tool_file = os.path.join(workdir, "bwa_mem.py")
+        with open(tool_file, "w") as f:
+            f.write(STUB_TOOL)
+        index = os.path.join(workdir, "index.json")
+        with open(index, "w") as f:
+            tools = {"bwamem": {"file": tool_file, "name": "BwaMemLatest"}}
+            json.dump({"versions": VERSIONS, "tools": tools}, f)
+        record = os.path.join(workdir, "record.json")
+        cwd = os.path.join(workdir, "cwd")
+        os.makedirs(cwd)
+
+        def janis(*argv, index=index):
+            """
+            Returns (stdout, the arguments janis got or None, whether --name
+            named a class of the file)
+            """
+            if os.path.exists(record):
+                os.remove(record)
+            env = dict(
+                os.environ,
+                JANIS_TOOL_INDEX=index,
+                CHECK_RECORD=record,
+                PYTHONPATH=os.pathsep.join([workdir, __dir]),
+            )
+            run = subprocess.run(
+                [
+                    sys.executable, "-c",
+                    "import sys, janis_entry; sys.exit(janis_entry.main(sys.argv[1:]))",
+                    *argv,
+                ],
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+                check=True,
+            )
+            if not os.path.exists(record):
+                return run.stdout, None, None
+            with open(record) as f:
+                called = json.load(f)
+            return run.stdout, called["argv"], called["defined"]
+
+        def resolves(*argv):
+            """
+            What janis should get for argv once bwamem is resolved
+            """
+            argv = [tool_file if arg == "bwamem" else arg for arg in argv]
+            return [argv[0], "--name", "BwaMemLatest", *argv[1:]]
+
+        results = []
+        stdout, called, _ = janis("-v")
+        results.append(
+            check(
+                "-v prints the indexed versions without janis",
+                called is None and all(v in stdout for v in VERSIONS),
+            )
+        )
+
+        resolved = [
+            ("translate bwamem wdl", ["translate", "bwamem", "wdl"]),
+            ("inputs with a flag", ["inputs", "--all", "bwamem"]),
+            (
+                "run with flags, options with values and workflow inputs after the tool",
+                ["run", "-B", "-o", "part1", "--engine", "cwltool", "bwamem", "--reads", "x"],
+            ),
+            ("an --option=value", ["run", "--engine=cwltool", "bwamem"]),
+            ("short options with values", ["inputs", "-c", "c.yml", "-i", "in.yml", "bwamem"]),
+        ]
+        for name, argv in resolved:
+            _, called, defined = janis(*argv)
+            results.append(
+                check(f"{name}: resolved", called == resolves(*argv) and defined is True)
+            )
+
+        unchanged = [
+            ("an option it doesn't know", ["run", "--unknown", "bwamem"]),
+            ("--name already given", ["translate", "--name", "BwaMemLatest", "bwamem", "wdl"]),
+            ("a tool id that isn't indexed", ["translate", "gatk", "wdl"]),
+            ("another subcommand", ["watch", "bwamem"]),
+            ("no tool id", ["run", "-B"]),
+        ]
+        for name, argv in unchanged:
+            _, called, _ = janis(*argv)
+            results.append(check(f"{name}: left to janis", called == argv))
+
+        # a file named like the tool, in the working directory, is what janis runs
+        open(os.path.join(cwd, "bwamem"), "w").close()
+        _, called, _ = janis("translate", "bwamem", "wdl")
+        results.append(
+            check(
+                "a file named like the tool: left to janis",
+                called == ["translate", "bwamem", "wdl"],
+            )
+        )
+        os.remove(os.path.join(cwd, "bwamem"))
+
+        missing = os.path.join(workdir, "missing.json")
+        _, called, _ = janis("translate", "bwamem", "wdl", index=missing)
+        _, version_called, _ = janis("-v", index=missing)
+        results.append(
+            check(
+                "without an index: everything goes to janis",
+                called == ["translate", "bwamem", "wdl"] and version_called == ["-v"],
+            )
+        )
+    finally:
+        shutil.rmtree(workdir)
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+    Startup time regression check: runs a command a few times and fails if
+    its fastest cold start is slower than the threshold, printing the
+    slowest imports (python -X importtime) to show why.
+
+    The default command is `janis translate <tool> wdl`, for a tool from
+    the index (see janis_entry.py): that's the path a task takes, importing
+    janis and the tool's module, where `janis -v` is answered from the index
+    without importing anything.
+
+    It first checks this python can import the standard library modules
+    that need shared libraries from the image (STDLIB_IMPORTS): a slim
+    image missing them starts fast, and breaks later.
+
+    Usage: python3 check_startup.py [--threshold 3] [--runs 5] [--tool bwamem] [-- command ...]
+
+    Run it as its own check against a built image, with a threshold that
+    suits the machine (an emulated or busy builder is far slower), eg:
+        docker run --rm yourname/janis-pipelines:slim python /opt/janis/check_startup.py
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+# Standard library modules backed by a shared library (libffi, expat, bzip2,
+# xz, sqlite, readline, ncurses, openssl, zlib) the base image has to provide
+STDLIB_IMPORTS = [
+    "ctypes", "pyexpat", "xml.etree.ElementTree", "bz2", "lzma", "sqlite3",
+    "readline", "curses", "ssl", "zlib",
+]
+
+
+def default_command(tool=None):
+    """
+    `janis translate <tool> wdl`, with tool (default: the first indexed one)
+    taken from the index so it's resolved to its module
+    """
+    index_path = os.environ.get("JANIS_TOOL_INDEX", "/opt/janis/index.json")
+    with open(index_path) as f:
+        tools = sorted(json.load(f)["tools"])
+    if not tools:
+        raise SystemExit(f"There are no tools in {index_path}")
+    if tool and tool not in tools:
+        raise SystemExit(f"{tool} isn't in {index_path}")
+    return ["janis", "translate", tool or tools[0], "wdl"]
+
+
+def failed_imports(modules=STDLIB_IMPORTS):
+    """
+    Returns ["module: error"] for the modules a fresh interpreter can't import
+    """
+    failed = []
+    for module in modules:
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        if result.returncode:
+            failed.append(f"{module}: {result.stderr.strip().splitlines()[-1]}")
+    return failed
+
+
+def time_command(command, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def slowest_imports(command, top=10):
+    """
+    Returns the top cumulative import times (us, module) of a python command
+    """
+    executable = shutil.which(command[0]) or command[0]
+    with open(executable, "rb") as f:
+        if not f.read(2) == b"#!":
+            return []
+    env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+    result = subprocess.run(
+        [sys.executable, executable] + command[1:],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line[len("import time:") :].split("|")
+            if cumulative.strip().isdigit():
+                imports.append((int(cumulative), module.rstrip()))
+    # only top level imports, nested ones are counted in their parents
+    top_level = [(us, m) for us, m in imports if not m.startswith("  ")]
+    return sorted(top_level, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threshold", type=float, default=3.0, help="Seconds")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tool", help="Indexed tool to translate, eg: bwamem")
+    parser.add_argument("command", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    failed = failed_imports()
+    if failed:
+        print("The image's python can't import:")
+        for line in failed:
+            print(f"    {line}")
+        sys.exit(1)
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    command = command or default_command(args.tool)
+
+    times = time_command(command, args.runs)
+    fastest = min(times)
+    print(
+        f"{' '.join(command)}: fastest {fastest:.3f}s, slowest {max(times):.3f}s "
+        f"over {args.runs} runs (threshold {args.threshold:.3f}s)"
+    )
+    if fastest <= args.threshold:
+        return
+
+    print("Startup is slower than the threshold, slowest imports:")
+    for us, module in slowest_imports(command):
+        print(f"{us / 1e6:>9.3f}s  {module.strip()}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
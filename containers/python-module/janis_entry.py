@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+    A faster `janis` entrypoint for the python-module image.
+
+    `janis` imports janis_core, janis_assistant and, to find a tool by name,
+    every registry module (janis_bioinformatics, janis_unix, ...) on every
+    call. This entrypoint uses a tool index resolved once, when the image is
+    built, so:
+      - `janis -v` prints the versions from the index, importing nothing,
+      - `janis translate|run|inputs <tool id> ...` passes janis the file
+        that defines the tool (and --name), so only that module is imported
+        instead of the whole registry,
+      - anything else goes to janis as usual.
+
+    Usage: janis_entry.py --build-index /opt/janis/index.json   (at image build)
+           janis_entry.py <janis arguments>                     (installed as `janis`)
+
+    The index is $JANIS_TOOL_INDEX, or /opt/janis/index.json. Without one,
+    every call goes to janis as usual.
+"""
+
+import json
+import os
+import sys
+
+INDEX_PATH = os.environ.get("JANIS_TOOL_INDEX", "/opt/janis/index.json")
+# Modules `janis -v` reports, with the names it reports them as
+VERSION_MODULES = [
+    ("janis-core", "janis_core"),
+    ("janis-assistant", "janis_assistant"),
+    ("janis-unix", "janis_unix"),
+    ("janis-bioinformatics", "janis_bioinformatics"),
+]
+# Subcommands whose first positional argument may be a tool id
+TOOL_SUBCOMMANDS = {"translate", "run", "inputs"}
+# Their options that take a value, which is skipped looking for the tool id
+OPTIONS_WITH_VALUES = {
+    "-i", "--inputs", "-o", "--output-dir", "-c", "--config", "--engine",
+    "--recipe", "--hints", "--max-cores", "--max-memory", "--max-mem",
+    "--max-duration", "--container-override", "--cromwell-url",
+    "--batchrun-fields", "--batchrun-groupby", "--validation-reference",
+    "--validation-truth-vcf", "--validation-intervals", "--validation-fields",
+}
+# and their flags. Past any other option, the tool id is left to janis.
+FLAGS = {
+    "-B", "--background", "-F", "--foreground", "--dry-run", "--development",
+    "--keep-intermediate-files", "--skip-file-check", "--allow-empty-container",
+    "--no-watch", "--stay-connected", "--mysql", "--no-mysql", "--strict-inputs",
+    "--cwltool", "--cromwell", "--toil", "--resources", "--toolbox", "--no-cache",
+    "-a", "--all", "--user", "--static", "--json", "--yaml",
+}
+
+
+def build_index(path):
+    """
+    Resolves every registry tool to the file and class that define it
+    """
+    import importlib
+    import inspect
+
+    from janis_core import JanisShed
+
+    versions = {}
+    for name, module in VERSION_MODULES:
+        try:
+            versions[name] = importlib.import_module(module).__version__
+        except ImportError:
+            pass
+
+    JanisShed.hydrate()
+    tools = {}
+    for tool_versions in JanisShed.get_all_tools():
+        tool_id = tool_versions[0].id()
+        # the version janis picks for a bare tool id
+        latest = JanisShed.get_tool(tool_id)
+        cls = latest if inspect.isclass(latest) else type(latest)
+        if cls.__module__.startswith("janis_core"):
+            # built with CommandToolBuilder, there's no class to name
+            continue
+        tools[tool_id] = {"file": inspect.getsourcefile(cls), "name": cls.__name__}
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"versions": versions, "tools": tools}, f, indent=2, sort_keys=True)
+    return len(tools)
+
+
+def load_index(path=INDEX_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def print_versions(versions):
+    # the same table janis -v prints
+    width = max(len(name) for name in versions)
+    version_width = max(len(version) for version in versions.values())
+    rule = f"{'-' * width}  {'-' * version_width}"
+    print(rule)
+    for name, version in versions.items():
+        print(f"{name:<{width}}  {version}")
+    print(rule)
+
+
+def resolve_tool(argv, tools):
+    """
+    Replaces a tool id (eg: `janis translate bwamem wdl`, or `janis run -B
+    -o part1 hello`) with the file that defines it and --name, leaving
+    anything ambiguous for janis to resolve
+    """
+    if not argv or argv[0] not in TOOL_SUBCOMMANDS or "--name" in argv:
+        return argv
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith("-"):
+            if arg in OPTIONS_WITH_VALUES:
+                i += 2
+            elif arg in FLAGS or "=" in arg:
+                i += 1
+            else:
+                # can't tell whether the next argument is its value
+                return argv
+            continue
+        if arg in tools and not os.path.exists(arg):
+            tool = tools[arg]
+            # --name goes first, anything after the tool may be workflow inputs
+            resolved = argv[:i] + [tool["file"]] + argv[i + 1 :]
+            return resolved[:1] + ["--name", tool["name"]] + resolved[1:]
+        return argv
+    return argv
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--build-index"]:
+        path = argv[1] if len(argv) > 1 else INDEX_PATH
+        print(f"Indexed {build_index(path)} tools into {path}")
+        return 0
+
+    index = load_index()
+    if index:
+        if argv in (["-v"], ["--version"]) and index["versions"]:
+            print_versions(index["versions"])
+            return 0
+        argv = resolve_tool(argv, index["tools"])
+
+    from janis_assistant.cli import process_args
+
+    sys.argv = ["janis"] + argv
+    return process_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+    Benchmark thousands of scattered hello.py calls: a fresh container per
+    call (docker run, if docker is available), a fresh Python per call (the
+    floor for any per-call start, even without a container), and the warm
+    worker: a submit.py per call to one long-lived worker.py, and the same
+    jobs from one persistent client (the worker's own per-job cost).
+
+    Usage: python3 bench_worker.py [-n 2000] [--parallel 4] [--image yourname/hello]
+                                   [--docker-sample 20]
+
+    docker run is slow, so it's timed on --docker-sample calls and
+    extrapolated to -n.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HELLO = os.path.join(HERE, "hello.py")
+WORKER = os.path.join(HERE, "worker.py")
+SUBMIT = os.path.join(HERE, "submit.py")
+
+
+def time_calls(command, n, parallel):
+    def call(_):
+        subprocess.run(command, check=True, stderr=subprocess.DEVNULL)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        list(pool.map(call, range(n)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=2000, help="Calls, like a scatter's width")
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--image", default="michaelfranklin/py:latest")
+    parser.add_argument("--docker-sample", type=int, default=20)
+    args = parser.parse_args()
+
+    results = []
+    if shutil.which("docker"):
+        sample = time_calls(
+            ["docker", "run", "--rm", args.image, "hello.py"], args.docker_sample, args.parallel
+        )
+        results.append(("docker run", sample / args.docker_sample * args.n))
+
+    results.append(("fresh python", time_calls([sys.executable, HELLO], args.n, args.parallel)))
+
+    workdir = tempfile.mkdtemp(prefix="bench-worker-")
+    socket_path = os.path.join(workdir, "worker.sock")
+    worker = subprocess.Popen(
+        [sys.executable, WORKER, "--socket", socket_path, HELLO],
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+        command = [sys.executable, "-S", SUBMIT, "--socket", socket_path, HELLO]
+        results.append(("warm worker", time_calls(command, args.n, args.parallel)))
+
+        sys.path.insert(0, HERE)
+        from submit import submit
+
+        # the jobs take over this process' stdio, so hide their stderr
+        saved = os.dup(2)
+        with open(os.devnull, "w") as devnull:
+            os.dup2(devnull.fileno(), 2)
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.parallel) as pool:
+                list(pool.map(lambda _: submit([HELLO], socket_path), range(args.n)))
+            results.append(("warm, 1 client", time.perf_counter() - start))
+        finally:
+            os.dup2(saved, 2)
+            os.close(saved)
+    finally:
+        worker.terminate()
+        worker.wait()
+        shutil.rmtree(workdir)
+
+    print(f"{args.n} calls, {args.parallel} at a time")
+    print(f"{'mode':<14}{'total (s)':>10}{'ms/call':>10}")
+    for mode, seconds in results:
+        print(f"{mode:<14}{seconds:>10.1f}{seconds / args.n * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
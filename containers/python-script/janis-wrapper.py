@@ -29,4 +29,29 @@ class ToolName(j.CommandTool):
         return []
 
     def outputs(self) -> List[j.ToolOutput]:
-        return [j.ToolOutput("out", j.Stderr)]
\ No newline at end of file
+        return [j.ToolOutput("out", j.Stderr)]
+
+
+class ToolNameWarm(ToolName):
+    """
+    The same tool, run on a warm worker (see worker.py) instead of a fresh
+    container per call. Start the worker once, sharing its socket directory:
+
+        docker run -d -v /tmp/janis-worker:/tmp/janis-worker michaelfranklin/py:latest \\
+            worker.py hello.py
+
+    then run the workflow without containers, with submit.py on the PATH and
+    the job directories in the shared one, as the worker runs jobs at the
+    same paths (mount the inputs' directory at the same path too):
+
+        cwltool --no-container --tmp-outdir-prefix /tmp/janis-worker/ \\
+            --tmpdir-prefix /tmp/janis-worker/ helloscriptwarm.cwl inputs.yml
+    """
+
+    @staticmethod
+    def tool() -> str:
+        return "helloscriptwarm"
+
+    @staticmethod
+    def base_command() -> Optional[Union[str, List[str]]]:
+        return ["submit.py", "hello.py"]
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+    Runs a script on a warm worker (see worker.py) with this process' working
+    directory and stdio, and exits with the script's exit code.
+
+    Usage: submit.py [--socket /tmp/janis-worker/worker.sock] hello.py [args ...]
+
+    This is on the hot path of every job, so it only imports what it has to:
+    _socket rather than socket (which pulls in enum, selectors and more),
+    and python3 -S submit.py starts quicker still.
+"""
+
+import _socket
+import os
+import struct
+import sys
+
+
+def submit(argv, path):
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        job = "\0".join([os.getcwd()] + argv).encode()
+        fds = struct.pack("3i", 0, 1, 2)
+        sock.sendmsg([job], [(_socket.SOL_SOCKET, _socket.SCM_RIGHTS, fds)])
+        response = b""
+        while not response.endswith(b"\n"):
+            chunk = sock.recv(64)
+            if not chunk:
+                raise Exception("The worker closed the connection without an exit code")
+            response += chunk
+    finally:
+        sock.close()
+    return int(response)
+
+
+def main():
+    args = sys.argv[1:]
+    path = os.environ.get("JANIS_WORKER_SOCKET", "/tmp/janis-worker/worker.sock")
+    if args[:1] == ["--socket"]:
+        path, args = args[1], args[2:]
+    if not args:
+        raise SystemExit(__doc__)
+    sys.exit(submit(args, path))
+
+
+if __name__ == "__main__":
+    main()
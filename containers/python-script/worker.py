@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+    Warm worker for script-style CommandTools (eg: hello.py): one long-lived
+    container runs `worker.py`, and each job is a small `submit.py` over a
+    unix socket instead of a fresh container and Python.
+
+    The worker compiles its scripts once at startup, then forks per job
+    (from the already warm interpreter) and runs the script in-process with
+    the job's argv and working directory. The client passes its own
+    stdin/stdout/stderr over the socket, so the script writes straight to
+    them, and the client exits with the script's exit code.
+
+    Usage: worker.py [--socket /tmp/janis-worker/worker.sock] [--preload MODULE] [hello.py ...]
+
+    eg, with the socket directory shared from the worker's container:
+        docker run -d -v /tmp/janis-worker:/tmp/janis-worker yourname/hello worker.py hello.py
+        submit.py hello.py
+
+    Jobs run in the client's working directory, and their arguments are the
+    client's paths, so both must exist at the same path in the worker. With
+    cwltool --no-container, keep its job directories in the shared one
+    (--tmp-outdir-prefix /tmp/janis-worker/ --tmpdir-prefix /tmp/janis-worker/)
+    and mount the inputs' directory at the same path too (eg: -v "$PWD:$PWD").
+
+    A job is the client's working directory and argv, NUL separated, with
+    its stdio file descriptors attached (SCM_RIGHTS). The reply is the exit
+    code and a newline.
+"""
+
+import argparse
+import array
+import importlib
+import os
+import shutil
+import socket
+import socketserver
+import sys
+
+DEFAULT_SOCKET = os.environ.get("JANIS_WORKER_SOCKET", "/tmp/janis-worker/worker.sock")
+
+
+def recv_fds(sock, size, max_fds):
+    fds = array.array("i")
+    data, ancdata, _, _ = sock.recvmsg(size, socket.CMSG_LEN(max_fds * fds.itemsize))
+    for level, kind, payload in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(payload[: len(payload) - (len(payload) % fds.itemsize)])
+    return data, list(fds)
+
+
+def resolve_script(script):
+    path = script if os.sep in script else shutil.which(script)
+    if not path:
+        raise FileNotFoundError(f"Couldn't find {script} on the PATH")
+    return os.path.abspath(path)
+
+
+class Worker(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def __init__(self, path, scripts=(), preload=()):
+        for module in preload:
+            importlib.import_module(module)
+        # compiled once here, every forked job shares the code objects
+        self.code = {}
+        for script in scripts:
+            self.compile(script)
+        if os.path.exists(path):
+            os.remove(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        super().__init__(path, JobHandler)
+
+    def compile(self, script):
+        path = resolve_script(script)
+        if path not in self.code:
+            with open(path) as f:
+                self.code[path] = compile(f.read(), path, "exec")
+        return path, self.code[path]
+
+
+class JobHandler(socketserver.BaseRequestHandler):
+    """
+    Runs in the forked child: takes over the client's stdio and runs the job
+    """
+
+    def handle(self):
+        data, fds = recv_fds(self.request, 1 << 16, 3)
+        cwd, *argv = data.decode().split("\0")
+        code = 0
+        # first, so even a failure below is reported on the client's stderr
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        try:
+            if not os.path.isdir(cwd):
+                raise SystemExit(
+                    f"The job's directory {cwd} doesn't exist in the worker, it has "
+                    "to be mounted at the same path (see worker.py)"
+                )
+            os.chdir(cwd)
+            path, compiled = self.server.compile(argv[0])
+            sys.argv = [path] + argv[1:]
+            exec(compiled, {"__name__": "__main__", "__file__": path})
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if not isinstance(e.code, (int, type(None))):
+                print(e.code, file=sys.stderr)
+        except BaseException:
+            import traceback
+
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        self.request.sendall(f"{code}\n".encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm worker for script CommandTools")
+    parser.add_argument("scripts", nargs="*", help="Scripts to compile up front")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument(
+        "--preload", action="append", default=[], help="Modules the scripts import"
+    )
+    args = parser.parse_args()
+
+    with Worker(args.socket, args.scripts, args.preload) as worker:
+        print(f"Worker listening on {args.socket}", file=sys.stderr)
+        worker.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+#!/bin/bash
+
+# Per-instance bootstrap for images built with create-ami.sh, Docker, Janis,
+# its config and the workshop data are already in the image.
+
+# Allow password login
+sudo sed -i "/^[^#]*PasswordAuthentication[[:space:]]no/c\PasswordAuthentication yes" /etc/ssh/sshd_config
+sudo service sshd restart
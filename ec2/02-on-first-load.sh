@@ -9,7 +9,8 @@ sudo service docker start
 mkdir -p ~/janis-portable-pipeline && cd ~/janis-portable-pipeline
 
 mkdir -p ~/.janis/
-cat <<EOT >> ~/.janis/janis.conf
+# overwrite, so a re-run doesn't append a second copy
+cat <<EOT > ~/.janis/janis.conf
 engine: cwltool
 notifications:
   email: null
@@ -19,8 +20,19 @@ EOT
 
 # Download data
 
-wget -q -O- "https://github.com/PMCC-BioinformaticsCore/janis-workshops/raw/master/bcc2020/resources/bcc-data.tar" \
-    | tar -xz
+# fetchdata.py needs an uncompressed tar, the manifest is generated from it with
+# `python3 fetchdata.py manifest janis-data.tar`
+DATA_URL="https://github.com/PMCC-BioinformaticsCore/janis-workshops/raw/master/janis-data.tar"
+MANIFEST_URL="https://github.com/PMCC-BioinformaticsCore/janis-workshops/raw/master/janis-data.tar.manifest.json"
+FETCHDATA_URL="https://github.com/PMCC-BioinformaticsCore/janis-workshops/raw/master/ec2/fetchdata.py"
+
+# Only fetch members that are missing or changed, else fetch every member in
+# parallel, else fall back to a single stream (eg: if the server doesn't
+# support range requests)
+wget -q -O /tmp/fetchdata.py "$FETCHDATA_URL" \
+    && { python3 /tmp/fetchdata.py sync "$DATA_URL" . --manifest "$MANIFEST_URL" \
+        || python3 /tmp/fetchdata.py fetch "$DATA_URL" . ; } \
+    || wget -q -O- "$DATA_URL" | tar -x
 
 # Allow password login
 sudo sed -i "/^[^#]*PasswordAuthentication[[:space:]]no/c\PasswordAuthentication yes" /etc/ssh/sshd_config
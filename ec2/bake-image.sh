@@ -0,0 +1,67 @@
+#!/bin/bash
+# Bake everything a participant needs into the image: the 01-install.sh
+# packages, the janis.conf from 02-on-first-load.sh and the extracted workshop
+# data. Instances started from the image only need 02-on-first-load-baked.sh.
+#
+# As EC2 user-data (root, on the builder instance):
+#     handled by create-ami.sh
+# Dry run, lays out the same files under a local directory without installing:
+#     ROOT=/tmp/janis-image DATA=../janis-data.tar bash bake-image.sh
+
+set -e
+
+ROOT=${ROOT:-}
+DATA=${DATA:-}
+DATA_URL="https://github.com/PMCC-BioinformaticsCore/janis-workshops/raw/master/janis-data.tar"
+FETCHDATA_URL="https://github.com/PMCC-BioinformaticsCore/janis-workshops/raw/master/ec2/fetchdata.py"
+HOME_DIR=$ROOT/home/ec2-user
+
+# In a dry run, system changes are only recorded in $ROOT/bake-commands.txt
+run() {
+    if [ -n "$ROOT" ]; then
+        echo "$@" >> $ROOT/bake-commands.txt
+    else
+        "$@"
+    fi
+}
+
+if [ -n "$ROOT" ]; then
+    mkdir -p $ROOT
+    : > $ROOT/bake-commands.txt
+fi
+
+# 01-install.sh
+run yum update -y
+run yum install -y yum-utils
+run amazon-linux-extras install -y docker
+run systemctl enable docker
+run usermod -a -G docker ec2-user
+run yum install -y python3 gcc python3-devel
+run sudo -u ec2-user pip3 install --user janis-pipelines
+
+# 02-on-first-load.sh: janis config
+mkdir -p $HOME_DIR/.janis/
+cat <<EOT > $HOME_DIR/.janis/janis.conf
+engine: cwltool
+notifications:
+  email: null
+template:
+  id: local
+EOT
+
+# 02-on-first-load.sh: workshop data, extracted once here instead of per instance
+mkdir -p $HOME_DIR/janis-portable-pipeline
+if [ -n "$DATA" ]; then
+    tar -xf $DATA -C $HOME_DIR/janis-portable-pipeline
+else
+    # parallel member fetch, falling back to a single stream
+    FETCHDATA=$(dirname $0)/fetchdata.py
+    [ -f $FETCHDATA ] || { FETCHDATA=/tmp/fetchdata.py; wget -q -O $FETCHDATA "$FETCHDATA_URL"; }
+    python3 $FETCHDATA fetch "$DATA_URL" $HOME_DIR/janis-portable-pipeline \
+        || wget -q -O- "$DATA_URL" | tar -x -C $HOME_DIR/janis-portable-pipeline
+fi
+
+run chown -R ec2-user:ec2-user $HOME_DIR/.janis $HOME_DIR/janis-portable-pipeline
+
+# Clean package caches so they don't bloat the image
+run yum clean all
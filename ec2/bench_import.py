@@ -0,0 +1,59 @@
+"""
+    Benchmark the cost of importing pwgen, in the style of `python -X importtime`.
+    Each sample is a fresh interpreter, compared against a bare `python -c pass`.
+
+    Usage: python3 bench_import.py [--repeat 10] [--generate]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+__dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def run(code):
+    start = time.perf_counter()
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=__dir,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+
+    # importtime lines look like: "import time: self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(cum)
+    return wall, cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--generate", action="store_true", help="Also time the first gen_password()"
+    )
+    args = parser.parse_args()
+
+    cases = [("bare interpreter", "pass"), ("import pwgen", "import pwgen")]
+    if args.generate:
+        cases.append(("import + gen_password", "import pwgen; pwgen.gen_password()"))
+
+    print(f"{'case':<24}{'wall ms':>10}{'pwgen us':>10}")
+    for label, code in cases:
+        samples = [run(code) for _ in range(args.repeat)]
+        wall = min(w for w, _ in samples) * 1e3
+        pwgen_us = min(c.get("pwgen", 0) for _, c in samples)
+        print(f"{label:<24}{wall:>10.1f}{pwgen_us:>10}")
+
+
+if __name__ == "__main__":
+    main()
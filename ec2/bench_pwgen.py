@@ -0,0 +1,38 @@
+"""
+    Benchmark pwgen: time per password as the number of words per password
+    (driven by min_length) and the number of passwords per batch grow.
+
+    Usage: python3 bench_pwgen.py [--repeat 5]
+"""
+
+import argparse
+from timeit import repeat
+
+import pwgen
+
+
+def bench(stmt, repeats, number):
+    # best-of-N, reported per call in microseconds
+    return min(repeat(stmt, repeat=repeats, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("words/password  min_length  us/word")
+    for min_length in (12, 50, 200, 1000, 5000):
+        n_words = pwgen.gen_password(min_length).count("-") + 1
+        t = bench(lambda: pwgen.gen_password(min_length), args.repeat, 200)
+        print(f"{n_words:>14}  {min_length:>10}  {t / n_words:>7.2f}")
+
+    print()
+    print("batch size  us/password")
+    for n in (1, 10, 100, 1000, 10000):
+        t = bench(lambda: pwgen.gen_passwords(n), args.repeat, 1)
+        print(f"{n:>10}  {t / n:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+    Benchmark SSH handshakes per participant: the original scp + ssh + ssh
+    bootstrap against the single multiplexed round trip in provision.py.
+
+    Start a local sshd container to stand in for the participant instances:
+
+        ssh-keygen -t ed25519 -N "" -f /tmp/bench-key
+        docker run -d --name bench-sshd -p 2222:2222 -e USER_NAME=ec2-user \\
+            -e PUBLIC_KEY="$(cat /tmp/bench-key.pub)" linuxserver/openssh-server
+
+    Usage: python3 bench_ssh.py --keypath /tmp/bench-key [--port 2222] [-n 20]
+
+    The remote commands mirror the real ones, except `sudo passwd` is swapped
+    for `cat > /dev/null` as the container has no ec2-user password to set.
+    Each handshake is counted from ssh's "Authenticated to" verbose log line.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from provision import BOOTSTRAP_SCRIPT, bootstrap_command, ssh_command
+
+PASSWD = "sudo passwd ec2-user --stdin"
+PASSWD_STANDIN = "cat > /dev/null"
+
+
+def run(command, stdin=None):
+    p = subprocess.run(
+        command,
+        input=stdin,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return p.stderr.count("Authenticated to")
+
+
+def original(args, script, password):
+    """
+    create-instance.sh before multiplexing: copy, run, then reset the password
+    """
+    base = ["-v", "-i", args.keypath, "-oStrictHostKeyChecking=no"]
+    target = f"{args.user}@{args.host}"
+    handshakes = run(["scp", "-P", str(args.port)] + base + [script, f"{target}:~/"])
+    handshakes += run(
+        ["ssh", "-p", str(args.port)] + base + [target, f"bash ~/{os.path.basename(script)}"]
+    )
+    handshakes += run(
+        ["ssh", "-p", str(args.port)] + base + [target, PASSWD_STANDIN],
+        stdin=password + "\n",
+    )
+    return handshakes
+
+
+def multiplexed(args, script, password, control_dir):
+    command, stdin = bootstrap_command(script, password)
+    ssh = ssh_command(args.keypath, args.user, args.host, control_dir, port=args.port)
+    return run(["ssh", "-v"] + ssh[1:] + [command.replace(PASSWD, PASSWD_STANDIN)], stdin)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count SSH handshakes per participant")
+    parser.add_argument("--keypath", required=True)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=2222)
+    parser.add_argument("--user", default="ec2-user")
+    parser.add_argument("-n", type=int, default=20, help="Participants to simulate")
+    args = parser.parse_args()
+
+    # stand-in bootstrap, the real one needs sudo / yum / the internet
+    workdir = tempfile.mkdtemp(prefix="bench-ssh-")
+    script = os.path.join(workdir, os.path.basename(BOOTSTRAP_SCRIPT))
+    with open(script, "w") as f:
+        f.write("mkdir -p ~/.janis && echo 'engine: cwltool' > ~/.janis/janis.conf\n")
+
+    try:
+        print(f"{'mode':<12}{'handshakes/participant':>24}{'ms/participant':>16}")
+        for mode in ("original", "multiplexed"):
+            handshakes, start = 0, time.perf_counter()
+            for i in range(args.n):
+                password = f"bench-password-{i}"
+                if mode == "original":
+                    handshakes += original(args, script, password)
+                    continue
+
+                # a fresh control dir per participant, as each is a new host
+                control_dir = tempfile.mkdtemp(dir=workdir)
+                handshakes += multiplexed(args, script, password, control_dir)
+                ssh = ssh_command(args.keypath, args.user, args.host, control_dir, args.port)
+                subprocess.run(ssh[:-1] + ["-O", "exit", ssh[-1]], stderr=subprocess.DEVNULL)
+            elapsed = (time.perf_counter() - start) / args.n * 1e3
+            print(f"{mode:<12}{handshakes / args.n:>24.1f}{elapsed:>16.1f}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+    Check fetchdata.py against a local stand-in for the data host: an HTTP
+    server with range requests serving the tar (and its manifest, as the
+    bootstrap fetches them) from its directory.
+
+    Usage: python3 check_fetchdata.py [../janis-data.tar]
+
+    Exits non-zero if any check fails.
+"""
+
+import argparse
+import http.server
+import os
+import re
+import shutil
+import socket
+import struct
+import sys
+import tarfile
+import tempfile
+import threading
+
+from fetchdata import build_manifest, fetch, load_manifest, read_index, sync
+
+__dir = os.path.dirname(os.path.abspath(__file__))
+
+
+class RangeHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Serves the files of the current directory, answering Range requests
+    with 206 (like GitHub's raw host) unless ranges is False, and 416 to an
+    empty one. With drop, resets the connection halfway through each range.
+    """
+
+    ranges = True
+    drop = False
+    requests = 0
+
+    def do_GET(self):
+        RangeHandler.requests += 1
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if not match or not self.ranges:
+            try:
+                return super().do_GET()
+            except (BrokenPipeError, ConnectionResetError):
+                # fetchdata hangs up once it sees a 200 instead of a 206
+                return
+        start, end = map(int, match.groups())
+        if end < start:
+            self.send_response(416)
+            self.end_headers()
+            return
+        with open(self.translate_path(self.path), "rb") as f:
+            f.seek(start)
+            data = f.read(end - start + 1)
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if not self.drop:
+            self.wfile.write(data)
+            return
+        self.wfile.write(data[: len(data) // 2])
+        self.wfile.flush()
+        # a reset rather than a clean close, so the client's read fails
+        self.connection.setsockopt(
+            socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+        )
+        self.connection.close()
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(directory):
+    """
+    Starts the stand-in in a thread, returns (server, base url)
+    """
+
+    class Handler(RangeHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=directory, **kwargs)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def check(name, condition):
+    print(f"{'ok' if condition else 'FAILED':<8}{name}", flush=True)
+    return condition
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("tar", nargs="?", default=os.path.join(__dir, "..", "janis-data.tar"))
+    args = parser.parse_args()
+
+    server, base = serve(os.path.dirname(os.path.abspath(args.tar)))
+    url = f"{base}/{os.path.basename(args.tar)}"
+    workdir = tempfile.mkdtemp(prefix="check-fetchdata-")
+    results = []
+    try:
+        # what tar -xf gives, to compare against
+        expected = os.path.join(workdir, "expected")
+        with tarfile.open(args.tar) as tar:
+            tar.extractall(expected)
+            files = [m for m in tar.getmembers() if m.isfile()]
+
+        fetched = os.path.join(workdir, "fetched")
+        checksums = fetch(url, fetched)
+        same = all(
+            open(os.path.join(fetched, m.name), "rb").read()
+            == open(os.path.join(expected, m.name), "rb").read()
+            and os.stat(os.path.join(fetched, m.name)).st_mode & 0o777 == m.mode
+            for m in files
+        )
+        results.append(check(f"fetch extracts the {len(files)} files as tar does", same))
+        results.append(check("fetch returns every file's sha256", len(checksums) == len(files)))
+
+        member = max(files, key=lambda m: m.size)
+        bad = os.path.join(workdir, "bad")
+        try:
+            fetch(url, bad, checksums={member.name: "0" * 64}, members=read_index(url))
+            rejected = False
+        except Exception:
+            rejected = True
+        results.append(
+            check(
+                "a checksum mismatch fails and leaves no file",
+                rejected and not os.path.exists(os.path.join(bad, member.name)),
+            )
+        )
+
+        manifest = load_manifest(url + ".manifest.json")
+        results.append(
+            check(
+                "the committed manifest matches the tar",
+                manifest == build_manifest(args.tar),
+            )
+        )
+        synced = os.path.join(workdir, "synced")
+        transferred = sync(url, synced, manifest)
+        results.append(
+            check(
+                "sync into an empty directory transfers every file",
+                len(transferred) == len(files),
+            )
+        )
+        with open(os.path.join(synced, member.name), "ab") as f:
+            f.write(b"changed")
+        os.remove(os.path.join(synced, files[0].name))
+        RangeHandler.requests = 0
+        transferred = sync(url, synced, manifest)
+        results.append(
+            check(
+                "sync transfers only the changed and missing files",
+                sorted(transferred) == sorted({member.name, files[0].name})
+                and RangeHandler.requests == len(transferred),
+            )
+        )
+
+        # the index read whole, so the drops hit the members
+        members = read_index(url)
+        RangeHandler.drop = True
+        dropped = os.path.join(workdir, "dropped")
+        try:
+            fetch(url, dropped, members=members)
+            failed = False
+        except Exception:
+            failed = True
+        RangeHandler.drop = False
+        leftovers = [
+            name for _, _, names in os.walk(dropped) for name in names if name.endswith(".part")
+        ]
+        results.append(
+            check("a dropped connection fails and leaves no .part file", failed and not leftovers)
+        )
+
+        # a tar with an empty file, which has no bytes to ask for
+        empty = os.path.join(workdir, "empty.tar")
+        with tarfile.open(empty, "w") as tar:
+            tar.addfile(tarfile.TarInfo("empty.txt"))
+        empty_server, empty_base = serve(workdir)
+        try:
+            fetched_empty = os.path.join(workdir, "fetched-empty")
+            fetch(f"{empty_base}/empty.tar", fetched_empty)
+            results.append(
+                check(
+                    "an empty file is fetched without a request",
+                    os.path.getsize(os.path.join(fetched_empty, "empty.txt")) == 0,
+                )
+            )
+        except Exception as e:
+            results.append(check(f"an empty file is fetched without a request ({e})", False))
+        finally:
+            empty_server.shutdown()
+
+        RangeHandler.ranges = False
+        try:
+            fetch(url, os.path.join(workdir, "noranges"))
+            refused = False
+        except Exception as e:
+            refused = "range requests" in str(e)
+        RangeHandler.ranges = True
+        results.append(check("a server without range requests is refused", refused))
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir)
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+keyname=$1
+name=${2:-janis-workshop-$(date +%Y%m%d)}
+
+__dir=$(dirname $0)
+
+# Base Amazon Linux 2 image, bake-image.sh installs everything on top
+BASE_AMI="ami-0a58e22c727337c51"
+
+# Dry run: build the image layout locally, eg: bash create-ami.sh --dry-run /tmp/janis-image
+if [ "$keyname" == "--dry-run" ]; then
+    ROOT=$name DATA=$__dir/../janis-data.tar bash $__dir/bake-image.sh
+    echo "Image layout written to $name (system commands in $name/bake-commands.txt)"
+    exit
+fi
+
+# bake-image.sh runs as user-data, then powers off so the image is taken from a
+# clean disk. It powers off when the bake fails too (rather than leave us waiting
+# out BAKE_TIMEOUT), and reports which on the console.
+userdata=$(
+    echo '#!/bin/bash'
+    echo "cat > /root/bake-image.sh <<'BAKE'"
+    cat $__dir/bake-image.sh
+    echo 'BAKE'
+    echo 'bash /root/bake-image.sh > /var/log/janis-bake.log 2>&1 && result=ok || result=failed'
+    echo 'echo "janis-bake: $result" > /dev/console'
+    echo 'shutdown -h now'
+)
+instanceID=$(aws ec2 run-instances \
+    --image-id $BASE_AMI \
+    --count 1 --instance-type t2.large \
+    --key-name $keyname \
+    --query 'Instances[0].InstanceId' --output text \
+    --tag-specification "ResourceType=instance,Tags=[{Key=Name,Value=$name-builder},{Key=Project,Value=Janis-workshop-bcc2020}]" \
+    --user-data "$userdata" \
+    --instance-initiated-shutdown-behavior stop \
+    --block-device-mappings '[{"DeviceName":"/dev/xvda","Ebs":{"VolumeSize":30,"DeleteOnTermination":true}}]' \
+    --security-group-ids sg-0c3bb8034f313fac1 \
+)
+if [ -z "$instanceID" ]; then
+    exit 1
+fi
+# however this script exits, the builder doesn't outlive it
+trap 'aws ec2 terminate-instances --instance-ids $instanceID > /dev/null' EXIT
+
+# aws ec2 wait gives up after 10 minutes, less than a bake (yum update, docker,
+# pip builds, the data) or copying a 30GB volume can take, so poll until a deadline
+BAKE_TIMEOUT=${BAKE_TIMEOUT:-5400}
+deadline=$((SECONDS + BAKE_TIMEOUT))
+
+# wait_for_state <target state> <failed state> <aws command that prints the state>
+wait_for_state() {
+    target=$1
+    failed=$2
+    shift 2
+    while true; do
+        state=$("$@")
+        if [ "$state" == "$target" ]; then
+            return
+        fi
+        if [ "$state" == "$failed" ] || [ $SECONDS -ge $deadline ]; then
+            echo "Gave up waiting for $target, the state is $state" >&2
+            exit 1
+        fi
+        sleep 30
+    done
+}
+
+echo "Baking image on $instanceID"
+wait_for_state stopped terminated aws ec2 describe-instances --instance-ids $instanceID \
+    --query 'Reservations[0].Instances[0].State.Name' --output text
+
+# the console output shows up a few minutes after the instance stops
+for attempt in $(seq 20); do
+    console=$(aws ec2 get-console-output --instance-id $instanceID --query Output --output text)
+    result=$(echo "$console" | grep -o 'janis-bake: [a-z]*' | tail -1)
+    if [ -n "$result" ]; then
+        break
+    fi
+    sleep 30
+done
+if [ "$result" != "janis-bake: ok" ]; then
+    echo "The bake failed (${result:-no result on the console}), see /var/log/janis-bake.log on $instanceID" >&2
+    exit 1
+fi
+
+imageID=$(aws ec2 create-image --instance-id $instanceID --name $name --query 'ImageId' --output text)
+wait_for_state available failed aws ec2 describe-images --image-ids $imageID \
+    --query 'Images[0].State' --output text
+
+echo "Image is ready: $imageID"
+echo "Provision from it with: python3 provision.py participants.txt --ami $imageID --baked ..."
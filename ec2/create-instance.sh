@@ -1,10 +1,14 @@
 keyname=$1
 keypath=$2
 participant=$3
+# optional, pre-generated with: python3 pwgen.py --count N
+password=$4
 
 __dir=$(dirname $0)
 
-password=$(python3 $__dir/pwgen.py)
+if [ -z "$password" ]; then
+    password=$(python3 $__dir/pwgen.py)
+fi
 
 AMI="ami-08167094da531571a"
 
@@ -39,12 +43,15 @@ echo "Instance has started: $instanceID"
 url=$(aws ec2 describe-instances --instance-ids "$instanceID" | jq --raw-output '.Reservations[0].Instances[0].PublicDnsName')
 ipaddress=$(aws ec2 describe-instances --instance-ids "$instanceID" | jq --raw-output '.Reservations[0].Instances[0].PublicIpAddress')
 
-alias sshtoinstance="ssh -i $keypath -oStrictHostKeyChecking=no ec2-user@$url"
+# One multiplexed connection per instance, any later ssh reuses its handshake
+ssh_opts="-i $keypath -oStrictHostKeyChecking=no -oControlMaster=auto -oControlPath=/tmp/janis-ssh-%r@%h:%p -oControlPersist=120"
+alias sshtoinstance="ssh $ssh_opts ec2-user@$ipaddress"
 
-# SCP requires IP address because I didn't enable some DNS thing
-scp -i $keypath -oStrictHostKeyChecking=no $__dir/02-on-first-load.sh ec2-user@$ipaddress:~/
-ssh -i $keypath -oStrictHostKeyChecking=no ec2-user@$url 'bash ~/02-on-first-load.sh'
-ssh -i $keypath -oStrictHostKeyChecking=no ec2-user@$url "echo $password | sudo passwd ec2-user --stdin"
+# Bootstrap and set the password in a single round trip: the script travels in
+# the remote command (reading /dev/null), the password on stdin.
+# Connect by IP address, as the scp step used to, DNS hostnames are not enabled
+echo "$password" | ssh $ssh_opts ec2-user@$ipaddress \
+    "bash -c $(printf %q "$(cat $__dir/02-on-first-load.sh)") < /dev/null && sudo passwd ec2-user --stdin"
 
 echo "$participant,ec2-user,$instanceID,$url,$password" >> credentials.txt
 
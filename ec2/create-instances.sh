@@ -0,0 +1,15 @@
+keyname=$1
+keypath=$2
+participants=$3   # file with one participant per line
+
+__dir=$(dirname $0)
+
+# Pack the wordlist once so every pwgen.py start skips parsing wordlist.py
+[ -f $__dir/pwgen.words ] || python3 $__dir/pwgen.py --build
+
+# Generate every password from a single interpreter, then hand one to each participant
+count=$(grep -c . $participants)
+paste -d' ' <(grep . $participants) <(python3 $__dir/pwgen.py --count $count) \
+    | while read participant password; do
+        bash $__dir/create-instance.sh $keyname $keypath $participant $password
+    done
@@ -0,0 +1,349 @@
+"""
+    Fetch and extract an uncompressed workshop data tar (eg: janis-data.tar)
+    member by member, in parallel.
+
+    Only the tar headers are read to build the member index, then every
+    member is fetched concurrently with HTTP range requests (or parallel
+    reads of a local file). Each member's size is checked and its SHA-256
+    computed as it streams, and verified when a checksum file is supplied.
+
+    A manifest (per-file SHA-256, size, role and offset in the tar) lets
+    `sync` transfer only the members that are missing or changed locally,
+    without even reading the tar headers.
+
+    Usage: python3 fetchdata.py fetch <url or path to tar> <destination> [--workers 8]
+                                [--checksums SHA256SUMS] [--write-checksums SHA256SUMS]
+           python3 fetchdata.py manifest <url or path to tar> [manifest.json]
+           python3 fetchdata.py sync <url or path to tar> <destination> [--manifest M]
+
+    Checksum files use the `sha256sum` format: "<sha256>  <member name>".
+    The manifest defaults to <tar>.manifest.json, next to the tar.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import tarfile
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def is_url(source):
+    return source.startswith(("http://", "https://"))
+
+
+def read_range(source, offset, size):
+    """
+    Yields the bytes [offset, offset + size) of source in chunks
+    """
+    if size == 0:
+        # there's no range header for no bytes, and nothing to read
+        return
+    if is_url(source):
+        request = urllib.request.Request(
+            source, headers={"Range": f"bytes={offset}-{offset + size - 1}"}
+        )
+        with urllib.request.urlopen(request) as response:
+            if response.status != 206:
+                raise Exception(f"{source} doesn't support HTTP range requests")
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        return
+
+    with open(source, "rb") as f:
+        fd, end = f.fileno(), offset + size
+        while offset < end:
+            chunk = os.pread(fd, min(CHUNK_SIZE, end - offset), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+
+
+class HttpRangeFile(io.RawIOBase):
+    """
+    Seekable read-only file over HTTP range requests, so tarfile can walk the
+    headers and skip the member data without downloading it.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.position = 0
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request) as response:
+            self.length = int(response.headers["Content-Length"])
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.length
+        self.position = offset
+        return self.position
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.length - self.position)
+        if size <= 0:
+            return 0
+        data = b"".join(read_range(self.url, self.position, size))
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+def read_index(source):
+    """
+    Returns the tar's members, reading only their headers
+    """
+    if is_url(source):
+        # small buffer: each header is one range request, member data is skipped
+        fileobj = io.BufferedReader(HttpRangeFile(source), buffer_size=8192)
+    else:
+        fileobj = open(source, "rb")
+    with fileobj, tarfile.open(fileobj=fileobj, mode="r:") as tar:
+        return tar.getmembers()
+
+
+def read_checksums(path):
+    checksums = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                checksum, name = line.rstrip("\n").split(None, 1)
+                checksums[name.lstrip("*")] = checksum
+    return checksums
+
+
+def safe_path(destination, name):
+    path = os.path.normpath(os.path.join(destination, name))
+    if os.path.isabs(name) or not path.startswith(os.path.abspath(destination) + os.sep):
+        raise Exception(f"Refusing to extract {name} outside of {destination}")
+    return path
+
+
+def fetch_member(source, destination, member, expected=None):
+    """
+    Streams one member to disk, returns its SHA-256. The file only appears
+    at its final path once its size (and checksum, if expected) match.
+    """
+    path = safe_path(destination, member.name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    sha256, written, tmp = hashlib.sha256(), 0, path + ".part"
+    try:
+        with open(tmp, "wb") as f:
+            for chunk in read_range(source, member.offset_data, member.size):
+                sha256.update(chunk)
+                written += len(chunk)
+                f.write(chunk)
+
+        checksum = sha256.hexdigest()
+        if written != member.size:
+            raise Exception(f"{member.name}: expected {member.size} bytes, got {written}")
+        if expected and checksum != expected:
+            raise Exception(f"{member.name}: checksum {checksum} doesn't match {expected}")
+
+        os.chmod(tmp, member.mode)
+        os.replace(tmp, path)
+    except BaseException:
+        # a short read, a bad checksum or a dropped connection: no partial file
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return checksum
+
+
+def fetch(source, destination, workers=8, checksums=None, members=None):
+    """
+    Extracts members (default: every file in the tar) of source into
+    destination in parallel, returns {member name: sha256}
+    """
+    destination = os.path.abspath(destination)
+    if members is None:
+        members = read_index(source)
+
+    for member in members:
+        if member.isdir():
+            os.makedirs(safe_path(destination, member.name), exist_ok=True)
+    files = [m for m in members if m.isfile()]
+    checksums = checksums or {}
+
+    # largest first, so the big index files don't start last
+    files.sort(key=lambda m: m.size, reverse=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            lambda m: fetch_member(source, destination, m, checksums.get(m.name)), files
+        )
+        return dict(zip((m.name for m in files), results))
+
+
+# Suffix -> role, matched in order
+ROLES = [
+    (".fastq.gz", "reads"),
+    (".fastq", "reads"),
+    (".bed", "intervals"),
+    (".fasta", "reference"),
+    (".fai", "reference"),
+    (".dict", "reference"),
+    (".amb", "index"),
+    (".ann", "index"),
+    (".bwt", "index"),
+    (".pac", "index"),
+    (".sa", "index"),
+]
+
+
+def role_of(name):
+    if os.path.basename(name).startswith("._"):
+        # macOS resource forks that come along in the tar
+        return "metadata"
+    for suffix, role in ROLES:
+        if name.endswith(suffix):
+            return role
+    return "other"
+
+
+def build_manifest(source, workers=8):
+    files = [m for m in read_index(source) if m.isfile()]
+
+    def describe(member):
+        sha256 = hashlib.sha256()
+        for chunk in read_range(source, member.offset_data, member.size):
+            sha256.update(chunk)
+        return {
+            "name": member.name,
+            "size": member.size,
+            "sha256": sha256.hexdigest(),
+            "role": role_of(member.name),
+            "offset": member.offset_data,
+            "mode": member.mode,
+        }
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return {"files": list(pool.map(describe, files))}
+
+
+def load_manifest(path):
+    if is_url(path):
+        with urllib.request.urlopen(path) as response:
+            return json.load(response)
+    with open(path) as f:
+        return json.load(f)
+
+
+def local_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def is_current(destination, entry):
+    path = safe_path(destination, entry["name"])
+    try:
+        if os.path.getsize(path) != entry["size"]:
+            return False
+    except OSError:
+        return False
+    return local_sha256(path) == entry["sha256"]
+
+
+def sync(source, destination, manifest, workers=8):
+    """
+    Fetches only the manifest entries that are missing or differ in
+    destination, returns the names that were transferred
+    """
+    destination = os.path.abspath(destination)
+    entries = manifest["files"]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        current = list(pool.map(lambda e: is_current(destination, e), entries))
+    stale = [e for e, ok in zip(entries, current) if not ok]
+
+    members = []
+    for entry in stale:
+        # the manifest already knows where each member is, no headers are read
+        member = tarfile.TarInfo(entry["name"])
+        member.size, member.mode = entry["size"], entry["mode"]
+        member.offset_data = entry["offset"]
+        members.append(member)
+
+    fetch(
+        source,
+        destination,
+        workers,
+        checksums={e["name"]: e["sha256"] for e in stale},
+        members=members,
+    )
+    return [e["name"] for e in stale]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel, verified tar extraction")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    fetch_parser = subparsers.add_parser("fetch", help="Extract every member")
+    fetch_parser.add_argument("source", help="URL or local path of an uncompressed tar")
+    fetch_parser.add_argument("destination")
+    fetch_parser.add_argument("--workers", type=int, default=8)
+    fetch_parser.add_argument("--checksums", help="sha256sum file to verify against")
+    fetch_parser.add_argument("--write-checksums", help="Write each member's sha256 here")
+
+    manifest_parser = subparsers.add_parser("manifest", help="Generate a manifest")
+    manifest_parser.add_argument("source")
+    manifest_parser.add_argument("output", nargs="?", help="Default: <source>.manifest.json")
+    manifest_parser.add_argument("--workers", type=int, default=8)
+
+    sync_parser = subparsers.add_parser("sync", help="Fetch missing or changed members")
+    sync_parser.add_argument("source")
+    sync_parser.add_argument("destination")
+    sync_parser.add_argument("--manifest", help="Default: <source>.manifest.json")
+    sync_parser.add_argument("--workers", type=int, default=8)
+
+    args = parser.parse_args()
+
+    if args.command == "manifest":
+        output = args.output or args.source + ".manifest.json"
+        manifest = build_manifest(args.source, args.workers)
+        with open(output, "w") as f:
+            json.dump(manifest, f, indent=2)
+        print(f"Wrote {len(manifest['files'])} entries to {output}")
+
+    elif args.command == "sync":
+        manifest = load_manifest(args.manifest or args.source + ".manifest.json")
+        transferred = sync(args.source, args.destination, manifest, args.workers)
+        size = sum(e["size"] for e in manifest["files"] if e["name"] in transferred)
+        print(
+            f"Transferred {len(transferred)}/{len(manifest['files'])} files "
+            f"({size} bytes) into {args.destination}"
+        )
+
+    else:
+        checksums = read_checksums(args.checksums) if args.checksums else None
+        results = fetch(args.source, args.destination, args.workers, checksums)
+
+        if args.write_checksums:
+            with open(args.write_checksums, "w") as f:
+                f.writelines(f"{c}  {name}\n" for name, c in sorted(results.items()))
+        print(f"Extracted {len(results)} files into {args.destination}")
+
+
+if __name__ == "__main__":
+    main()
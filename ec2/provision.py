@@ -0,0 +1,585 @@
+"""
+    Provision a whole workshop fleet concurrently, the parallel equivalent of
+    running create-instance.sh once per participant.
+
+    Usage: python3 provision.py participants.txt --keyname K --keypath P [--workers 20]
+           python3 provision.py participants.txt --backend fake
+
+    participants.txt has one participant per line. Every participant's
+    launch, status wait, bootstrap upload and password reset overlap with
+    everyone else's, and credentials.txt is written atomically at the end.
+    Progress is kept in provision-state.jsonl, rerunning the same command
+    resumes only the participants (and phases) that didn't finish.
+"""
+
+import argparse
+import json
+import os
+import random
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import pwgen
+
+__dir = os.path.dirname(os.path.abspath(__file__))
+
+AMI = "ami-08167094da531571a"
+INSTANCE_TYPE = "t2.large"
+SECURITY_GROUP = "sg-0c3bb8034f313fac1"
+PROJECT_TAG = "Janis-workshop-bcc2020"
+BOOTSTRAP_SCRIPT = os.path.join(__dir, "02-on-first-load.sh")
+# for images built by create-ami.sh, where only the sshd tweak is left to do
+BAKED_BOOTSTRAP_SCRIPT = os.path.join(__dir, "02-on-first-load-baked.sh")
+# instance ids per describe call
+DESCRIBE_BATCH_SIZE = 100
+
+
+def ssh_command(keypath, user, host, control_dir, port=22):
+    return [
+        "ssh", "-i", keypath, "-p", str(port), "-oStrictHostKeyChecking=no",
+        # later sessions to the same host reuse this connection's handshake
+        "-oControlMaster=auto", f"-oControlPath={control_dir}/%r@%h:%p",
+        "-oControlPersist=120",
+        f"{user}@{host}",
+    ]
+
+
+def bootstrap_command(script=None, password=None):
+    """
+    Returns (remote command, stdin) to run script then reset the password
+    """
+    commands, stdin = [], None
+    if script:
+        with open(script) as f:
+            # the script can't swallow the password, it reads from /dev/null
+            commands.append(f"bash -c {shlex.quote(f.read())} < /dev/null")
+    if password:
+        commands.append("sudo passwd ec2-user --stdin")
+        stdin = password + "\n"
+    return " && ".join(commands), stdin
+
+
+class AwsCliCloud:
+    """
+    Drives the same aws / ssh commands as create-instance.sh
+    """
+
+    def __init__(self, keyname, keypath, ami=AMI):
+        self.keyname = keyname
+        self.keypath = keypath
+        self.ami = ami
+        # ControlMaster sockets, one shared connection per host
+        self.control_dir = tempfile.mkdtemp(prefix="janis-ssh-")
+
+    @staticmethod
+    def _run(command, stdin=None):
+        return subprocess.run(
+            command,
+            input=stdin,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stdout.strip()
+
+    def _ssh(self, host):
+        return ssh_command(self.keypath, "ec2-user", host, self.control_dir)
+
+    def launch(self, participant, client_token):
+        tags = (
+            f"ResourceType=instance,Tags=[{{Key=User,Value={participant}}},"
+            f"{{Key=Project,Value={PROJECT_TAG}}}]"
+        )
+        devices = [
+            {"DeviceName": "/dev/xvda", "Ebs": {"VolumeSize": 30, "DeleteOnTermination": True}}
+        ]
+        return self._run(
+            [
+                "aws", "ec2", "run-instances",
+                "--image-id", self.ami,
+                "--count", "1", "--instance-type", INSTANCE_TYPE,
+                "--key-name", self.keyname,
+                "--query", "Instances[0].InstanceId", "--output", "text",
+                "--tag-specification", tags,
+                "--block-device-mappings", json.dumps(devices),
+                "--security-group-ids", SECURITY_GROUP,
+                # retrying with the same token returns the original instance
+                "--client-token", client_token,
+            ]
+        )
+
+    def poll(self, instance_ids):
+        """
+        Returns {instance_id: (PublicDnsName, PublicIpAddress)} for the
+        instances whose status checks have passed. At most one
+        describe-instance-status and one describe-instances call per batch.
+        """
+        ready = {}
+        for i in range(0, len(instance_ids), DESCRIBE_BATCH_SIZE):
+            batch = instance_ids[i : i + DESCRIBE_BATCH_SIZE]
+            statuses = json.loads(
+                self._run(
+                    ["aws", "ec2", "describe-instance-status", "--instance-ids"] + batch
+                )
+            )
+            ok = [
+                s["InstanceId"]
+                for s in statuses["InstanceStatuses"]
+                if s["InstanceStatus"]["Status"] == "ok"
+                and s["SystemStatus"]["Status"] == "ok"
+            ]
+            if not ok:
+                continue
+
+            # one response gives both the DNS name and IP address of every instance
+            response = json.loads(
+                self._run(["aws", "ec2", "describe-instances", "--instance-ids"] + ok)
+            )
+            for reservation in response["Reservations"]:
+                for instance in reservation["Instances"]:
+                    ready[instance["InstanceId"]] = (
+                        instance["PublicDnsName"],
+                        instance["PublicIpAddress"],
+                    )
+        return ready
+
+    def bootstrap(self, ipaddress, script=None, password=None):
+        """
+        Runs the bootstrap script and/or resets the password in one ssh round
+        trip: the script travels in the remote command and the password on
+        stdin, so nothing is copied over (or shown in a process list) first.
+        """
+        command, stdin = bootstrap_command(script, password)
+        self._run(self._ssh(ipaddress) + [command], stdin=stdin)
+
+
+class FakeCloud:
+    """
+    Local stand-in for AwsCliCloud: instances "boot" after a random delay and
+    every call is recorded, so the driver can be exercised without AWS.
+    """
+
+    def __init__(self, boot_delay=(0.5, 2.0), call_delay=0.01):
+        self.boot_delay = boot_delay
+        self.call_delay = call_delay
+        self.calls = []
+        self.instances = {}
+        self.tokens = {}
+        self._lock = threading.Lock()
+
+    def _record(self, *call):
+        time.sleep(self.call_delay)
+        with self._lock:
+            self.calls.append(call)
+
+    def launch(self, participant, client_token):
+        self._record("launch", participant)
+        with self._lock:
+            if client_token in self.tokens:
+                return self.tokens[client_token]
+            instance_id = f"i-{len(self.instances):017x}"
+            self.instances[instance_id] = {
+                "participant": participant,
+                "ready_at": time.monotonic() + random.uniform(*self.boot_delay),
+            }
+            self.tokens[client_token] = instance_id
+        return instance_id
+
+    def poll(self, instance_ids):
+        self._record("poll", len(instance_ids))
+        now = time.monotonic()
+        ready = {}
+        for instance_id in instance_ids:
+            # instances launched by an earlier process have long since booted
+            instance = self.instances.get(instance_id, {"ready_at": 0})
+            if instance["ready_at"] <= now:
+                n = int(instance_id[2:], 16)
+                ready[instance_id] = (
+                    f"ec2-fake-{n}.compute.amazonaws.com",
+                    f"10.0.{n // 256}.{n % 256}",
+                )
+        return ready
+
+    def bootstrap(self, ipaddress, script=None, password=None):
+        script = script and os.path.basename(script)
+        self._record("bootstrap", ipaddress, script, bool(password))
+
+
+BACKENDS = {"aws": AwsCliCloud, "fake": FakeCloud}
+
+
+class StatusPoller:
+    """
+    Tracks every pending instance and checks all of them with one batched
+    cloud.poll() per round, instead of a wait and two describes per instance.
+    The interval backs off while nothing changes and resets on progress.
+
+    A failed poll counts as a round where nothing is ready, as the aws
+    waiter retries (eg: describe-instance-status returns
+    InvalidInstanceID.NotFound just after run-instances). Only an instance
+    that isn't healthy within timeout fails, on its own.
+    """
+
+    def __init__(self, cloud, min_interval=5, max_interval=30, backoff=1.5, timeout=600):
+        self.cloud = cloud
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        # per instance, like `aws ec2 wait instance-status-ok` (40 x 15s)
+        self.timeout = timeout
+        self.rounds = 0
+
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def watch(self, instance_id):
+        """
+        Returns a future of (url, ipaddress), set once instance_id is healthy
+        """
+        future = Future()
+        with self._cond:
+            self._pending[instance_id] = (future, time.monotonic() + self.timeout)
+            self._cond.notify()
+        return future
+
+    def wait(self, instance_id):
+        """
+        Block until instance_id is healthy, returns (url, ipaddress)
+        """
+        return self.watch(instance_id).result()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        interval = self.min_interval
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    break
+                instance_ids = list(self._pending)
+
+            try:
+                ready = self.cloud.poll(instance_ids)
+            except Exception as e:
+                ready = {}
+                print(f"Status poll failed, retrying: {e}", flush=True)
+            self.rounds += 1
+
+            with self._cond:
+                for instance_id, addresses in ready.items():
+                    future, _ = self._pending.pop(instance_id)
+                    future.set_result(addresses)
+                now = time.monotonic()
+                for instance_id in instance_ids:
+                    if instance_id in self._pending and self._pending[instance_id][1] <= now:
+                        future, _ = self._pending.pop(instance_id)
+                        future.set_exception(
+                            TimeoutError(
+                                f"{instance_id} wasn't healthy after {self.timeout}s"
+                            )
+                        )
+                if ready:
+                    interval = self.min_interval
+                else:
+                    interval = min(interval * self.backoff, self.max_interval)
+                # instances added meanwhile are picked up by the next round
+                self._cond.wait_for(lambda: self._closed, timeout=interval)
+
+
+def write_atomic(path, lines):
+    # readers only ever see the old file or the complete new one
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.writelines(line + "\n" for line in lines)
+    os.replace(tmp, path)
+
+
+class ProvisionState:
+    """
+    Append-only JSONL record of each participant's progress, so a rerun only
+    resumes the phases that haven't completed. Each line is one phase
+    (requested, launched, healthy, bootstrapped, password_set), eg:
+
+        {"participant": "...", "phase": "launched", "instance_id": "..."}
+
+    The "requested" phase keeps the participant's password, so a resume hands
+    out the same one: the file is only readable by its owner, keep it (like
+    credentials.txt) out of shared directories.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.participants = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            os.chmod(path, 0o600)
+            with open(path, "r+b") as f:
+                content = f.read()
+                # a torn final line from a crash, that phase is redone. It's
+                # cut off so the next record starts on a line of its own.
+                complete = content[: content.rfind(b"\n") + 1]
+                if len(complete) < len(content):
+                    f.truncate(len(complete))
+            for line in complete.decode().splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply(record)
+
+    def _apply(self, record):
+        state = self.participants.setdefault(record["participant"], {"phases": []})
+        state["phases"].append(record["phase"])
+        state.update((k, v) for k, v in record.items() if k not in ("participant", "phase"))
+
+    def get(self, participant):
+        return self.participants.get(participant, {"phases": []})
+
+    def done(self, participant, phase):
+        return phase in self.get(participant)["phases"]
+
+    def record(self, participant, phase, **data):
+        record = {"participant": participant, "phase": phase, **data}
+        with self._lock:
+            # it holds the participants' passwords, so only the owner can read it
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            with open(fd, "a") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(record)
+
+
+def launch_participant(cloud, state, participant, password, on_launch=None):
+    """
+    Returns the participant's instance id, launching it if it wasn't yet
+    """
+    if not state.done(participant, "requested"):
+        token = str(uuid.uuid4())
+        state.record(participant, "requested", client_token=token, password=password)
+    # a rerun keeps the password handed out first time round
+    password = state.get(participant)["password"]
+
+    if not state.done(participant, "launched"):
+        instance_id = cloud.launch(participant, state.get(participant)["client_token"])
+        state.record(participant, "launched", instance_id=instance_id)
+        if on_launch:
+            on_launch(instance_id)
+    instance_id = state.get(participant)["instance_id"]
+    print(f"Instance is starting: {instance_id} ({participant})", flush=True)
+    return instance_id
+
+
+def watch_participant(poller, state, participant):
+    """
+    A future of the participant's (url, ipaddress), once its instance is healthy
+    """
+    if state.done(participant, "healthy"):
+        future = Future()
+        s = state.get(participant)
+        future.set_result((s["url"], s["ipaddress"]))
+        return future
+    return poller.watch(state.get(participant)["instance_id"])
+
+
+def finish_participant(
+    cloud, state, participant, addresses, bootstrap_script=BOOTSTRAP_SCRIPT
+):
+    """
+    Bootstraps a healthy instance and sets its password, returns the
+    participant's credentials row
+    """
+    url, ipaddress = addresses
+    if not state.done(participant, "healthy"):
+        state.record(participant, "healthy", url=url, ipaddress=ipaddress)
+    instance_id = state.get(participant)["instance_id"]
+    password = state.get(participant)["password"]
+    print(f"Instance has started: {instance_id} ({participant})", flush=True)
+
+    # whichever of the two are left happen in a single ssh session
+    bootstrapped = state.done(participant, "bootstrapped")
+    cloud.bootstrap(
+        ipaddress, script=None if bootstrapped else bootstrap_script, password=password
+    )
+    if not bootstrapped:
+        state.record(participant, "bootstrapped")
+    state.record(participant, "password_set")
+
+    return f"{participant},ec2-user,{instance_id},{url},{password}"
+
+
+def provision_fleet(
+    cloud,
+    participants,
+    workers=20,
+    credentials="credentials.txt",
+    instance_ids="instanceIds.txt",
+    poll_interval=5,
+    state="provision-state.jsonl",
+    bootstrap_script=BOOTSTRAP_SCRIPT,
+    status_timeout=600,
+):
+    state = ProvisionState(state)
+    remaining = [p for p in participants if not state.done(p, "password_set")]
+    print(
+        f"{len(participants) - len(remaining)} participants already provisioned, "
+        f"{len(remaining)} to go",
+        flush=True,
+    )
+
+    passwords = pwgen.gen_passwords(len(remaining))
+    lock = threading.Lock()
+
+    def record_instance(instance_id):
+        # written as soon as it exists, so a crash never loses track of an instance
+        with lock, open(instance_ids, "a") as f:
+            f.write(instance_id + "\n")
+
+    failures = []
+
+    def failed(participant, e):
+        failures.append(participant)
+        print(f"Failed to provision {participant}: {e}", flush=True)
+
+    poller = StatusPoller(cloud, min_interval=poll_interval, timeout=status_timeout)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # every run-instances goes out first, no worker ever waits on a boot
+            launches = {
+                pool.submit(
+                    launch_participant, cloud, state, p, pw, on_launch=record_instance
+                ): p
+                for p, pw in zip(remaining, passwords)
+            }
+            healthy = {}
+            for future in as_completed(launches):
+                participant = launches[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed(participant, e)
+                    continue
+                healthy[watch_participant(poller, state, participant)] = participant
+
+            # each instance is bootstrapped as soon as its status checks pass
+            finishes = {}
+            for future in as_completed(healthy):
+                participant = healthy[future]
+                try:
+                    addresses = future.result()
+                except Exception as e:
+                    failed(participant, e)
+                    continue
+                finishes[
+                    pool.submit(
+                        finish_participant,
+                        cloud,
+                        state,
+                        participant,
+                        addresses,
+                        bootstrap_script=bootstrap_script,
+                    )
+                ] = participant
+            for future in as_completed(finishes):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed(finishes[future], e)
+    finally:
+        poller.close()
+    failures.sort(key=participants.index)
+
+    # credentials.txt is rebuilt from the state, so reruns never duplicate a row
+    rows = {}
+    for participant in participants:
+        if state.done(participant, "password_set"):
+            s = state.get(participant)
+            rows[participant] = (
+                f"{participant},ec2-user,{s['instance_id']},{s['url']},{s['password']}"
+            )
+    existing = []
+    if os.path.exists(credentials):
+        with open(credentials) as f:
+            existing = [l for l in f.read().splitlines() if l.split(",")[0] not in rows]
+    write_atomic(credentials, existing + list(rows.values()))
+
+    return list(rows.values()), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Provision a workshop fleet in parallel")
+    parser.add_argument("participants", help="File with one participant per line")
+    parser.add_argument("--keyname", help="EC2 key pair name")
+    parser.add_argument("--keypath", help="Private key for the key pair")
+    parser.add_argument("--backend", choices=list(BACKENDS), default="aws")
+    parser.add_argument("--ami", default=AMI, help="Image to launch participants from")
+    parser.add_argument(
+        "--baked",
+        action="store_true",
+        help="The AMI was built by create-ami.sh, only run the slim bootstrap",
+    )
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument(
+        "--poll-interval", type=float, default=5, help="Initial status poll interval (s)"
+    )
+    parser.add_argument(
+        "--status-timeout",
+        type=float,
+        default=600,
+        help="Seconds an instance has to pass its status checks",
+    )
+    parser.add_argument("--credentials", default="credentials.txt")
+    parser.add_argument("--instance-ids", default="instanceIds.txt")
+    parser.add_argument(
+        "--state",
+        default="provision-state.jsonl",
+        help="Progress of each participant, rerun with the same file to resume",
+    )
+    args = parser.parse_args()
+
+    with open(args.participants) as f:
+        participants = [line.strip() for line in f if line.strip()]
+
+    if args.backend == "aws":
+        if not args.keyname or not args.keypath:
+            parser.error("the aws backend requires --keyname and --keypath")
+        cloud = AwsCliCloud(args.keyname, args.keypath, ami=args.ami)
+    else:
+        cloud = BACKENDS[args.backend]()
+
+    start = time.monotonic()
+    rows, failures = provision_fleet(
+        cloud,
+        participants,
+        workers=args.workers,
+        credentials=args.credentials,
+        instance_ids=args.instance_ids,
+        poll_interval=args.poll_interval,
+        state=args.state,
+        bootstrap_script=BAKED_BOOTSTRAP_SCRIPT if args.baked else BOOTSTRAP_SCRIPT,
+        status_timeout=args.status_timeout,
+    )
+    print(
+        f"Provisioned {len(rows)}/{len(participants)} participants "
+        f"in {time.monotonic() - start:.1f}s"
+    )
+    if failures:
+        raise SystemExit(f"Failed: {', '.join(failures)}")
+
+
+if __name__ == "__main__":
+    main()
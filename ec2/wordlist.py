@@ -0,0 +1,3688 @@
+"""
+    Fallback wordlist for pwgen.py, and the source for building the packed
+    wordlist (python3 pwgen.py --build).
+"""
+
+lines = [
+    "abandonment",
+    "abattoir",
+    "abilities",
+    "ability",
+    "abnormal",
+    "abnormally",
+    "about",
+    "above",
+    "abrupt",
+    "abruptly",
+    "absence",
+    "absinthe",
+    "absorb",
+    "abundance",
+    "abundant",
+    "acceleration",
+    "accented",
+    "accept",
+    "acciaccatura",
+    "accompanied",
+    "accompanying",
+    "account",
+    "accustomed",
+    "acedia",
+    "acervuline",
+    "achieve",
+    "acidic",
+    "acidulous",
+    "acolyte",
+    "acoustic",
+    "acquiesce",
+    "across",
+    "acting",
+    "action",
+    "actions",
+    "activity",
+    "actually",
+    "acute",
+    "adapted",
+    "additional",
+    "address",
+    "addressed",
+    "adept",
+    "adherence",
+    "admirable",
+    "admiration",
+    "admission",
+    "admitted",
+    "adopted",
+    "adorned",
+    "adroit",
+    "adulterous",
+    "adumbrate",
+    "advance",
+    "advanced",
+    "adversely",
+    "aeipathy",
+    "aeneous",
+    "aeolian",
+    "aeolus",
+    "aeonian",
+    "aerial",
+    "aesthete",
+    "aesthetic",
+    "aesthetics",
+    "aestival",
+    "aeviternal",
+    "affect",
+    "affected",
+    "affix",
+    "afflatus",
+    "affliction",
+    "affluence",
+    "affront",
+    "after",
+    "against",
+    "agent",
+    "aggregated",
+    "aggressively",
+    "agility",
+    "agreement",
+    "agricultural",
+    "aileron",
+    "ailment",
+    "ailurophile",
+    "aimlessly",
+    "aircraft",
+    "airplanes",
+    "alabaster",
+    "alacrity",
+    "alcohol",
+    "alcoholic",
+    "alienate",
+    "alignment",
+    "aliment",
+    "alive",
+    "allay",
+    "allays",
+    "allegretto",
+    "alleviate",
+    "alloquy",
+    "allure",
+    "alluring",
+    "alluvium",
+    "almost",
+    "along",
+    "alter",
+    "amaranth",
+    "amazing",
+    "amber",
+    "ambience",
+    "ambivalence",
+    "ambrosia",
+    "ameliorate",
+    "amelus",
+    "american",
+    "amethyst",
+    "amnesia",
+    "among",
+    "amorous",
+    "amount",
+    "amounts",
+    "amphisbaena",
+    "amphora",
+    "ample",
+    "amulet",
+    "analemma",
+    "ancestry",
+    "ancient",
+    "andante",
+    "anemone",
+    "angels",
+    "angrily",
+    "animal",
+    "animals",
+    "announcement",
+    "annoying",
+    "annual",
+    "another",
+    "antebellum",
+    "antelope",
+    "antianxiety",
+    "anxiety",
+    "anxiolytic",
+    "apathy",
+    "aperitif",
+    "aphelion",
+    "aphesis",
+    "aphotic",
+    "aphrodite",
+    "apocope",
+    "apophenia",
+    "apoplexy",
+    "aposiopesis",
+    "apostasy",
+    "apostles",
+    "apostolicity",
+    "apotheosis",
+    "apparatus",
+    "apparent",
+    "apparently",
+    "appealingly",
+    "appear",
+    "appearance",
+    "appearing",
+    "appease",
+    "appendage",
+    "appetizer",
+    "appetizing",
+    "applies",
+    "appreciates",
+    "apprentice",
+    "appropriate",
+    "approval",
+    "approximate",
+    "apropos",
+    "aptitude",
+    "aquarelle",
+    "aqueous",
+    "aquiline",
+    "arabesque",
+    "arcane",
+    "archaic",
+    "archetype",
+    "architectural",
+    "ardent",
+    "ardor",
+    "areas",
+    "arethe",
+    "arevolcanic",
+    "armor",
+    "aromatic",
+    "around",
+    "arrangement",
+    "arranging",
+    "array",
+    "arrogance",
+    "arrogant",
+    "artemisia",
+    "articles",
+    "articulated",
+    "artificial",
+    "artist",
+    "artistic",
+    "artistry",
+    "artlessness",
+    "ascertain",
+    "ashes",
+    "ashlar",
+    "asphodel",
+    "assembly",
+    "assist",
+    "assistance",
+    "assistant",
+    "associated",
+    "aster",
+    "astral",
+    "asylum",
+    "atelier",
+    "athanasy",
+    "athenaeum",
+    "atmosphere",
+    "atrium",
+    "attached",
+    "attack",
+    "attained",
+    "attention",
+    "attitude",
+    "attract",
+    "attracted",
+    "attraction",
+    "attractive",
+    "aubade",
+    "auburn",
+    "augur",
+    "augurs",
+    "auror",
+    "austere",
+    "author",
+    "authoritative",
+    "authors",
+    "automatic",
+    "autumn",
+    "autumnal",
+    "auxiliary",
+    "available",
+    "avarice",
+    "avenue",
+    "average",
+    "avoid",
+    "avoiding",
+    "aware",
+    "awkwardness",
+    "azalea",
+    "azoth",
+    "azuline",
+    "azure",
+    "baccalaureate",
+    "bachelorette",
+    "backwards",
+    "bacteria",
+    "baked",
+    "balance",
+    "balanced",
+    "balcony",
+    "ballet",
+    "ballets",
+    "balusters",
+    "balustrade",
+    "banderilla",
+    "bands",
+    "bardiglio",
+    "based",
+    "bashful",
+    "basilica",
+    "bastille",
+    "bauble",
+    "bayonet",
+    "beads",
+    "bearing",
+    "beautiful",
+    "beauty",
+    "become",
+    "becoming",
+    "before",
+    "beginner",
+    "beginning",
+    "beguile",
+    "behave",
+    "behavior",
+    "being",
+    "belief",
+    "beliefs",
+    "believed",
+    "belladonna",
+    "belle",
+    "bellicose",
+    "belligerent",
+    "bells",
+    "bellwether",
+    "belonging",
+    "belvedere",
+    "beneath",
+    "beneficial",
+    "berceuse",
+    "beside",
+    "bestowed",
+    "bethesda",
+    "betrayal",
+    "better",
+    "between",
+    "beverage",
+    "beverages",
+    "beyond",
+    "bezaleel",
+    "bibelot",
+    "bibliophile",
+    "bijouterie",
+    "billowing",
+    "biological",
+    "bivouac",
+    "black",
+    "blackmail",
+    "blade",
+    "blaze",
+    "blellum",
+    "blemish",
+    "blender",
+    "bliss",
+    "blissful",
+    "blithe",
+    "blithely",
+    "block",
+    "blocking",
+    "blood",
+    "blossom",
+    "bloviate",
+    "bluish",
+    "board",
+    "boastful",
+    "bodily",
+    "boeotian",
+    "boiling",
+    "boldly",
+    "bombastic",
+    "bones",
+    "books",
+    "borasca",
+    "bordereau",
+    "boulevard",
+    "bouleversement",
+    "bound",
+    "boundaries",
+    "boundary",
+    "bourgeoisie",
+    "bowing",
+    "braggadocio",
+    "braggart",
+    "branched",
+    "brassy",
+    "brave",
+    "brecciate",
+    "breeze",
+    "breezy",
+    "breviloquence",
+    "brevity",
+    "bricolage",
+    "brief",
+    "briefly",
+    "briefness",
+    "bright",
+    "brightly",
+    "brilliance",
+    "brilliantly",
+    "bring",
+    "briskness",
+    "broad",
+    "brooding",
+    "brothel",
+    "brother",
+    "brotherly",
+    "brown",
+    "bubble",
+    "bubbles",
+    "bubbling",
+    "building",
+    "bulletin",
+    "bulwark",
+    "bundled",
+    "buried",
+    "burned",
+    "burning",
+    "burnish",
+    "burst",
+    "burying",
+    "buttocks",
+    "bygone",
+    "caballero",
+    "cabaret",
+    "cache",
+    "cachet",
+    "cadence",
+    "cadenza",
+    "cadre",
+    "caesious",
+    "caesura",
+    "cages",
+    "cajolery",
+    "calico",
+    "caliginous",
+    "called",
+    "calling",
+    "calliope",
+    "callipygian",
+    "callow",
+    "calmness",
+    "calypso",
+    "cancrizans",
+    "candelabra",
+    "candidly",
+    "candle",
+    "candles",
+    "candlestick",
+    "canon",
+    "canopy",
+    "canticle",
+    "capable",
+    "capacity",
+    "capriccio",
+    "capriccioso",
+    "capricious",
+    "cardinals",
+    "carefree",
+    "cares",
+    "caress",
+    "carried",
+    "carrying",
+    "cartesian",
+    "cascading",
+    "cascarilla",
+    "castle",
+    "casual",
+    "casually",
+    "casualties",
+    "catch",
+    "catena",
+    "cathismata",
+    "cause",
+    "caused",
+    "causing",
+    "cavalier",
+    "cavil",
+    "cavity",
+    "cease",
+    "ceaseless",
+    "ceasing",
+    "cedilla",
+    "ceiling",
+    "celadon",
+    "celeripedean",
+    "celerity",
+    "celesta",
+    "celestial",
+    "cello",
+    "cellophane",
+    "cells",
+    "cellular",
+    "cellulite",
+    "celluloid",
+    "cellulose",
+    "cenotaph",
+    "centennial",
+    "center",
+    "centerpiece",
+    "central",
+    "ceramic",
+    "cerebral",
+    "certain",
+    "cerulean",
+    "cerumen",
+    "cessation",
+    "chains",
+    "chalice",
+    "chamois",
+    "champagne",
+    "chance",
+    "chandelier",
+    "change",
+    "changeable",
+    "changes",
+    "channel",
+    "chantpleure",
+    "chaotic",
+    "chapel",
+    "character",
+    "characteristic",
+    "characterized",
+    "charcoal",
+    "charges",
+    "chariot",
+    "charitable",
+    "charity",
+    "charm",
+    "chartreuse",
+    "chatelaine",
+    "chatoyant",
+    "chauffer",
+    "cheerful",
+    "cheilion",
+    "chemical",
+    "chevelure",
+    "chiaroscuro",
+    "chiasmus",
+    "chicory",
+    "chiefly",
+    "chimney",
+    "chinks",
+    "chirrup",
+    "chirrups",
+    "choir",
+    "choreography",
+    "chosen",
+    "chronic",
+    "chronology",
+    "church",
+    "cicada",
+    "cinder",
+    "cinnabar",
+    "cinquefoil",
+    "circle",
+    "circlet",
+    "circuitous",
+    "circular",
+    "circumference",
+    "circumstances",
+    "cislunar",
+    "cistern",
+    "citadel",
+    "cithara",
+    "citrus",
+    "civil",
+    "civility",
+    "claim",
+    "clandestine",
+    "clarification",
+    "clarify",
+    "clarion",
+    "clarity",
+    "class",
+    "clavicle",
+    "clavilux",
+    "clean",
+    "cleaning",
+    "cleanse",
+    "clear",
+    "clearly",
+    "cleft",
+    "clemency",
+    "clergy",
+    "clerisy",
+    "climbing",
+    "clinquant",
+    "clique",
+    "clithridiate",
+    "cloister",
+    "close",
+    "closely",
+    "cloth",
+    "clothing",
+    "cloud",
+    "clouds",
+    "cloudy",
+    "clown",
+    "cloying",
+    "clusters",
+    "coalesce",
+    "coarse",
+    "coating",
+    "cocktail",
+    "coelacanth",
+    "coercing",
+    "coercion",
+    "coffer",
+    "cognoscenti",
+    "coincidences",
+    "coins",
+    "coldness",
+    "collapse",
+    "collapsing",
+    "collarbone",
+    "collectanea",
+    "collected",
+    "collection",
+    "collective",
+    "collectively",
+    "collector",
+    "colliquate",
+    "collision",
+    "colloquial",
+    "colophon",
+    "color",
+    "coloratura",
+    "colored",
+    "colorless",
+    "colors",
+    "columns",
+    "combat",
+    "combustion",
+    "comedic",
+    "comedies",
+    "comestibles",
+    "comfort",
+    "comfy",
+    "commands",
+    "committed",
+    "common",
+    "commonly",
+    "communication",
+    "communist",
+    "compare",
+    "compared",
+    "comparison",
+    "comparisons",
+    "compelling",
+    "compensation",
+    "complementing",
+    "complete",
+    "completely",
+    "complex",
+    "complexion",
+    "complexity",
+    "complicated",
+    "comply",
+    "composed",
+    "composite",
+    "composition",
+    "composure",
+    "compress",
+    "compressed",
+    "comprising",
+    "conceal",
+    "concealed",
+    "conceived",
+    "concentric",
+    "concept",
+    "concern",
+    "conciliabule",
+    "conciliate",
+    "concinnity",
+    "concoction",
+    "concupiscence",
+    "condescend",
+    "condition",
+    "conducting",
+    "confer",
+    "conference",
+    "confession",
+    "conflicted",
+    "confused",
+    "congelifraction",
+    "congenital",
+    "conjurer",
+    "connected",
+    "connectedness",
+    "connecting",
+    "connects",
+    "conscious",
+    "consciousness",
+    "consecrated",
+    "consequence",
+    "considerable",
+    "considered",
+    "consisting",
+    "consolation",
+    "consonant",
+    "consorting",
+    "conspicuous",
+    "conspirators",
+    "constellation",
+    "constellations",
+    "constituent",
+    "constituting",
+    "construction",
+    "contact",
+    "contagious",
+    "container",
+    "containing",
+    "contemporary",
+    "continual",
+    "continue",
+    "continued",
+    "continuing",
+    "continuous",
+    "continuously",
+    "contract",
+    "contrast",
+    "contrasts",
+    "contributed",
+    "controlled",
+    "convalesce",
+    "convenience",
+    "convent",
+    "conventional",
+    "conversation",
+    "conversationally",
+    "convex",
+    "convictions",
+    "convulsion",
+    "coolness",
+    "coppice",
+    "copse",
+    "coquelicot",
+    "coquette",
+    "coquettish",
+    "coracle",
+    "cordial",
+    "cordillera",
+    "coriander",
+    "corinth",
+    "corinthian",
+    "corner",
+    "corpus",
+    "cortex",
+    "cortical",
+    "coruscate",
+    "coruscating",
+    "cosmology",
+    "cosmopolitan",
+    "coterie",
+    "cotton",
+    "could",
+    "counterfeit",
+    "counterpart",
+    "course",
+    "court",
+    "courteous",
+    "courtesy",
+    "courtroom",
+    "cover",
+    "covered",
+    "covering",
+    "crack",
+    "cracking",
+    "cracks",
+    "crafty",
+    "craquelure",
+    "create",
+    "creating",
+    "creative",
+    "creature",
+    "crepuscular",
+    "crescendo",
+    "crescent",
+    "crimes",
+    "crimson",
+    "crisscross",
+    "criticize",
+    "croon",
+    "crown",
+    "crudely",
+    "crush",
+    "crust",
+    "crystal",
+    "cultivated",
+    "cultural",
+    "culture",
+    "cumulonimbus",
+    "cuneiform",
+    "curiously",
+    "curled",
+    "curlicue",
+    "currency",
+    "current",
+    "cursive",
+    "curtain",
+    "curvature",
+    "curve",
+    "curved",
+    "curvilinear",
+    "curving",
+    "customers",
+    "cutting",
+    "cuvette",
+    "cyaneous",
+    "cycle",
+    "cygnet",
+    "cylinder",
+    "cymbal",
+    "cynophilist",
+    "cynosure",
+    "cypress",
+    "cytherean",
+    "dabbles",
+    "daedalian",
+    "daedalus",
+    "dagger",
+    "daily",
+    "dalliance",
+    "damage",
+    "dance",
+    "dances",
+    "dancing",
+    "danger",
+    "dangerous",
+    "daphnean",
+    "dapple",
+    "dawdling",
+    "daybreak",
+    "daydream",
+    "dazzling",
+    "dazzlingly",
+    "dealing",
+    "deathless",
+    "deceased",
+    "deceit",
+    "deceive",
+    "deceptive",
+    "decisions",
+    "decline",
+    "decomposition",
+    "decorated",
+    "decorative",
+    "decrescendo",
+    "defiantly",
+    "deficiency",
+    "deficient",
+    "defilement",
+    "defined",
+    "definition",
+    "degree",
+    "deification",
+    "deign",
+    "delenda",
+    "deleted",
+    "deliberate",
+    "delicate",
+    "delicious",
+    "delightful",
+    "delineate",
+    "deliquesce",
+    "delirium",
+    "delitescent",
+    "delphic",
+    "deluge",
+    "demarche",
+    "demeanor",
+    "demesne",
+    "demons",
+    "demonstrate",
+    "demonstrating",
+    "demure",
+    "denote",
+    "denouement",
+    "dense",
+    "density",
+    "dependence",
+    "dependent",
+    "deposit",
+    "depraved",
+    "depressed",
+    "depression",
+    "deprive",
+    "depth",
+    "derived",
+    "descartes",
+    "descendant",
+    "describe",
+    "describing",
+    "description",
+    "desert",
+    "design",
+    "designated",
+    "designating",
+    "designed",
+    "designs",
+    "desirable",
+    "desire",
+    "desires",
+    "dessert",
+    "destination",
+    "desuetude",
+    "detail",
+    "detailed",
+    "details",
+    "deterioration",
+    "determined",
+    "development",
+    "deviate",
+    "deviating",
+    "device",
+    "devil",
+    "devils",
+    "devised",
+    "devoid",
+    "devoted",
+    "dexterity",
+    "diablerie",
+    "diacritic",
+    "dialect",
+    "diaphanous",
+    "diaspora",
+    "diced",
+    "didactic",
+    "different",
+    "differing",
+    "difficult",
+    "diffuse",
+    "dignified",
+    "dignity",
+    "dilettante",
+    "diluted",
+    "dimensions",
+    "diminutive",
+    "dimpled",
+    "dioscuric",
+    "directed",
+    "direction",
+    "dirge",
+    "disarray",
+    "discharge",
+    "disciple",
+    "discipline",
+    "discomfort",
+    "discontent",
+    "discourse",
+    "discussion",
+    "disease",
+    "disembowel",
+    "disguise",
+    "disinclination",
+    "disinclined",
+    "disintegration",
+    "dislodge",
+    "dismal",
+    "dismissing",
+    "disorder",
+    "dispatch",
+    "dispersing",
+    "dispersion",
+    "display",
+    "displaying",
+    "disposition",
+    "disputatious",
+    "dissemble",
+    "dissemination",
+    "dissimilar",
+    "dissimulate",
+    "dissipating",
+    "dissolve",
+    "distance",
+    "distinctive",
+    "distinguishing",
+    "distorted",
+    "distress",
+    "distribution",
+    "distrust",
+    "disuse",
+    "diverse",
+    "divide",
+    "divided",
+    "divine",
+    "divinities",
+    "divisi",
+    "division",
+    "divisions",
+    "documents",
+    "doing",
+    "domain",
+    "dominance",
+    "donation",
+    "doubt",
+    "dragon",
+    "dramatic",
+    "drapery",
+    "drawing",
+    "drawn",
+    "dream",
+    "drench",
+    "dressed",
+    "dries",
+    "drink",
+    "drive",
+    "driver",
+    "drizzle",
+    "droplets",
+    "drying",
+    "dulcet",
+    "dulciloquy",
+    "dulcimer",
+    "dulcinea",
+    "dungeon",
+    "duplicate",
+    "during",
+    "dusky",
+    "dwelling",
+    "dyestuff",
+    "dying",
+    "dyslexia",
+    "eager",
+    "earlier",
+    "earliest",
+    "early",
+    "earth",
+    "earthen",
+    "earthly",
+    "easily",
+    "eaten",
+    "ebony",
+    "echelon",
+    "echolalia",
+    "eclipsareon",
+    "eclipse",
+    "eclipses",
+    "ecstasy",
+    "edible",
+    "educated",
+    "educe",
+    "effect",
+    "effervesce",
+    "effleurage",
+    "effluence",
+    "effluvium",
+    "efflux",
+    "effort",
+    "effortless",
+    "effulgent",
+    "effusive",
+    "eglantine",
+    "egyptian",
+    "eiderdown",
+    "eidolon",
+    "eight",
+    "either",
+    "elaborate",
+    "elapse",
+    "elastic",
+    "elasticity",
+    "elated",
+    "elation",
+    "electric",
+    "eleemosynary",
+    "elegant",
+    "element",
+    "elemental",
+    "elements",
+    "elephant",
+    "eleven",
+    "eleventh",
+    "elicit",
+    "elision",
+    "elixir",
+    "ellipse",
+    "ellipsis",
+    "elliptical",
+    "eloign",
+    "eloquence",
+    "eloquent",
+    "elucidate",
+    "elusive",
+    "elysian",
+    "elysium",
+    "emaciate",
+    "emaciation",
+    "emanation",
+    "embarcadero",
+    "embarrass",
+    "embarrassing",
+    "embarrassments",
+    "embed",
+    "embellishing",
+    "ember",
+    "emblem",
+    "emblems",
+    "embodiment",
+    "emerald",
+    "emissary",
+    "emission",
+    "emollient",
+    "emotion",
+    "emotional",
+    "emotionally",
+    "emotions",
+    "emphasis",
+    "emptiness",
+    "empty",
+    "empyreal",
+    "empyrean",
+    "emulate",
+    "emulsify",
+    "enamel",
+    "encampment",
+    "enceinte",
+    "enchantingly",
+    "encircle",
+    "encircles",
+    "enclose",
+    "enclosing",
+    "enclosures",
+    "encomium",
+    "endearing",
+    "ending",
+    "endless",
+    "enemy",
+    "energies",
+    "energize",
+    "energy",
+    "enervate",
+    "engage",
+    "engaged",
+    "english",
+    "engraving",
+    "enhalo",
+    "enhance",
+    "enhancement",
+    "enlightenment",
+    "ennui",
+    "enough",
+    "ensconce",
+    "entertain",
+    "entertainment",
+    "enthusiastic",
+    "entire",
+    "entity",
+    "entrance",
+    "entry",
+    "entryway",
+    "entwine",
+    "environment",
+    "envoy",
+    "epergne",
+    "ephebe",
+    "ephemeral",
+    "epicede",
+    "epicurean",
+    "epigone",
+    "epilepsy",
+    "epileptic",
+    "epiphany",
+    "epistemology",
+    "epistle",
+    "epitaph",
+    "epithelium",
+    "epitome",
+    "equal",
+    "equator",
+    "equestrian",
+    "equilibrium",
+    "equinox",
+    "equipoise",
+    "erased",
+    "eristic",
+    "erratic",
+    "erroneous",
+    "erspecific",
+    "erstwhile",
+    "erupt",
+    "escadrille",
+    "escalade",
+    "escamotage",
+    "escape",
+    "escarole",
+    "esclavage",
+    "escritoire",
+    "esculent",
+    "esoteric",
+    "esoterica",
+    "especially",
+    "esper",
+    "espresso",
+    "esprit",
+    "essence",
+    "essential",
+    "esssse",
+    "establish",
+    "establishment",
+    "estrange",
+    "estuary",
+    "esurient",
+    "eternal",
+    "ethereal",
+    "ethics",
+    "etiolate",
+    "etiquette",
+    "etude",
+    "eunoia",
+    "euphonious",
+    "euphoria",
+    "european",
+    "evade",
+    "evanescence",
+    "evanescent",
+    "evaporation",
+    "evening",
+    "event",
+    "eventful",
+    "events",
+    "every",
+    "everywhere",
+    "eviscerate",
+    "evocative",
+    "evoked",
+    "evokes",
+    "exaggerated",
+    "exaltation",
+    "exalted",
+    "example",
+    "examples",
+    "excel",
+    "excels",
+    "excelsior",
+    "except",
+    "excess",
+    "excessive",
+    "excessively",
+    "exchange",
+    "excite",
+    "excitement",
+    "excluding",
+    "exclusion",
+    "exclusively",
+    "excursion",
+    "excused",
+    "execution",
+    "exenterate",
+    "exert",
+    "exertion",
+    "exhibiting",
+    "exist",
+    "existence",
+    "existential",
+    "existentialism",
+    "existing",
+    "expatiate",
+    "expended",
+    "expensive",
+    "experience",
+    "expertly",
+    "expiration",
+    "explain",
+    "explains",
+    "explode",
+    "exposition",
+    "exposure",
+    "expound",
+    "express",
+    "expression",
+    "expressive",
+    "extended",
+    "extends",
+    "extension",
+    "extent",
+    "external",
+    "extinct",
+    "extracted",
+    "extraneous",
+    "extreme",
+    "extremely",
+    "exuberant",
+    "exuviate",
+    "eyeglasses",
+    "facial",
+    "facilitate",
+    "facility",
+    "facsimile",
+    "facts",
+    "faculty",
+    "fainting",
+    "faintly",
+    "fairy",
+    "faith",
+    "falcate",
+    "falciform",
+    "falling",
+    "false",
+    "famished",
+    "famulus",
+    "fanciful",
+    "fancy",
+    "farce",
+    "fastened",
+    "fatty",
+    "fault",
+    "fawning",
+    "feathers",
+    "feathery",
+    "features",
+    "featuring",
+    "feeling",
+    "feelings",
+    "felicity",
+    "female",
+    "femur",
+    "fence",
+    "fencing",
+    "fermented",
+    "ferret",
+    "fertile",
+    "fervid",
+    "festive",
+    "fever",
+    "fewness",
+    "fickle",
+    "fictional",
+    "field",
+    "fields",
+    "fifth",
+    "fight",
+    "figure",
+    "figures",
+    "filled",
+    "filter",
+    "final",
+    "finely",
+    "fingerboard",
+    "fingernail",
+    "firearms",
+    "fireplace",
+    "firmly",
+    "first",
+    "fissure",
+    "fissures",
+    "fitness",
+    "fitted",
+    "fixture",
+    "flame",
+    "flattery",
+    "flavor",
+    "flavored",
+    "fleck",
+    "flesh",
+    "fleur",
+    "flexible",
+    "flickering",
+    "flimsy",
+    "flirt",
+    "flirtation",
+    "flirting",
+    "floating",
+    "floor",
+    "florid",
+    "flourish",
+    "flower",
+    "flowering",
+    "flowery",
+    "flowing",
+    "flows",
+    "fluffy",
+    "foliage",
+    "following",
+    "footed",
+    "forbidden",
+    "force",
+    "forces",
+    "forefinger",
+    "foreigners",
+    "forest",
+    "foretell",
+    "foretells",
+    "forever",
+    "forgery",
+    "forgetfulness",
+    "forgotten",
+    "formal",
+    "formation",
+    "formed",
+    "former",
+    "formerly",
+    "forming",
+    "forms",
+    "formulaic",
+    "forte",
+    "forth",
+    "fortification",
+    "fortress",
+    "fortune",
+    "fortunes",
+    "foudroyant",
+    "fountain",
+    "fourteen",
+    "fragments",
+    "fragrant",
+    "frame",
+    "framework",
+    "freedom",
+    "freely",
+    "freezing",
+    "french",
+    "frescade",
+    "fretted",
+    "friendly",
+    "frivolous",
+    "frolic",
+    "front",
+    "frost",
+    "frothy",
+    "frozen",
+    "fruits",
+    "fruity",
+    "fuchsia",
+    "fuliginous",
+    "fullness",
+    "fulminate",
+    "fumarole",
+    "fumulus",
+    "functional",
+    "functioning",
+    "fundamental",
+    "funeral",
+    "furrow",
+    "further",
+    "furthest",
+    "furtive",
+    "fuselage",
+    "fusillade",
+    "futile",
+    "future",
+    "galaxy",
+    "galleria",
+    "gallery",
+    "galvanize",
+    "gambol",
+    "garden",
+    "garners",
+    "gases",
+    "gastronomical",
+    "gather",
+    "gathered",
+    "gathering",
+    "gaucherie",
+    "gaudy",
+    "gemstone",
+    "generates",
+    "generosity",
+    "generous",
+    "genius",
+    "genres",
+    "gentle",
+    "gentleman",
+    "genus",
+    "geometric",
+    "gestures",
+    "ghost",
+    "gifts",
+    "girandole",
+    "given",
+    "giving",
+    "glacial",
+    "glaciers",
+    "glance",
+    "glare",
+    "glass",
+    "glazed",
+    "gleam",
+    "gleaming",
+    "glide",
+    "glimpse",
+    "glisten",
+    "glittering",
+    "gloaming",
+    "gloom",
+    "gloominess",
+    "gloomy",
+    "glowing",
+    "glyph",
+    "goatlike",
+    "goblet",
+    "goddess",
+    "golden",
+    "gossamer",
+    "governor",
+    "grace",
+    "graceful",
+    "gracefully",
+    "gracile",
+    "gradation",
+    "gradual",
+    "gradually",
+    "grafting",
+    "grained",
+    "grainy",
+    "grammatical",
+    "grand",
+    "grandeur",
+    "grandiose",
+    "graphic",
+    "grassland",
+    "grave",
+    "gravid",
+    "gravity",
+    "grazioso",
+    "great",
+    "greed",
+    "greedy",
+    "greek",
+    "green",
+    "greenery",
+    "greenish",
+    "gregarious",
+    "grief",
+    "grimace",
+    "groomed",
+    "groove",
+    "grossly",
+    "ground",
+    "group",
+    "grouped",
+    "growing",
+    "growth",
+    "guilt",
+    "guiltless",
+    "gushing",
+    "gusto",
+    "gutter",
+    "gymnasium",
+    "gypsum",
+    "gypsy",
+    "hacienda",
+    "halcyon",
+    "hallowed",
+    "hallucinate",
+    "handle",
+    "handled",
+    "handwriting",
+    "hanging",
+    "happen",
+    "happening",
+    "happiness",
+    "happy",
+    "harem",
+    "harmed",
+    "harmful",
+    "harmless",
+    "harmony",
+    "harsh",
+    "hasty",
+    "having",
+    "hazel",
+    "headed",
+    "health",
+    "healthful",
+    "healthy",
+    "heaped",
+    "hearing",
+    "heath",
+    "heavenly",
+    "heavy",
+    "hedonistic",
+    "heedless",
+    "hegemony",
+    "height",
+    "heliotrope",
+    "helix",
+    "hemorrhage",
+    "henna",
+    "herbs",
+    "heroes",
+    "hesitate",
+    "heterogeneous",
+    "hidden",
+    "higher",
+    "highest",
+    "highly",
+    "hinder",
+    "hissing",
+    "hoarfrost",
+    "hobby",
+    "hodgepodge",
+    "holders",
+    "holding",
+    "holes",
+    "honey",
+    "honor",
+    "hooked",
+    "horse",
+    "horseback",
+    "horseman",
+    "hostile",
+    "hostility",
+    "hotter",
+    "house",
+    "household",
+    "housing",
+    "hubris",
+    "human",
+    "humankind",
+    "humid",
+    "humidity",
+    "humiliate",
+    "humor",
+    "hungarian",
+    "hungry",
+    "hyacinth",
+    "icicle",
+    "ictus",
+    "identify",
+    "identifying",
+    "ideor",
+    "idethat",
+    "idyll",
+    "idyllic",
+    "ilium",
+    "illicit",
+    "illness",
+    "illumination",
+    "illusion",
+    "illusory",
+    "illustrate",
+    "illustrating",
+    "image",
+    "imaginary",
+    "imagination",
+    "imbroglio",
+    "imbue",
+    "imitation",
+    "imitator",
+    "immaculate",
+    "immaterial",
+    "immature",
+    "immediate",
+    "immoral",
+    "immortality",
+    "immure",
+    "impair",
+    "impairment",
+    "impassioned",
+    "impedimenta",
+    "impenetrability",
+    "impenetrable",
+    "imperturbability",
+    "impetus",
+    "implement",
+    "impluvium",
+    "important",
+    "impossible",
+    "impresses",
+    "imprimatur",
+    "imprisonment",
+    "impropriety",
+    "improve",
+    "improvisation",
+    "impulse",
+    "impulsive",
+    "impurity",
+    "inactivity",
+    "inappropriate",
+    "incalescent",
+    "incarnadine",
+    "incense",
+    "inception",
+    "incipient",
+    "incised",
+    "incisive",
+    "inciting",
+    "incline",
+    "inclined",
+    "inclusive",
+    "incomplete",
+    "increase",
+    "inculcate",
+    "incunabula",
+    "indefinitely",
+    "indescribable",
+    "indian",
+    "indicated",
+    "indicates",
+    "indicating",
+    "indicator",
+    "indifferent",
+    "indirect",
+    "indiscreet",
+    "indispensable",
+    "indistinct",
+    "individual",
+    "indolence",
+    "indolent",
+    "indoor",
+    "induce",
+    "ineffable",
+    "ineffectual",
+    "inertia",
+    "inexperience",
+    "infant",
+    "infatuation",
+    "infection",
+    "inferior",
+    "infinitesimal",
+    "infinity",
+    "influence",
+    "influenza",
+    "informal",
+    "information",
+    "infuriate",
+    "infuse",
+    "ingenious",
+    "inglenook",
+    "ingravescent",
+    "ingredients",
+    "inhabiting",
+    "initial",
+    "initially",
+    "inject",
+    "injurious",
+    "injury",
+    "inlet",
+    "innocent",
+    "inoccuity",
+    "inoculate",
+    "inopportune",
+    "insanity",
+    "inscription",
+    "insect",
+    "insects",
+    "insidious",
+    "insignia",
+    "insigniapproval",
+    "insignificant",
+    "insignilily",
+    "insipid",
+    "insoluble",
+    "insouciant",
+    "inspiration",
+    "inspire",
+    "inspired",
+    "inspires",
+    "instance",
+    "institution",
+    "instrument",
+    "instrumentation",
+    "instruments",
+    "insubstantial",
+    "intaglio",
+    "integer",
+    "intellect",
+    "intellectual",
+    "intelligent",
+    "intelligentsia",
+    "intending",
+    "intense",
+    "intensity",
+    "intent",
+    "interest",
+    "interests",
+    "interior",
+    "interruption",
+    "intersect",
+    "interweave",
+    "intimidated",
+    "intimidation",
+    "intonation",
+    "intoxication",
+    "intricacy",
+    "intrinsic",
+    "introduce",
+    "inundate",
+    "inure",
+    "inverse",
+    "invigorate",
+    "invoking",
+    "involuntary",
+    "involved",
+    "involving",
+    "iridescent",
+    "irreducible",
+    "irregularly",
+    "irritating",
+    "iscariotic",
+    "isinglass",
+    "island",
+    "isosceles",
+    "issued",
+    "isthmus",
+    "italian",
+    "italy",
+    "items",
+    "ivory",
+    "jacqueminot",
+    "jaunt",
+    "jejune",
+    "jellylike",
+    "jewelry",
+    "jewels",
+    "joint",
+    "joking",
+    "joyous",
+    "juggler",
+    "juggling",
+    "juice",
+    "juvenile",
+    "juxtapose",
+    "kaleidoscope",
+    "keeping",
+    "keepsake",
+    "keyboard",
+    "keyhole",
+    "kingdom",
+    "kingfisher",
+    "kismet",
+    "kitten",
+    "knell",
+    "knowledge",
+    "labial",
+    "labor",
+    "laboratory",
+    "labyrinth",
+    "lacerate",
+    "lacking",
+    "lacks",
+    "laconic",
+    "lacquer",
+    "lacuna",
+    "ladder",
+    "lagniappe",
+    "lambent",
+    "laminate",
+    "lampoon",
+    "landing",
+    "language",
+    "languages",
+    "languid",
+    "laodicean",
+    "lapis",
+    "large",
+    "larger",
+    "largesse",
+    "lascivious",
+    "lasciviousness",
+    "lassitude",
+    "lasting",
+    "lateral",
+    "lathe",
+    "lattice",
+    "laundry",
+    "lavadero",
+    "lavender",
+    "lavish",
+    "layer",
+    "layers",
+    "laziness",
+    "lazuli",
+    "leader",
+    "leads",
+    "learned",
+    "learning",
+    "leave",
+    "leaved",
+    "leaves",
+    "legal",
+    "legendary",
+    "legerdemain",
+    "legerity",
+    "leisure",
+    "leitmotif",
+    "lemniscate",
+    "lemon",
+    "lemonade",
+    "length",
+    "leopard",
+    "lesbian",
+    "lessen",
+    "lethally",
+    "lethargic",
+    "lethe",
+    "letter",
+    "lettres",
+    "level",
+    "levels",
+    "leveret",
+    "leviathan",
+    "levitation",
+    "lewdness",
+    "lexical",
+    "lexiphanes",
+    "liaison",
+    "libeccio",
+    "light",
+    "lightly",
+    "lightning",
+    "lights",
+    "lilliput",
+    "lilliputian",
+    "limbs",
+    "limerence",
+    "limited",
+    "limits",
+    "limousine",
+    "limpid",
+    "lineage",
+    "lineaments",
+    "linear",
+    "lined",
+    "lines",
+    "linguistics",
+    "linked",
+    "linoleum",
+    "liquefy",
+    "liquid",
+    "liquor",
+    "lissom",
+    "listless",
+    "listlessness",
+    "litany",
+    "literary",
+    "literati",
+    "literature",
+    "lithe",
+    "lithium",
+    "lithosphere",
+    "litote",
+    "litterateur",
+    "litterateurs",
+    "liturgical",
+    "lively",
+    "living",
+    "lixiviation",
+    "localized",
+    "location",
+    "lochetic",
+    "locust",
+    "longer",
+    "loquacious",
+    "lorgnette",
+    "lothario",
+    "lotion",
+    "lotus",
+    "loutish",
+    "lovely",
+    "lover",
+    "lovers",
+    "loves",
+    "loving",
+    "lowering",
+    "lowest",
+    "lowly",
+    "lubricant",
+    "lubricious",
+    "lucent",
+    "lucid",
+    "lugubrious",
+    "lukewarm",
+    "lullaby",
+    "lumen",
+    "luminal",
+    "luminary",
+    "lunacy",
+    "lunula",
+    "luscious",
+    "luster",
+    "lustful",
+    "lustrous",
+    "lying",
+    "machine",
+    "magic",
+    "magical",
+    "magician",
+    "magisterial",
+    "magnificence",
+    "magnificent",
+    "magniloquent",
+    "maiden",
+    "mainmast",
+    "maintain",
+    "majestic",
+    "makes",
+    "making",
+    "malady",
+    "malaise",
+    "malapropos",
+    "malleable",
+    "mammal",
+    "maneuver",
+    "mangle",
+    "manifesting",
+    "manipulations",
+    "mannequin",
+    "manner",
+    "mannerisms",
+    "manor",
+    "mantelletta",
+    "mantle",
+    "manufacture",
+    "manuscript",
+    "maquette",
+    "marasccherry",
+    "maraschino",
+    "marasmus",
+    "marble",
+    "marcescent",
+    "margin",
+    "marginalia",
+    "margins",
+    "marine",
+    "marionette",
+    "marked",
+    "marking",
+    "marmalade",
+    "marmoreal",
+    "masks",
+    "masquerade",
+    "massacre",
+    "massage",
+    "masses",
+    "massive",
+    "master",
+    "masts",
+    "material",
+    "materials",
+    "mathematical",
+    "matriculate",
+    "matter",
+    "mattress",
+    "maturity",
+    "matutinal",
+    "maudlin",
+    "mausoleum",
+    "mauve",
+    "mawkish",
+    "maximum",
+    "meadow",
+    "meaning",
+    "means",
+    "measure",
+    "medallion",
+    "medical",
+    "medication",
+    "medicine",
+    "medieval",
+    "medium",
+    "medley",
+    "meeting",
+    "melancholy",
+    "melisma",
+    "mellifluous",
+    "mellisonant",
+    "melody",
+    "member",
+    "members",
+    "membership",
+    "memento",
+    "memorabilia",
+    "memorandum",
+    "memory",
+    "menagerie",
+    "mental",
+    "mentality",
+    "mentioned",
+    "mephitic",
+    "mercurial",
+    "mercy",
+    "meretricious",
+    "merging",
+    "meridian",
+    "merrily",
+    "mestizo",
+    "metal",
+    "metaphor",
+    "metaphysics",
+    "method",
+    "mezzanine",
+    "miasma",
+    "microscopic",
+    "middle",
+    "midst",
+    "milieu",
+    "military",
+    "milky",
+    "millennium",
+    "milquetoast",
+    "mimesis",
+    "mimicry",
+    "mimosa",
+    "mimsy",
+    "minded",
+    "mineral",
+    "minerals",
+    "miniscule",
+    "minor",
+    "minute",
+    "minutiae",
+    "mirror",
+    "mirrors",
+    "miscellany",
+    "miserable",
+    "mislead",
+    "misleading",
+    "mission",
+    "mistress",
+    "misty",
+    "mithril",
+    "mixed",
+    "mixture",
+    "mizzenmast",
+    "mizzle",
+    "model",
+    "moderate",
+    "moderately",
+    "modest",
+    "modified",
+    "moiety",
+    "moisture",
+    "moldable",
+    "moment",
+    "moments",
+    "momentum",
+    "monastatic",
+    "money",
+    "moniker",
+    "monologue",
+    "moral",
+    "morceau",
+    "mormorando",
+    "morning",
+    "mortal",
+    "mostly",
+    "mother",
+    "motion",
+    "motivation",
+    "motives",
+    "mottled",
+    "mountain",
+    "mountains",
+    "mounted",
+    "mournful",
+    "mourning",
+    "mouth",
+    "moveable",
+    "movement",
+    "movements",
+    "moving",
+    "multi",
+    "multifarious",
+    "multitude",
+    "mummer",
+    "mundane",
+    "murdering",
+    "murmur",
+    "murmuring",
+    "music",
+    "musical",
+    "musicians",
+    "mutual",
+    "muzzle",
+    "myriad",
+    "myrrh",
+    "mysterious",
+    "mystique",
+    "mythical",
+    "mythological",
+    "mythologized",
+    "mythopoeic",
+    "myths",
+    "nacre",
+    "nacreous",
+    "naiad",
+    "nails",
+    "naive",
+    "namely",
+    "narrative",
+    "narrow",
+    "natural",
+    "naturally",
+    "nature",
+    "nearness",
+    "nebulae",
+    "nebulous",
+    "necessary",
+    "necklace",
+    "needles",
+    "needs",
+    "negative",
+    "nemesis",
+    "nenuphar",
+    "neophyte",
+    "nepenthe",
+    "nepheliad",
+    "nephew",
+    "neuralgifrom",
+    "never",
+    "niche",
+    "nickel",
+    "nickelodeon",
+    "nickname",
+    "night",
+    "nimbus",
+    "nimiety",
+    "nirvana",
+    "niveous",
+    "noble",
+    "nocive",
+    "noctilucence",
+    "nocturne",
+    "noisy",
+    "nonchalant",
+    "nondescript",
+    "nonstandard",
+    "normal",
+    "north",
+    "notably",
+    "notes",
+    "nothing",
+    "noticeable",
+    "nourishes",
+    "novae",
+    "noveau",
+    "novella",
+    "novice",
+    "novitiate",
+    "nowhere",
+    "noxious",
+    "nucleus",
+    "nugacious",
+    "nullibicity",
+    "nullifidian",
+    "number",
+    "numbers",
+    "numeral",
+    "numina",
+    "numismatics",
+    "nutrients",
+    "nymph",
+    "nymphet",
+    "oasis",
+    "object",
+    "objection",
+    "objects",
+    "objet",
+    "obliquely",
+    "oblivion",
+    "obscuration",
+    "obscure",
+    "obscurity",
+    "obsequious",
+    "observer",
+    "obsidian",
+    "obtuse",
+    "occasions",
+    "occupation",
+    "occupied",
+    "occur",
+    "occurrence",
+    "occurring",
+    "occurs",
+    "ocelot",
+    "odalisque",
+    "oeillade",
+    "oeuvre",
+    "offense",
+    "offensively",
+    "official",
+    "often",
+    "oleander",
+    "omission",
+    "omitted",
+    "omnidirectional",
+    "omnipresent",
+    "oneself",
+    "onset",
+    "opacity",
+    "opalescent",
+    "opaque",
+    "opaquely",
+    "opaqueness",
+    "opening",
+    "operaccompanied",
+    "operation",
+    "operglasses",
+    "ophidian",
+    "opinion",
+    "opponent",
+    "opposed",
+    "opposing",
+    "opposite",
+    "optical",
+    "optimistic",
+    "opulence",
+    "opusculum",
+    "oracular",
+    "orange",
+    "orbit",
+    "orbital",
+    "orbits",
+    "orchestra",
+    "orchestral",
+    "orchid",
+    "order",
+    "ordinary",
+    "organisms",
+    "origin",
+    "original",
+    "ornament",
+    "ornamental",
+    "ornamentation",
+    "ornate",
+    "oscillate",
+    "ossuary",
+    "other",
+    "others",
+    "otherwise",
+    "otiose",
+    "oubliette",
+    "outer",
+    "outermost",
+    "outline",
+    "outside",
+    "outstanding",
+    "outward",
+    "overabundance",
+    "overbearing",
+    "overly",
+    "overpoweringly",
+    "overtures",
+    "overturning",
+    "overwhelm",
+    "overwhelming",
+    "owned",
+    "pabulum",
+    "pacify",
+    "painful",
+    "painting",
+    "paintings",
+    "palace",
+    "palatial",
+    "palaver",
+    "pales",
+    "palimpsest",
+    "palisade",
+    "palladian",
+    "palliasse",
+    "palliate",
+    "pallid",
+    "panacea",
+    "panoply",
+    "panoramic",
+    "pantomime",
+    "paper",
+    "paradigm",
+    "paramour",
+    "parapet",
+    "paraph",
+    "parchment",
+    "pardonable",
+    "pardoned",
+    "paroxysm",
+    "partial",
+    "participants",
+    "particular",
+    "parties",
+    "parts",
+    "party",
+    "parvenu",
+    "pasquinade",
+    "passage",
+    "passageway",
+    "passed",
+    "passing",
+    "passion",
+    "passively",
+    "pastiche",
+    "patchwork",
+    "patina",
+    "patois",
+    "patronage",
+    "pattern",
+    "paucity",
+    "pause",
+    "peace",
+    "peaceful",
+    "pearl",
+    "pearly",
+    "peccadillo",
+    "peccavi",
+    "pellucid",
+    "penetrate",
+    "penetrating",
+    "peninsula",
+    "pensive",
+    "penumbra",
+    "people",
+    "perceive",
+    "perceived",
+    "perception",
+    "perceptions",
+    "percolate",
+    "percussive",
+    "perennial",
+    "perfect",
+    "perforate",
+    "perform",
+    "performance",
+    "perfume",
+    "perfumed",
+    "perfumes",
+    "perfunctory",
+    "perimeter",
+    "period",
+    "peripheral",
+    "periphery",
+    "permeate",
+    "permutations",
+    "perpetual",
+    "perpetuity",
+    "persisting",
+    "person",
+    "personal",
+    "personality",
+    "persons",
+    "perspective",
+    "pertaining",
+    "pervade",
+    "pervasive",
+    "phantasm",
+    "phenomena",
+    "phenomenin",
+    "phenomenon",
+    "philander",
+    "philanderer",
+    "philanthropy",
+    "philistinism",
+    "philosophical",
+    "philosophy",
+    "philtrum",
+    "phoenix",
+    "photographic",
+    "phrase",
+    "phrases",
+    "phrontistery",
+    "physical",
+    "physically",
+    "pianissimo",
+    "picture",
+    "picturesque",
+    "piece",
+    "pieces",
+    "pierce",
+    "pigment",
+    "pillows",
+    "pinkish",
+    "piquant",
+    "pirouette",
+    "pitying",
+    "pizzicato",
+    "place",
+    "placement",
+    "placid",
+    "plain",
+    "plane",
+    "planet",
+    "plant",
+    "plants",
+    "plastic",
+    "plate",
+    "platforms",
+    "plausible",
+    "played",
+    "playful",
+    "playfully",
+    "pleasant",
+    "pleasure",
+    "plethora",
+    "plucking",
+    "plumage",
+    "plural",
+    "pluvial",
+    "pococurante",
+    "poetry",
+    "poignant",
+    "point",
+    "pointed",
+    "points",
+    "poisonous",
+    "poles",
+    "polish",
+    "polished",
+    "politeness",
+    "political",
+    "politics",
+    "pompous",
+    "ponceau",
+    "poppy",
+    "porcelain",
+    "porch",
+    "pores",
+    "portable",
+    "portfolio",
+    "portico",
+    "portion",
+    "portmanteau",
+    "portrayed",
+    "position",
+    "possessing",
+    "possible",
+    "pouting",
+    "powers",
+    "practical",
+    "practitioner",
+    "prairillon",
+    "praise",
+    "preceding",
+    "precise",
+    "precocious",
+    "predominant",
+    "preeminence",
+    "pregnant",
+    "prehistoric",
+    "prejudices",
+    "preliminary",
+    "prelude",
+    "premonition",
+    "prepared",
+    "presence",
+    "presentation",
+    "preserve",
+    "presiding",
+    "pressure",
+    "pretentious",
+    "pretentiousness",
+    "preterlabent",
+    "pretty",
+    "preventing",
+    "previously",
+    "pride",
+    "primordial",
+    "principles",
+    "printed",
+    "printing",
+    "prior",
+    "prismatic",
+    "prison",
+    "pristine",
+    "private",
+    "privately",
+    "prize",
+    "process",
+    "procession",
+    "procrastination",
+    "produced",
+    "profession",
+    "profile",
+    "profoundly",
+    "profusion",
+    "prognosticate",
+    "prognosticator",
+    "progress",
+    "promethean",
+    "prominent",
+    "promising",
+    "promotion",
+    "pronunciation",
+    "proper",
+    "properties",
+    "prophesy",
+    "prophetess",
+    "prophetic",
+    "propinquity",
+    "proscenium",
+    "prose",
+    "prosody",
+    "prospect",
+    "protective",
+    "protein",
+    "provincial",
+    "provisions",
+    "provocative",
+    "provoke",
+    "prowrapping",
+    "proximity",
+    "prurient",
+    "psalter",
+    "psithurisma",
+    "psittacism",
+    "psyche",
+    "psychic",
+    "pubescent",
+    "public",
+    "pugnacious",
+    "punch",
+    "punchinello",
+    "punished",
+    "pupil",
+    "puppet",
+    "puppeteer",
+    "puree",
+    "purge",
+    "purlicue",
+    "purling",
+    "purple",
+    "purpose",
+    "purposes",
+    "pursuit",
+    "putrid",
+    "puzzling",
+    "pyrrhic",
+    "quaint",
+    "qualities",
+    "quality",
+    "qualm",
+    "quaquaversal",
+    "quarters",
+    "quaver",
+    "querencia",
+    "quick",
+    "quickly",
+    "quickness",
+    "quiet",
+    "quilts",
+    "quintessence",
+    "quisquose",
+    "quiver",
+    "quivering",
+    "quotidian",
+    "rabbit",
+    "racial",
+    "radiance",
+    "radii",
+    "rainfall",
+    "raised",
+    "raising",
+    "ranch",
+    "random",
+    "ranges",
+    "ranked",
+    "rapid",
+    "rapidity",
+    "rapidly",
+    "rapture",
+    "rariora",
+    "ratatouille",
+    "rather",
+    "rationality",
+    "ravenous",
+    "reaches",
+    "reaction",
+    "reactive",
+    "readily",
+    "readiness",
+    "reality",
+    "realm",
+    "reappearing",
+    "reason",
+    "reasoning",
+    "reasons",
+    "rebirth",
+    "receptacle",
+    "recidivism",
+    "reciprocity",
+    "recital",
+    "record",
+    "recover",
+    "recovery",
+    "rectangular",
+    "recuperate",
+    "reddish",
+    "redivivus",
+    "redolent",
+    "reduce",
+    "reducing",
+    "reduction",
+    "reference",
+    "referring",
+    "refined",
+    "reflect",
+    "reflecting",
+    "reflection",
+    "refractive",
+    "refuge",
+    "regalia",
+    "regard",
+    "regarded",
+    "region",
+    "regions",
+    "regulate",
+    "related",
+    "relating",
+    "relation",
+    "relationship",
+    "relax",
+    "relaxation",
+    "relaxed",
+    "relaxing",
+    "release",
+    "relegate",
+    "relics",
+    "religion",
+    "religious",
+    "relinquish",
+    "reliquary",
+    "remarkable",
+    "remedial",
+    "remedy",
+    "remembrance",
+    "reminds",
+    "remove",
+    "renaissance",
+    "rendered",
+    "renewal",
+    "repartee",
+    "repeat",
+    "repeating",
+    "repel",
+    "repellant",
+    "repetition",
+    "replica",
+    "reply",
+    "report",
+    "represent",
+    "representation",
+    "representative",
+    "represented",
+    "reproduction",
+    "reptile",
+    "reputation",
+    "requiem",
+    "requires",
+    "requiting",
+    "resembles",
+    "resembling",
+    "reserve",
+    "reserved",
+    "reservoir",
+    "reshaped",
+    "resin",
+    "resist",
+    "resolution",
+    "resonance",
+    "resonant",
+    "respect",
+    "resplendent",
+    "responsibility",
+    "restaurant",
+    "resting",
+    "restore",
+    "restraint",
+    "restriction",
+    "result",
+    "resurrected",
+    "resuscitated",
+    "reticent",
+    "retort",
+    "retorts",
+    "returns",
+    "reused",
+    "revelation",
+    "revenant",
+    "reverie",
+    "reversal",
+    "revival",
+    "revive",
+    "revived",
+    "rhapsody",
+    "rhetorical",
+    "rhyme",
+    "rhyming",
+    "rhythm",
+    "rhythmic",
+    "riche",
+    "ridge",
+    "ridges",
+    "riding",
+    "rifle",
+    "rimulose",
+    "ringing",
+    "risen",
+    "rises",
+    "risorgimento",
+    "rites",
+    "river",
+    "roadway",
+    "rocks",
+    "rohouse",
+    "roman",
+    "romans",
+    "romantic",
+    "roofed",
+    "roseate",
+    "rosupported",
+    "rotating",
+    "rouge",
+    "roundabout",
+    "rounded",
+    "routine",
+    "royalty",
+    "ruddy",
+    "rules",
+    "running",
+    "rupestrian",
+    "rustled",
+    "rustling",
+    "sable",
+    "saccharine",
+    "sacred",
+    "sadness",
+    "safeguard",
+    "sagacity",
+    "salient",
+    "saline",
+    "salty",
+    "salubrious",
+    "salve",
+    "salvo",
+    "sanctified",
+    "sandy",
+    "sangfroid",
+    "sanguine",
+    "sanity",
+    "sapience",
+    "sapphire",
+    "sarcastic",
+    "sardonyx",
+    "satellite",
+    "satire",
+    "saucy",
+    "savvy",
+    "sawdust",
+    "scale",
+    "scaling",
+    "scarcity",
+    "scarlet",
+    "scenes",
+    "scent",
+    "scepter",
+    "schefflera",
+    "scheme",
+    "scialytic",
+    "science",
+    "scientific",
+    "scilicet",
+    "scintilla",
+    "scintillating",
+    "scion",
+    "sclera",
+    "scoliosis",
+    "sculpted",
+    "scythe",
+    "seclusion",
+    "second",
+    "secret",
+    "secretion",
+    "secretively",
+    "secretly",
+    "section",
+    "secular",
+    "secure",
+    "sedate",
+    "sediments",
+    "seductive",
+    "seeming",
+    "segments",
+    "seized",
+    "seizing",
+    "seizure",
+    "selcouth",
+    "selection",
+    "selective",
+    "selenian",
+    "semblance",
+    "semiotician",
+    "semiotics",
+    "sempiternal",
+    "senescence",
+    "sense",
+    "sentence",
+    "sentences",
+    "sentience",
+    "sentient",
+    "sentimental",
+    "separated",
+    "separating",
+    "sequacious",
+    "sequence",
+    "sequester",
+    "seraglio",
+    "seraphim",
+    "serenade",
+    "serendipity",
+    "serene",
+    "serenity",
+    "series",
+    "serious",
+    "serum",
+    "servant",
+    "serve",
+    "servile",
+    "serving",
+    "sesquipedalian",
+    "sestina",
+    "settle",
+    "seven",
+    "seventh",
+    "several",
+    "severe",
+    "sexual",
+    "sexually",
+    "sforzando",
+    "sfumato",
+    "shade",
+    "shadow",
+    "shadows",
+    "shady",
+    "shake",
+    "shaking",
+    "shallow",
+    "shape",
+    "shaped",
+    "shaping",
+    "sharp",
+    "shavings",
+    "sheen",
+    "sheer",
+    "sheet",
+    "sheets",
+    "shell",
+    "shimmer",
+    "shimmering",
+    "shine",
+    "shining",
+    "shiver",
+    "shoot",
+    "short",
+    "shortness",
+    "should",
+    "showily",
+    "showing",
+    "shown",
+    "showy",
+    "shrill",
+    "shrine",
+    "shrivel",
+    "shrub",
+    "shrubby",
+    "shrubs",
+    "shudder",
+    "shutting",
+    "sibilant",
+    "sibyl",
+    "sickle",
+    "sickly",
+    "sickness",
+    "sidereal",
+    "sides",
+    "sidle",
+    "sienna",
+    "sierra",
+    "sight",
+    "sigil",
+    "signature",
+    "signet",
+    "significance",
+    "signs",
+    "silence",
+    "silhouette",
+    "silkscreen",
+    "silver",
+    "silvery",
+    "similar",
+    "simple",
+    "simplicity",
+    "simplistic",
+    "simulacrum",
+    "simulation",
+    "simultaneous",
+    "simultaneously",
+    "sinecure",
+    "singing",
+    "single",
+    "siphon",
+    "sirocco",
+    "sister",
+    "sisyphean",
+    "sisyphus",
+    "sittella",
+    "situation",
+    "sketch",
+    "skill",
+    "skilled",
+    "skillful",
+    "skills",
+    "slapstick",
+    "slash",
+    "slaughterhouse",
+    "sleep",
+    "sleeveless",
+    "sleight",
+    "slender",
+    "slice",
+    "slide",
+    "slight",
+    "slightly",
+    "slippery",
+    "slither",
+    "sliver",
+    "slope",
+    "sloping",
+    "slowly",
+    "sluggard",
+    "sluice",
+    "slumber",
+    "small",
+    "smaller",
+    "smoke",
+    "smolder",
+    "smooth",
+    "snake",
+    "snakes",
+    "snowy",
+    "sobriety",
+    "sobriquet",
+    "social",
+    "society",
+    "softens",
+    "softly",
+    "sojourn",
+    "solace",
+    "soldiers",
+    "solecism",
+    "solemn",
+    "solemnly",
+    "solid",
+    "soliloquy",
+    "solipsism",
+    "solos",
+    "solstice",
+    "soluble",
+    "solution",
+    "solvent",
+    "somber",
+    "someone",
+    "something",
+    "somewhat",
+    "sommelier",
+    "sonata",
+    "songbird",
+    "sonnet",
+    "soothe",
+    "soothes",
+    "sophisticated",
+    "sorcerer",
+    "sorcery",
+    "sorrow",
+    "sotto",
+    "soubrette",
+    "sough",
+    "sound",
+    "sounding",
+    "soundlessness",
+    "sounds",
+    "source",
+    "south",
+    "southeast",
+    "southern",
+    "southwest",
+    "souvenir",
+    "sovereign",
+    "space",
+    "spaces",
+    "spacetime",
+    "spacious",
+    "sparkle",
+    "sparkling",
+    "spasm",
+    "speak",
+    "speaker",
+    "speaking",
+    "special",
+    "specific",
+    "specious",
+    "specter",
+    "spectral",
+    "spectrum",
+    "speech",
+    "speed",
+    "spell",
+    "sphere",
+    "spinal",
+    "spine",
+    "spineless",
+    "spiral",
+    "spirals",
+    "spirit",
+    "spirits",
+    "spiritual",
+    "splendid",
+    "splendor",
+    "splice",
+    "splitting",
+    "spoil",
+    "spoken",
+    "spontaneously",
+    "spool",
+    "spotless",
+    "spread",
+    "spring",
+    "sprite",
+    "squad",
+    "squadron",
+    "squall",
+    "squared",
+    "stage",
+    "staggering",
+    "stains",
+    "stakes",
+    "stand",
+    "stanzas",
+    "stars",
+    "starved",
+    "stasis",
+    "state",
+    "stated",
+    "stately",
+    "stature",
+    "status",
+    "steady",
+    "stealthy",
+    "steam",
+    "steel",
+    "stellar",
+    "stencil",
+    "stentorian",
+    "stepped",
+    "stern",
+    "steward",
+    "stiletto",
+    "stillicide",
+    "stimulating",
+    "stimulation",
+    "stimuli",
+    "stone",
+    "stopover",
+    "stories",
+    "story",
+    "straight",
+    "strainer",
+    "strange",
+    "strangers",
+    "straw",
+    "stream",
+    "street",
+    "strength",
+    "stress",
+    "stretched",
+    "stretching",
+    "strife",
+    "string",
+    "stringed",
+    "strings",
+    "strip",
+    "strips",
+    "strive",
+    "stroke",
+    "stroking",
+    "strong",
+    "stronghold",
+    "strongly",
+    "structure",
+    "studies",
+    "studio",
+    "study",
+    "stuffing",
+    "stunt",
+    "stupidity",
+    "style",
+    "stylized",
+    "suave",
+    "subdued",
+    "sublime",
+    "submit",
+    "subsidiary",
+    "substance",
+    "substances",
+    "subtle",
+    "success",
+    "succession",
+    "successively",
+    "succinct",
+    "succor",
+    "sudden",
+    "suddenly",
+    "suffuse",
+    "sugar",
+    "suicide",
+    "suitable",
+    "suitcase",
+    "suitor",
+    "sumerian",
+    "summer",
+    "summon",
+    "sundial",
+    "sundries",
+    "sunlight",
+    "superficial",
+    "superficially",
+    "superfluity",
+    "superior",
+    "supernatural",
+    "supple",
+    "supplementary",
+    "supply",
+    "supremacy",
+    "surface",
+    "surrender",
+    "surrendering",
+    "surreptitious",
+    "surround",
+    "surrounded",
+    "surrounding",
+    "surroundings",
+    "survey",
+    "susceptible",
+    "suspicion",
+    "sussurant",
+    "sussurous",
+    "sustenance",
+    "susurrus",
+    "svelte",
+    "swain",
+    "swamps",
+    "swampy",
+    "swath",
+    "sweet",
+    "sweetbrier",
+    "sweetheart",
+    "sweetness",
+    "swerve",
+    "sweven",
+    "swift",
+    "swiftness",
+    "swing",
+    "swoon",
+    "sword",
+    "sycophantic",
+    "syllable",
+    "syllables",
+    "sylph",
+    "sylvan",
+    "symbiosis",
+    "symbol",
+    "symbolize",
+    "symbols",
+    "symmetrical",
+    "symphony",
+    "symposium",
+    "synchronicity",
+    "synecdoche",
+    "synergy",
+    "syntactical",
+    "synthetic",
+    "system",
+    "syzygy",
+    "table",
+    "tableau",
+    "tableaux",
+    "taboo",
+    "tacenda",
+    "taciturn",
+    "taken",
+    "talisman",
+    "talkative",
+    "talker",
+    "talking",
+    "tapered",
+    "tapestry",
+    "tarnish",
+    "tasmanian",
+    "taste",
+    "tasteful",
+    "tawdry",
+    "teacher",
+    "teaching",
+    "tease",
+    "teasing",
+    "technical",
+    "technique",
+    "techniques",
+    "tedious",
+    "teleology",
+    "teller",
+    "tellurian",
+    "telos",
+    "tempo",
+    "temporary",
+    "temptation",
+    "tendency",
+    "tending",
+    "tenebrous",
+    "tenuous",
+    "tercet",
+    "terms",
+    "terpsichorean",
+    "terrestrial",
+    "territory",
+    "terse",
+    "tessellation",
+    "theater",
+    "their",
+    "theophany",
+    "theories",
+    "theory",
+    "thereof",
+    "thicket",
+    "thickness",
+    "thighs",
+    "thing",
+    "things",
+    "thinking",
+    "thionine",
+    "third",
+    "thoroughfare",
+    "though",
+    "thought",
+    "thoughts",
+    "thousand",
+    "threats",
+    "three",
+    "threnody",
+    "through",
+    "throughout",
+    "thumb",
+    "thunder",
+    "thylacine",
+    "tiger",
+    "tightly",
+    "times",
+    "timid",
+    "tinsel",
+    "tinted",
+    "tinting",
+    "tintinnabulation",
+    "tiramisu",
+    "tissue",
+    "together",
+    "token",
+    "tolutiloquent",
+    "tombs",
+    "tombstone",
+    "tones",
+    "tonics",
+    "topic",
+    "topics",
+    "torpor",
+    "torrential",
+    "torrents",
+    "total",
+    "touch",
+    "touching",
+    "tourmaline",
+    "towards",
+    "toxic",
+    "tract",
+    "trained",
+    "traipse",
+    "traitorous",
+    "tranquil",
+    "tranquility",
+    "tranquilizer",
+    "transform",
+    "transience",
+    "transient",
+    "translucent",
+    "translucently",
+    "transparent",
+    "treacherous",
+    "trees",
+    "tregetour",
+    "tremble",
+    "trembling",
+    "tremulous",
+    "trench",
+    "trends",
+    "trendsetter",
+    "tress",
+    "tresses",
+    "triangle",
+    "tribal",
+    "tribute",
+    "trickery",
+    "trifles",
+    "trifling",
+    "trill",
+    "trillium",
+    "trinity",
+    "trinket",
+    "trinkets",
+    "triple",
+    "triste",
+    "tristiloquy",
+    "trivial",
+    "tropical",
+    "trueness",
+    "trumpet",
+    "truth",
+    "tryst",
+    "tubular",
+    "tumult",
+    "turquoise",
+    "tusks",
+    "twenty",
+    "twilight",
+    "twirl",
+    "twist",
+    "twisting",
+    "typical",
+    "typically",
+    "typified",
+    "typify",
+    "ubiquitous",
+    "ultramarine",
+    "umbrage",
+    "umbrella",
+    "unassertive",
+    "unbroken",
+    "unclouded",
+    "unconquerable",
+    "unconsolidated",
+    "uncultivated",
+    "undergo",
+    "underground",
+    "understand",
+    "understatement",
+    "underworld",
+    "undesirable",
+    "undiffused",
+    "undistinguished",
+    "undomesticated",
+    "uneducated",
+    "unfriendly",
+    "unify",
+    "unimportant",
+    "uninteresting",
+    "uninterrupted",
+    "unique",
+    "unite",
+    "unity",
+    "universal",
+    "universe",
+    "unmarked",
+    "unmarried",
+    "unnecessary",
+    "unpleasant",
+    "unpredictable",
+    "unreal",
+    "unrelated",
+    "unsheathe",
+    "unstable",
+    "untouched",
+    "unusual",
+    "unusually",
+    "unyielding",
+    "upper",
+    "uppermost",
+    "upset",
+    "urbane",
+    "usage",
+    "useful",
+    "uselessness",
+    "using",
+    "usual",
+    "usually",
+    "utilizes",
+    "utilizing",
+    "utter",
+    "uttered",
+    "vaccinate",
+    "vaccine",
+    "vacillate",
+    "vacivity",
+    "vacuity",
+    "vacuum",
+    "vague",
+    "valance",
+    "valedictory",
+    "valiant",
+    "valley",
+    "valor",
+    "valuable",
+    "value",
+    "valued",
+    "valve",
+    "vanilla",
+    "vanillbean",
+    "vapid",
+    "varicolored",
+    "variety",
+    "various",
+    "varnish",
+    "vassal",
+    "vassals",
+    "vaticinate",
+    "vaudeville",
+    "vaulted",
+    "vavasor",
+    "vegetable",
+    "vegetables",
+    "vehement",
+    "vehicle",
+    "velleity",
+    "vellum",
+    "velvet",
+    "veneer",
+    "vengeful",
+    "venial",
+    "ventriloquist",
+    "veracity",
+    "veranda",
+    "verbiage",
+    "verdigris",
+    "verisimilitude",
+    "vernal",
+    "verse",
+    "verve",
+    "vesper",
+    "vespertine",
+    "vessel",
+    "vestibule",
+    "vestige",
+    "vestiges",
+    "vestigial",
+    "vestment",
+    "vesuviate",
+    "vetanda",
+    "vexation",
+    "vexed",
+    "vexing",
+    "vibrant",
+    "vibration",
+    "vicennial",
+    "viceroy",
+    "vicinity",
+    "vicious",
+    "vicissitudes",
+    "victory",
+    "victuals",
+    "videlicet",
+    "videpictions",
+    "viequal",
+    "vievaporation",
+    "vigesimal",
+    "vignette",
+    "vigor",
+    "villain",
+    "vincible",
+    "vines",
+    "vinyl",
+    "viola",
+    "violation",
+    "violet",
+    "violin",
+    "viral",
+    "viridian",
+    "virtuoso",
+    "virtuous",
+    "viscera",
+    "visceral",
+    "viscersomething",
+    "visible",
+    "vision",
+    "visions",
+    "visit",
+    "visiting",
+    "vista",
+    "visual",
+    "visurient",
+    "visympathetic",
+    "vitiate",
+    "vitreous",
+    "vivacity",
+    "vivid",
+    "vivify",
+    "vivisepulture",
+    "vivre",
+    "viwater",
+    "vocal",
+    "vociferous",
+    "voice",
+    "voiced",
+    "volcanic",
+    "volume",
+    "voluminous",
+    "voluntarily",
+    "vowel",
+    "vulgar",
+    "vulnerable",
+    "waiter",
+    "walking",
+    "walkway",
+    "walls",
+    "wander",
+    "wanton",
+    "wants",
+    "warble",
+    "warlock",
+    "washing",
+    "wasteland",
+    "water",
+    "watercolor",
+    "watercolors",
+    "waterpromaterial",
+    "waterway",
+    "watery",
+    "waver",
+    "wavering",
+    "weakly",
+    "weakness",
+    "wealth",
+    "weapon",
+    "weariness",
+    "wearing",
+    "weather",
+    "weaving",
+    "wedge",
+    "weevil",
+    "weight",
+    "whale",
+    "wheeled",
+    "where",
+    "wherein",
+    "whether",
+    "which",
+    "while",
+    "whilom",
+    "whimper",
+    "whimsical",
+    "whimsy",
+    "whisper",
+    "whispering",
+    "whistles",
+    "white",
+    "whiten",
+    "whites",
+    "whole",
+    "width",
+    "winceyette",
+    "winded",
+    "winding",
+    "winged",
+    "wings",
+    "winnow",
+    "wisdom",
+    "wisteria",
+    "witchcraft",
+    "withdraw",
+    "wither",
+    "withering",
+    "within",
+    "without",
+    "witty",
+    "wizard",
+    "woman",
+    "womanize",
+    "women",
+    "wonderful",
+    "wooded",
+    "wooden",
+    "woods",
+    "woody",
+    "words",
+    "world",
+    "worldly",
+    "wormwood",
+    "worse",
+    "worsen",
+    "worsening",
+    "worthless",
+    "worthy",
+    "woven",
+    "wrinkle",
+    "write",
+    "writing",
+    "written",
+    "wrong",
+    "wrongdoing",
+    "wyvern",
+    "xenodochial",
+    "xenoglossy",
+    "xysti",
+    "years",
+    "yellow",
+    "yellowish",
+    "young",
+    "zenith",
+    "zephyr",
+    "zircon",
+    "zitella",
+    "zyzzyva",
+]
@@ -0,0 +1,208 @@
+"""
+    Batched scatter: instead of one task (and one container) per element of
+    a scattered input, the elements are packed K per task and a loop runs
+    the tool on each of them inside the one container. The per-element
+    outputs are flattened back in order, so the workflow's outputs are
+    still out_shard-0, out_shard-1, ... as for a plain scatter.
+
+    From a workflow (see workshop2/6-scatter.md):
+
+        from batchscatter import batched_step
+
+        w.input("batchScript", File, value="tools/batchscatter.py")
+        out = batched_step(
+            w, "print", Echo(), "inp", w.list_of_strings, batch_size=100, script=w.batchScript
+        )
+        w.output("out", source=out)
+
+    This works for CommandTools whose scattered input is a String (or Int)
+    put on the command line, eg: genomic intervals, and whose output is
+    stdout. Tools with arguments, other outputs or inputs the loop can't
+    render (optional, Boolean, Array, or joined to their prefix) are
+    refused. The split step is this file's `split`:
+
+        python3 batchscatter.py split --size 100 [--outdir .] value1 value2 ...
+
+    which writes batch-00000.txt, batch-00001.txt, ... one value per line.
+"""
+
+import argparse
+import os
+import shlex
+
+BATCH_FORMAT = "batch-{:05d}.txt"
+OUTPUT_PREFIX = "out-"
+
+
+def split(values, size, outdir="."):
+    """
+    Writes values into files of at most size lines, returns their paths
+    """
+    if size < 1:
+        raise ValueError("The batch size must be at least 1")
+    os.makedirs(outdir, exist_ok=True)
+    paths = []
+    for start in range(0, len(values), size):
+        path = os.path.join(outdir, BATCH_FORMAT.format(len(paths)))
+        with open(path, "w") as f:
+            f.writelines(f"{value}\n" for value in values[start : start + size])
+        paths.append(path)
+    return paths
+
+
+def check_batchable(tool):
+    """
+    Raises for what the loop can't reproduce: only the base command and
+    inputs rendered as `[prefix] value` are passed on, and only stdout is
+    collected
+    """
+    from janis_core import Array, Boolean, Stdout
+
+    if tool.arguments():
+        raise Exception(f"{tool.id()} has arguments, which a batched scatter doesn't pass on")
+    for output in tool.outputs():
+        if not isinstance(output.output_type, Stdout):
+            raise Exception(
+                f"{tool.id()}.{output.id()} isn't stdout, only stdout is collected from "
+                "a batched scatter"
+            )
+    for tool_input in tool.inputs():
+        if isinstance(tool_input.input_type, (Boolean, Array)):
+            raise Exception(
+                f"{tool.id()}.{tool_input.id()} is a {tool_input.input_type.name()}, only "
+                "single values can be passed through a batched scatter"
+            )
+        if tool_input.prefix and tool_input.separate_value_from_prefix is False:
+            raise Exception(
+                f"{tool.id()}.{tool_input.id()} joins its value to its prefix, which a "
+                "batched scatter doesn't support"
+            )
+
+
+def loop_script(tool, scatter_on):
+    """
+    A POSIX sh script running tool once per line of the batch file ($1),
+    with the other inputs as the following positional parameters, writing
+    each element's stdout to out-000000, out-000001, ...
+    """
+    check_batchable(tool)
+    base_command = tool.base_command() or []
+    if isinstance(base_command, str):
+        base_command = [base_command]
+
+    words, others = [shlex.quote(c) for c in base_command], []
+    for tool_input in sorted(tool.inputs(), key=lambda i: i.position or 0):
+        if tool_input.id() == scatter_on:
+            value = '"$element"'
+        elif tool_input.input_type.optional:
+            raise Exception(
+                f"{tool.id()}.{tool_input.id()} is optional, only required inputs can be "
+                "passed through a batched scatter"
+            )
+        else:
+            others.append(tool_input)
+            value = f'"${{{len(others) + 1}}}"'
+        if tool_input.prefix:
+            words.append(shlex.quote(tool_input.prefix))
+        words.append(value)
+
+    script = (
+        "i=0\n"
+        'while IFS= read -r element; do\n'
+        # stdin is the batch file, so the tool mustn't read it
+        f'  {" ".join(words)} < /dev/null > "{OUTPUT_PREFIX}$(printf %06d $i)" || exit $?\n'
+        "  i=$((i + 1))\n"
+        'done < "$1"\n'
+    )
+    return script, others
+
+
+def batched(tool, scatter_on):
+    """
+    A CommandTool that runs tool on every element of a batch file
+    """
+    import janis_core as j
+
+    script, others = loop_script(tool, scatter_on)
+    inputs = [j.ToolInput("batch", j.File, position=2)]
+    for i, tool_input in enumerate(others):
+        inputs.append(j.ToolInput(tool_input.id(), tool_input.input_type, position=3 + i))
+
+    return j.CommandToolBuilder(
+        tool=f"{tool.tool()}_batched",
+        base_command=["sh", "-c"],
+        arguments=[
+            j.ToolArgument(script, position=0),
+            # $0 of the script
+            j.ToolArgument("batch", position=1),
+        ],
+        inputs=inputs,
+        outputs=[
+            j.ToolOutput(
+                "out", j.Array(j.File), glob=j.WildcardSelector(f"{OUTPUT_PREFIX}*")
+            )
+        ],
+        container=tool.container(),
+        version=tool.version(),
+    )
+
+
+def split_tool():
+    import janis_core as j
+
+    return j.CommandToolBuilder(
+        tool="batchsplit",
+        base_command=["python3"],
+        inputs=[
+            j.ToolInput("script", j.File, position=0, doc="tools/batchscatter.py"),
+            j.ToolInput("size", j.Int, prefix="--size", position=2),
+            j.ToolInput("values", j.Array(j.String), position=4),
+        ],
+        # values may start with a "-"
+        arguments=[j.ToolArgument("split", position=1), j.ToolArgument("--", position=3)],
+        outputs=[
+            # zero padded, so these sort in element order
+            j.ToolOutput("out", j.Array(j.File), glob=j.WildcardSelector("batch-*.txt"))
+        ],
+        container="python:3.7",
+        version="v0.1.0",
+    )
+
+
+def batched_step(w, identifier, tool, scatter_on, values, batch_size, script, **inputs):
+    """
+    Adds a batched scatter of tool over values (K = batch_size per task) to
+    w, script being a File source for this file. Returns the flattened
+    per-element outputs, to use as a source.
+    """
+    from janis_core.operators.standard import FlattenOperator
+
+    w.step(
+        f"{identifier}_batches",
+        split_tool()(script=script, size=batch_size, values=values),
+    )
+    batches = getattr(w, f"{identifier}_batches")
+    w.step(
+        identifier,
+        batched(tool, scatter_on)(batch=batches.out, **inputs),
+        scatter="batch",
+    )
+    return FlattenOperator(getattr(w, identifier).out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split values into batch files")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+    split_parser = subparsers.add_parser("split", help="Write the batch files")
+    split_parser.add_argument("--size", type=int, required=True)
+    split_parser.add_argument("--outdir", default=".")
+    split_parser.add_argument("values", nargs="+")
+    args = parser.parse_args()
+
+    for path in split(args.values, args.size, args.outdir):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
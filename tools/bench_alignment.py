@@ -0,0 +1,95 @@
+"""
+    Compare the three-step alignment (bwa mem > SAM, samtools view > BAM,
+    gatk SortSam) against the fused bwa mem | samtools sort stream, on the
+    workshop data: wall time and bytes written to disk for each.
+
+    Usage: python3 bench_alignment.py reference/hg38-brca1.fasta \\
+               data/BRCA1_R1.fastq.gz data/BRCA1_R2.fastq.gz [--threads 2]
+
+    Runs the same commands as tutorial1/final/alignment.py and
+    alignment_fused.py, so bwa, samtools and gatk need to be on the PATH.
+    Bytes written are counted from the kernel's block I/O accounting for the
+    child processes, and the files each version leaves behind are listed.
+"""
+
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+
+READ_GROUP = "@RG\\tID:NA12878\\tSM:NA12878\\tLB:NA12878\\tPL:ILLUMINA"
+
+
+def three_step(reference, r1, r2, threads):
+    bwa = f"bwa mem -t {threads} -R '{READ_GROUP}' {reference} {r1} {r2}"
+    return [
+        f"{bwa} > aligned.sam",
+        "samtools view -S -h -b aligned.sam > aligned.bam",
+        "gatk SortSam -I aligned.bam -O sorted.bam --SORT_ORDER coordinate "
+        "--CREATE_INDEX true --VALIDATION_STRINGENCY SILENT --MAX_RECORDS_IN_RAM 5000000",
+    ]
+
+
+def fused(reference, r1, r2, threads):
+    bwa = f"bwa mem -t {threads} -R '{READ_GROUP}' {reference} {r1} {r2}"
+    return [
+        f"set -o pipefail; {bwa} | samtools sort -@ {threads} -m 768M -o sorted.bam - "
+        "&& samtools index sorted.bam"
+    ]
+
+
+def run(commands, workdir):
+    """
+    Returns (seconds, bytes written, {file: size})
+    """
+    before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_oublock
+    start = time.perf_counter()
+    for command in commands:
+        subprocess.run(
+            command, shell=True, check=True, cwd=workdir, executable="/bin/bash",
+            stderr=subprocess.DEVNULL,
+        )
+    elapsed = time.perf_counter() - start
+    # ru_oublock counts 512 byte blocks
+    written = (resource.getrusage(resource.RUSAGE_CHILDREN).ru_oublock - before) * 512
+    files = {f: os.path.getsize(os.path.join(workdir, f)) for f in os.listdir(workdir)}
+    return elapsed, written, files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("reference")
+    parser.add_argument("r1")
+    parser.add_argument("r2")
+    parser.add_argument("--threads", type=int, default=2)
+    args = parser.parse_args()
+
+    missing = [t for t in ("bwa", "samtools", "gatk") if not shutil.which(t)]
+    if missing:
+        raise SystemExit(f"Needs {', '.join(missing)} on the PATH")
+    inputs = [os.path.abspath(p) for p in (args.reference, args.r1, args.r2)]
+
+    results = {}
+    for name, build in (("three-step", three_step), ("fused", fused)):
+        workdir = tempfile.mkdtemp(prefix=f"bench-alignment-{name}-")
+        try:
+            results[name] = run(build(*inputs, args.threads), workdir)
+        finally:
+            shutil.rmtree(workdir)
+
+    print(f"{'version':<12}{'wall (s)':>10}{'written (MB)':>14}{'files (MB)':>12}")
+    for name, (elapsed, written, files) in results.items():
+        print(
+            f"{name:<12}{elapsed:>10.1f}{written / 1e6:>14.1f}"
+            f"{sum(files.values()) / 1e6:>12.1f}"
+        )
+    for name, (_, _, files) in results.items():
+        listing = ", ".join(f"{f} ({size / 1e6:.1f}MB)" for f, size in sorted(files.items()))
+        print(f"{name}: {listing}")
+
+
+if __name__ == "__main__":
+    main()
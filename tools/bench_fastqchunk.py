@@ -0,0 +1,77 @@
+"""
+    Benchmark fastqchunk on the workshop reads, for plain gzip (streaming) and
+    BGZF (block-parallel) copies of the same FASTQs, across shard counts.
+
+    Usage: python3 bench_fastqchunk.py data/BRCA1_R1.fastq.gz data/BRCA1_R2.fastq.gz
+                                       [--copies 10] [--shards 1 2 4 8]
+
+    --copies concatenates the reads that many times so the run is long enough
+    to time; the BGZF copies are written here, no bgzip needed.
+"""
+
+import argparse
+import gzip
+import os
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+
+from fastqchunk import chunk_pair
+
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+
+def write_inputs(source, directory, copies):
+    with gzip.open(source, "rb") as f:
+        data = f.read() * copies
+    name = os.path.basename(source).replace(".fastq.gz", "")
+
+    plain = os.path.join(directory, f"{name}.gzip.fastq.gz")
+    with gzip.open(plain, "wb", compresslevel=6) as f:
+        f.write(data)
+
+    bgzf = os.path.join(directory, f"{name}.bgzf.fastq.gz")
+    with open(bgzf, "wb") as f:
+        # same framing as bgzip: <= 64KB blocks with a BC extra subfield
+        for i in range(0, len(data), 0xFF00):
+            block = data[i : i + 0xFF00]
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            payload = compressor.compress(block) + compressor.flush()
+            header = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00"
+            f.write(header + struct.pack("<H", len(payload) + 25))
+            f.write(payload + struct.pack("<II", zlib.crc32(block), len(block)))
+        f.write(BGZF_EOF)
+    return plain, bgzf
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("r1")
+    parser.add_argument("r2")
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-fastqchunk-")
+    try:
+        gz1, bgzf1 = write_inputs(args.r1, workdir, args.copies)
+        gz2, bgzf2 = write_inputs(args.r2, workdir, args.copies)
+
+        print(f"{'input':<8}{'shards':>8}{'pairs':>10}{'seconds':>10}")
+        for label, r1, r2 in (("gzip", gz1, gz2), ("bgzf", bgzf1, bgzf2)):
+            for shards in args.shards:
+                outdir = os.path.join(workdir, f"{label}-{shards}")
+                start = time.perf_counter()
+                counts = chunk_pair(r1, r2, shards, outdir=outdir, workers=args.workers)
+                elapsed = time.perf_counter() - start
+                print(f"{label:<8}{shards:>8}{sum(counts):>10}{elapsed:>10.2f}")
+                shutil.rmtree(outdir)
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+    Benchmark random region fetches from a reference: FastaReference (.fai +
+    mmap) against a naive full read and parse of the FASTA per fetch, which
+    is what a Python step without the accessor has to do.
+
+    Usage: python3 bench_reference.py reference/hg38-brca1.fasta [-n 1000] [--length 1000]
+"""
+
+import argparse
+import random
+import time
+
+from reference import FastaReference
+
+
+def naive_fetch(fasta, contig, start, end):
+    sequences, name = {}, None
+    with open(fasta) as f:
+        for line in f:
+            if line.startswith(">"):
+                name = line[1:].split()[0]
+                sequences[name] = []
+            else:
+                sequences[name].append(line.strip())
+    return "".join(sequences[contig])[start:end]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fasta")
+    parser.add_argument("-n", type=int, default=1000, help="Regions to fetch")
+    parser.add_argument("--length", type=int, default=1000, help="Region length")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with FastaReference(args.fasta) as reference:
+        contigs = list(reference.contigs.items())
+        regions = []
+        for _ in range(args.n):
+            contig, length = rng.choice(contigs)
+            start = rng.randrange(0, max(1, length - args.length))
+            regions.append((contig, start, min(length, start + args.length)))
+
+        start = time.perf_counter()
+        mapped = [reference.fetch(*region) for region in regions]
+        mmap_time = time.perf_counter() - start
+
+    # the naive version is far slower, so it only gets a sample of the regions
+    sample = regions[: max(1, args.n // 10)]
+    start = time.perf_counter()
+    naive = [naive_fetch(args.fasta, *region) for region in sample]
+    naive_time = (time.perf_counter() - start) / len(sample) * args.n
+
+    assert [s.encode() for s in naive] == mapped[: len(sample)], "sequences differ"
+
+    print(f"{'method':<14}{'us/fetch':>12}")
+    print(f"{'fai + mmap':<14}{mmap_time / args.n * 1e6:>12.1f}")
+    print(f"{'full read':<14}{naive_time / args.n * 1e6:>12.1f}")
+    print(f"speedup: {naive_time / mmap_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+    Benchmark sortsizing on synthetic inputs built from the workshop BRCA1
+    reads: for each size, the sampled read estimate against an exact count
+    (time and error), and the SortSam settings it picks compared to the
+    fixed maxRecordsInRam=5000000.
+
+    Usage: python3 bench_sortsizing.py data/BRCA1_R1.fastq.gz [--copies 1 4 16 64]
+                                       [--max-memory 32]
+
+    Each synthetic input is the reads repeated --copies times, gzipped in
+    independent members like a concatenation of lane files. The larger
+    sizes are then extrapolated by scaling the file (a 30X sample is ~400M
+    pairs), as the estimate only depends on the sampled bytes.
+"""
+
+import argparse
+import gzip
+import os
+import shutil
+import tempfile
+import time
+
+from sortsizing import SUPPLEMENTARY, estimate_reads, plan_sort
+
+FIXED_MAX_RECORDS = 5000000
+
+
+def exact_reads(path):
+    with gzip.open(path, "rb") as f:
+        return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b"")) // 4
+
+
+def write_copies(source, path, copies):
+    with gzip.open(source, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        for _ in range(copies):
+            f.write(gzip.compress(data, compresslevel=6))
+
+
+def describe(records, max_memory):
+    plan = plan_sort(records, max_memory)
+    fixed_spills = -(-records // FIXED_MAX_RECORDS) if records > FIXED_MAX_RECORDS else 0
+    return (
+        f"{records:>13}{plan['maxRecordsInRam']:>12}{plan['memory']:>7}"
+        f"{plan['spillFiles']:>7}{fixed_spills:>13}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fastq")
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--max-memory", type=int, default=32)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-sortsizing-")
+    try:
+        print(
+            f"{'copies':>7}{'MB':>8}{'reads':>10}{'estimate':>10}{'error':>8}"
+            f"{'sample (ms)':>13}{'count (ms)':>12}"
+        )
+        per_byte = None
+        for copies in args.copies:
+            path = os.path.join(workdir, f"x{copies}.fastq.gz")
+            write_copies(args.fastq, path, copies)
+
+            start = time.perf_counter()
+            estimate = estimate_reads(path)
+            sample_time = time.perf_counter() - start
+            start = time.perf_counter()
+            exact = exact_reads(path)
+            count_time = time.perf_counter() - start
+
+            size = os.path.getsize(path)
+            per_byte = estimate / size
+            print(
+                f"{copies:>7}{size / 1e6:>8.1f}{exact:>10}{estimate:>10}"
+                f"{(estimate - exact) / exact:>8.1%}"
+                f"{sample_time * 1e3:>13.1f}{count_time * 1e3:>12.1f}"
+            )
+    finally:
+        shutil.rmtree(workdir)
+
+    print()
+    print(f"SortSam settings for paired inputs of each size (--max-memory {args.max_memory}):")
+    print(
+        f"{'GB per FASTQ':>13}{'records':>13}{'inRam':>12}{'GB':>7}{'spills':>7}"
+        f"{'fixed spills':>13}"
+    )
+    for gb in (0.001, 0.01, 0.1, 1, 10, 40):
+        records = int(2 * gb * 1e9 * per_byte * SUPPLEMENTARY)
+        print(f"{gb:>13}{describe(records, args.max_memory)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+    End-to-end benchmark of the tutorial workflow: unpacks janis-data.tar,
+    builds alignmentWorkflow from tutorial1/final/alignment.py (relative
+    paths, so its inputs resolve in the unpacked data), translates it to CWL
+    and runs it with cwltool. Wall time, CPU time, peak RSS and bytes read
+    and written are recorded per step (bwamem, samtoolsview, sortsam) into
+    a JSON results file, and `compare` flags regressions between two.
+
+    Usage: python3 bench_workflow.py run [-o results.json] [--workflow tutorial1/final/alignment.py]
+                                         [--data janis-data.tar] [--keep DIR]
+           python3 bench_workflow.py compare baseline.json results.json [--threshold 0.1]
+
+    Steps run with --no-container, so their tools (bwa, samtools, gatk) are
+    found on the PATH: each step's executable is shadowed by a shim that
+    runs the real one and records its exit rusage against the step whose
+    base command the call matches (eg: samtools view vs samtools cat), so
+    every invocation is measured however short, with its final CPU time,
+    peak RSS and I/O.
+    Needs janis (janis-pipelines) and cwltool.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+# Metrics compared between results, and the change below which they're noise
+METRICS = {
+    "wall_seconds": 0.5,
+    "cpu_seconds": 0.5,
+    "peak_rss_bytes": 16 * 1024 * 1024,
+    "read_bytes": 1024 * 1024,
+    "write_bytes": 1024 * 1024,
+}
+
+
+def load_workflow(path):
+    spec = importlib.util.spec_from_file_location("benchmarked_workflow", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.w
+
+
+def step_commands(workflow):
+    """
+    {step id: base command}, with the executable's basename first
+    """
+    commands = {}
+    for step_id, step in workflow.step_nodes.items():
+        base_command = step.tool.base_command()
+        if isinstance(base_command, str):
+            base_command = base_command.split()
+        if base_command:
+            commands[step_id] = [os.path.basename(base_command[0]), *base_command[1:]]
+    return commands
+
+
+def match_step(steps, args):
+    """
+    The step of {step id: base command arguments} that a call with args
+    belongs to: the longest base command that args start with. Steps that
+    can't be told apart that way (the same base command, or a call none of
+    them make, eg: the samtools index after a samtools cat) share the
+    record, as "step1+step2".
+    """
+    matches = [s for s, base in steps.items() if args[: len(base)] == base]
+    if matches:
+        longest = max(len(steps[s]) for s in matches)
+        matches = [s for s in matches if len(steps[s]) == longest]
+    return "+".join(sorted(matches or steps))
+
+
+def write_shims(commands, directory, metrics):
+    """
+    Puts a shim for each step executable in directory: it runs the real
+    executable (as found on the PATH now) under this file's `exec`, which
+    picks the step by match_step and appends its exit rusage to metrics
+    """
+    executables = {}
+    for step, base_command in commands.items():
+        executables.setdefault(base_command[0], {})[step] = base_command[1:]
+    for exe, steps in executables.items():
+        real = shutil.which(exe)
+        if not real:
+            continue
+        shim = os.path.join(directory, exe)
+        with open(shim, "w") as f:
+            f.write(
+                "#!/bin/sh\n"
+                f"exec {shlex.quote(sys.executable)} {shlex.quote(os.path.abspath(__file__))} "
+                f"exec --steps {shlex.quote(json.dumps(steps))} --metrics {shlex.quote(metrics)} "
+                f'-- {shlex.quote(real)} "$@"\n'
+            )
+        os.chmod(shim, 0o755)
+
+
+def exec_step(step, metrics, argv):
+    """
+    Runs argv, appends its wall time and exit rusage (which includes the
+    descendants it waited for, eg: gatk's java) to metrics, returns its
+    exit code
+    """
+    start = time.time()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.execv(argv[0], argv)
+        finally:
+            os._exit(127)
+    _, status, usage = os.wait4(pid, 0)
+    end = time.time()
+    record = {
+        "step": step,
+        "start": start,
+        "end": end,
+        "cpu_seconds": usage.ru_utime + usage.ru_stime,
+        "peak_rss_bytes": usage.ru_maxrss * 1024,
+        # in 512 byte blocks, like the read_bytes and write_bytes of /proc/<pid>/io
+        "read_bytes": usage.ru_inblock * 512,
+        "write_bytes": usage.ru_oublock * 512,
+    }
+    with open(metrics, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    if os.WIFSIGNALED(status):
+        return 128 + os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def step_metrics(metrics):
+    """
+    {step: metrics}, summed over every invocation of the step's base command
+    (eg: per scattered shard) and timed from the first start to the last end
+    """
+    results = {}
+    with open(metrics) as f:
+        for line in f:
+            record = json.loads(line)
+            result = results.setdefault(
+                record["step"],
+                {"start": record["start"], "end": record["end"], **{m: 0 for m in METRICS}},
+            )
+            result["start"] = min(result["start"], record["start"])
+            result["end"] = max(result["end"], record["end"])
+            result["cpu_seconds"] += record["cpu_seconds"]
+            result["peak_rss_bytes"] = max(result["peak_rss_bytes"], record["peak_rss_bytes"])
+            result["read_bytes"] += record["read_bytes"]
+            result["write_bytes"] += record["write_bytes"]
+    for result in results.values():
+        result["wall_seconds"] = result.pop("end") - result.pop("start")
+    return results
+
+
+def run_wrapped(command, commands, cwd):
+    """
+    Runs command with each step's executable wrapped by a shim, returns
+    (wall seconds, {step: metrics})
+    """
+    shims = tempfile.mkdtemp(prefix="bench-workflow-shims-")
+    try:
+        metrics = os.path.join(shims, "metrics.jsonl")
+        open(metrics, "w").close()
+        write_shims(commands, shims, metrics)
+        env = dict(os.environ, PATH=shims + os.pathsep + os.environ.get("PATH", ""))
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, check=True)
+        wall = time.perf_counter() - start
+        return wall, step_metrics(metrics)
+    finally:
+        shutil.rmtree(shims)
+
+
+def run_benchmark(workflow_path, data, keep=None):
+    workdir = keep or tempfile.mkdtemp(prefix="bench-workflow-")
+    try:
+        with tarfile.open(data) as tar:
+            members = [m for m in tar if not os.path.basename(m.name).startswith("._")]
+            tar.extractall(workdir, members=members)
+
+        workflow = load_workflow(workflow_path)
+        # the inputs file lands in workdir, so the relative paths resolve there
+        workflow.translate("cwl", to_disk=True, export_path=workdir)
+        cwl = os.path.join(workdir, f"{workflow.id()}.cwl")
+        inputs = os.path.join(workdir, f"{workflow.id()}-inp.yml")
+
+        command = ["cwltool", "--no-container", "--outdir", "outputs", cwl, inputs]
+        wall, steps = run_wrapped(command, step_commands(workflow), workdir)
+    finally:
+        if not keep:
+            shutil.rmtree(workdir)
+
+    return {
+        "workflow": workflow.id(),
+        "source": workflow_path,
+        "engine": "cwltool",
+        "host": {"machine": platform.machine(), "cpus": os.cpu_count(), "node": platform.node()},
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "wall_seconds": wall,
+        "steps": steps,
+    }
+
+
+def compare(baseline, results, threshold):
+    """
+    Returns the regressions: metrics that grew by more than threshold (a
+    fraction), ignoring changes smaller than each metric's noise floor, and
+    steps of the baseline that didn't run at all
+    """
+    regressions = []
+    print(f"{'step':<16}{'metric':<16}{'baseline':>14}{'results':>14}{'change':>9}")
+    for step, metrics in sorted(baseline["steps"].items()):
+        if step not in results["steps"]:
+            print(f"{step:<16}missing from results  REGRESSION")
+            regressions.append((step, None, None))
+            continue
+        for metric, floor in METRICS.items():
+            before, after = metrics[metric], results["steps"][step][metric]
+            # from nothing (eg: a step that now writes) is always over threshold
+            if before:
+                change = (after - before) / before
+            else:
+                change = float("inf") if after > before else 0.0
+            flag = ""
+            if after - before > floor and change > threshold:
+                flag = "  REGRESSION"
+                regressions.append((step, metric, change))
+            print(f"{step:<16}{metric:<16}{before:>14.6g}{after:>14.6g}{change:>9.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    run_parser = subparsers.add_parser("run", help="Run and record the benchmark")
+    run_parser.add_argument(
+        "--workflow", default=os.path.join(root, "tutorial1", "final", "alignment.py")
+    )
+    run_parser.add_argument("--data", default=os.path.join(root, "janis-data.tar"))
+    run_parser.add_argument("-o", "--output", default="bench-results.json")
+    run_parser.add_argument("--keep", help="Run in (and keep) this directory")
+
+    compare_parser = subparsers.add_parser("compare", help="Flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Fractional increase that fails"
+    )
+
+    # used by the shims, see write_shims
+    exec_parser = subparsers.add_parser("exec")
+    exec_parser.add_argument("--steps", required=True, help="{step: base command arguments}")
+    exec_parser.add_argument("--metrics", required=True)
+    exec_parser.add_argument("argv", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args()
+
+    if args.command == "exec":
+        argv = args.argv[1:] if args.argv[:1] == ["--"] else args.argv
+        step = match_step(json.loads(args.steps), argv[1:])
+        sys.exit(exec_step(step, args.metrics, argv))
+
+    elif args.command == "run":
+        if not shutil.which("cwltool"):
+            raise SystemExit("Needs cwltool on the PATH")
+        results = run_benchmark(
+            os.path.abspath(args.workflow), os.path.abspath(args.data), args.keep
+        )
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        for step, metrics in sorted(results["steps"].items()):
+            print(
+                f"{step:<16}{metrics['wall_seconds']:>8.1f}s wall{metrics['cpu_seconds']:>8.1f}s cpu"
+                f"{metrics['peak_rss_bytes'] / 1e6:>8.0f}MB rss"
+            )
+        print(f"Wrote {args.output}")
+
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.results) as f:
+            results = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions over {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+"""
+    Call cache for workflow steps: a step is skipped and its previous
+    outputs linked back into place when its tool(), version(), resolved
+    container digest and the content of its inputs (and from the command
+    line, the command itself) all match an earlier call. So rerunning
+    alignment.py after adding a step at the end (eg: part1 -> part4 of the
+    workshop) doesn't run bwa mem and the sort again.
+
+    Input files are hashed by content (with their secondary files, eg: the
+    reference's .fai, .dict and bwa index), other inputs by value. Container
+    tags are resolved to a digest where docker or skopeo can, so a moved
+    tag (eg: :latest) isn't a hit. Outputs are stored once by SHA-256 and
+    linked back like tools/refcache.py does. Calls are evicted least
+    recently used first, down to a maximum size.
+
+    Usage: python3 callcache.py run --tool bwamem --version v0.7.17 \\
+               --container biocontainers/bwa:v0.7.17_cv1 \\
+               --input reference=reference/hg38-brca1.fasta \\
+               --input reads=data/BRCA1_R1.fastq.gz --input reads=data/BRCA1_R2.fastq.gz \\
+               --output out=aligned.sam -- sh -c "bwa mem ... > aligned.sam"
+           python3 callcache.py list
+           python3 callcache.py evict --max-size 20G
+
+    From Python, cached_call(cache, tool, inputs, run) does the same for a
+    janis tool (eg: BwaMemLatest()), taking secondary files from its input
+    types. The cache lives in $JANIS_CALLCACHE, or ~/.janis/callcache.
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+from refcache import CHUNK_SIZE, link_or_copy, parse_size
+
+KEY_VERSION = 2
+
+
+def default_cache_dir():
+    return os.environ.get(
+        "JANIS_CALLCACHE", os.path.join(os.path.expanduser("~"), ".janis", "callcache")
+    )
+
+
+def resolve_digest(container):
+    """
+    Returns container pinned to a digest (eg: image@sha256:...), or the
+    container unchanged if no local tool can resolve it
+    """
+    if "@sha256:" in container:
+        return container
+    if shutil.which("docker"):
+        result = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{json .RepoDigests}}", container],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+        if result.returncode == 0 and json.loads(result.stdout or "[]"):
+            return json.loads(result.stdout)[0]
+    if shutil.which("skopeo"):
+        result = subprocess.run(
+            ["skopeo", "inspect", "--format", "{{.Digest}}", f"docker://{container}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return f"{container.rsplit(':', 1)[0]}@{result.stdout.strip()}"
+    print(f"Warning: couldn't resolve a digest for {container}, keying on the tag",
+          file=sys.stderr)
+    return container
+
+
+def secondary_paths(path, suffixes):
+    """
+    Janis' secondary file convention: ".fai" is appended, "^.dict" replaces
+    the extension
+    """
+    paths = []
+    for suffix in suffixes:
+        if suffix.startswith("^"):
+            paths.append(os.path.splitext(path)[0] + suffix.lstrip("^"))
+        else:
+            paths.append(path + suffix)
+    return paths
+
+
+def file_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def hash_value(value, secondaries=()):
+    """
+    A JSON-able fingerprint of an input: files by content, lists
+    element-wise, everything else by value
+    """
+    if isinstance(value, (list, tuple)):
+        return [hash_value(v, secondaries) for v in value]
+    if isinstance(value, str) and os.path.isfile(value):
+        hashes = {"file": file_sha256(value)}
+        for path in secondary_paths(value, secondaries):
+            # a missing secondary is part of the key too
+            hashes[os.path.basename(path)] = (
+                file_sha256(path) if os.path.isfile(path) else None
+            )
+        return hashes
+    return {"value": value}
+
+
+def call_key(tool, version, container, inputs, secondaries=None, command=None):
+    """
+    inputs: {name: value}, secondaries: {input name: [suffixes]}, command:
+    the argv actually run, when it isn't fully determined by the rest (eg:
+    from the command line, where flags needn't be passed as inputs)
+    """
+    secondaries = secondaries or {}
+    fingerprint = {
+        "key_version": KEY_VERSION,
+        "tool": tool,
+        "version": version,
+        "container": resolve_digest(container) if container else None,
+        "command": command,
+        "inputs": {
+            name: hash_value(value, secondaries.get(name, ()))
+            for name, value in sorted(inputs.items())
+        },
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+
+def janis_call_key(tool, inputs):
+    """
+    call_key for a janis CommandTool instance, with the secondary files of
+    its input types
+    """
+    secondaries = {}
+    for tool_input in tool.inputs():
+        suffixes = tool_input.input_type.secondary_files()
+        if suffixes:
+            secondaries[tool_input.id()] = suffixes
+    return call_key(tool.tool(), tool.version(), tool.container(), inputs, secondaries)
+
+
+class CallCache:
+    def __init__(self, directory=None):
+        self.directory = directory or default_cache_dir()
+        self.objects = os.path.join(self.directory, "objects")
+        self.index_path = os.path.join(self.directory, "calls.json")
+        os.makedirs(self.objects, exist_ok=True)
+
+    @contextmanager
+    def _index(self):
+        """
+        Locked read-modify-write of the index, safe across concurrent runs
+        """
+        with open(os.path.join(self.directory, "lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            index = {"calls": {}}
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    index = json.load(f)
+            yield index
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(index, f, indent=2)
+            os.replace(tmp, self.index_path)
+
+    def object_path(self, sha256):
+        return os.path.join(self.objects, sha256[:2], sha256)
+
+    def _store_file(self, path):
+        digest = file_sha256(path)
+        destination = self.object_path(digest)
+        if not os.path.exists(destination):
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            tmp = f"{destination}.{os.getpid()}.tmp"
+            shutil.copyfile(path, tmp)
+            # read-only, as hardlinks share the cached inode
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp, destination)
+        return digest, os.path.getsize(path)
+
+    def store(self, key, outputs, tool=None):
+        """
+        outputs: {output name: path or [paths]}, all files
+        """
+        entry, size = {}, 0
+        for name, paths in outputs.items():
+            stored = []
+            for path in paths if isinstance(paths, (list, tuple)) else [paths]:
+                digest, file_size = self._store_file(path)
+                stored.append([digest, os.path.basename(path)])
+                size += file_size
+            entry[name] = stored if isinstance(paths, (list, tuple)) else stored[0]
+
+        with self._index() as index:
+            index["calls"][key] = {
+                "tool": tool,
+                "outputs": entry,
+                "size": size,
+                "last_used": time.time(),
+            }
+
+    def lookup(self, key, destination):
+        """
+        Links a cached call's outputs into destination, returns
+        {output name: path or [paths]}, or None on a miss
+        """
+        with self._index() as index:
+            call = index["calls"].get(key)
+            if call is None:
+                return None
+            call["last_used"] = time.time()
+
+        def restore(stored):
+            digest, basename = stored
+            path = os.path.join(destination, basename)
+            link_or_copy(self.object_path(digest), path)
+            return path
+
+        os.makedirs(destination, exist_ok=True)
+        outputs = {}
+        for name, stored in call["outputs"].items():
+            if stored and isinstance(stored[0], list):
+                outputs[name] = [restore(s) for s in stored]
+            else:
+                outputs[name] = restore(stored)
+        return outputs
+
+    def evict(self, max_size):
+        """
+        Removes the least recently used calls, and the objects only they
+        referenced, until the cache fits max_size. Returns the removed keys.
+        """
+        removed = []
+        with self._index() as index:
+            calls = index["calls"]
+
+            def digests(call):
+                for stored in call["outputs"].values():
+                    for digest, _ in stored if isinstance(stored[0], list) else [stored]:
+                        yield digest
+
+            sizes = {}
+            for call in calls.values():
+                for digest in digests(call):
+                    sizes.setdefault(digest, os.path.getsize(self.object_path(digest)))
+            total = sum(sizes.values())
+
+            for key in sorted(calls, key=lambda k: calls[k]["last_used"]):
+                if total <= max_size:
+                    break
+                call = calls.pop(key)
+                removed.append(key)
+                still_used = {d for c in calls.values() for d in digests(c)}
+                for digest in set(digests(call)) - still_used:
+                    if digest in sizes:
+                        os.remove(self.object_path(digest))
+                        total -= sizes.pop(digest)
+        return removed
+
+
+def cached_call(cache, tool, inputs, run, destination="."):
+    """
+    Runs a janis tool's step through the cache: run() is only called on a
+    miss, and returns its outputs as {output name: path or [paths]}.
+    Returns (outputs, whether it was a hit).
+    """
+    key = janis_call_key(tool, inputs)
+    outputs = cache.lookup(key, destination)
+    if outputs is not None:
+        return outputs, True
+    outputs = run()
+    cache.store(key, outputs, tool=tool.tool())
+    return outputs, False
+
+
+def parse_pairs(pairs):
+    values = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        values.setdefault(name, []).append(value)
+    # repeated names are array inputs
+    return {n: v[0] if len(v) == 1 else v for n, v in values.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Call cache for workflow steps")
+    parser.add_argument("--cache-dir", default=default_cache_dir())
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser("run", help="Run a step's command, unless cached")
+    run_parser.add_argument("--tool", required=True)
+    run_parser.add_argument("--version", required=True)
+    run_parser.add_argument("--container")
+    run_parser.add_argument(
+        "--input", action="append", default=[], help="name=value, repeat for arrays"
+    )
+    run_parser.add_argument(
+        "--secondaries", action="append", default=[], help="name=.fai, repeat per suffix"
+    )
+    run_parser.add_argument("--output", action="append", default=[], help="name=path, in one directory")
+    run_parser.add_argument("cmd", nargs=argparse.REMAINDER)
+
+    evict_parser = subparsers.add_parser("evict", help="LRU evict down to a size")
+    evict_parser.add_argument("--max-size", required=True, help="eg: 500M, 50G")
+
+    subparsers.add_parser("list", help="List cached calls")
+
+    args = parser.parse_args()
+    cache = CallCache(args.cache_dir)
+
+    if args.command == "run":
+        secondaries = {}
+        for pair in args.secondaries:
+            name, _, suffix = pair.partition("=")
+            secondaries.setdefault(name, []).append(suffix)
+        command = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+        key = call_key(
+            args.tool,
+            args.version,
+            args.container,
+            parse_pairs(args.input),
+            secondaries,
+            command=command,
+        )
+        outputs = parse_pairs(args.output)
+        destination = os.path.dirname(next(iter(outputs.values()), "")) or "."
+        if cache.lookup(key, destination) is not None:
+            print(f"{args.tool}: cached ({key[:12]})", file=sys.stderr)
+            return
+        for path in outputs.values():
+            # a previous hit may have left a hardlink into the cache here
+            if isinstance(path, str) and os.path.lexists(path):
+                os.remove(path)
+        subprocess.run(command, check=True)
+        cache.store(key, outputs, tool=args.tool)
+        print(f"{args.tool}: ran and cached ({key[:12]})", file=sys.stderr)
+
+    elif args.command == "evict":
+        removed = cache.evict(parse_size(args.max_size))
+        print(f"Evicted {len(removed)} calls")
+
+    else:
+        with cache._index() as index:
+            calls = index["calls"]
+            for key in sorted(calls, key=lambda k: calls[k]["last_used"]):
+                call = calls[key]
+                print(f"{key[:12]}  {call['size']:>12}  {call['tool']}")
+
+
+if __name__ == "__main__":
+    main()
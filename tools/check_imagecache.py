@@ -0,0 +1,190 @@
+"""
+    Check imagecache.py against local stand-ins: a registry that answers
+    manifest requests (behind an anonymous bearer token, like Docker Hub
+    and quay.io) and a converter that writes a fake SIF and logs each call.
+
+    Usage: python3 check_imagecache.py
+
+    Exits non-zero if any check fails.
+"""
+
+import hashlib
+import http.server
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+__dir = os.path.dirname(os.path.abspath(__file__))
+
+# "repository:tag" -> manifest, two tags of samtools share a digest
+MANIFESTS = {
+    "biocontainers/samtools:1.9": b"samtools manifest",
+    "biocontainers/samtools:latest": b"samtools manifest",
+    "ubuntu:18.04": b"ubuntu manifest",
+}
+TOKEN = "stand-in-token"
+CONVERTER = """\
+import os, sys, time
+output, image, log = sys.argv[1:]
+with open(log, "a") as f:
+    f.write(image + "\\n")
+# long enough for concurrent requests to overlap
+time.sleep(0.5)
+with open(output, "wb") as f:
+    f.write(os.urandom(100000))
+"""
+
+
+class RegistryHandler(http.server.BaseHTTPRequestHandler):
+    def do_HEAD(self):
+        if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+            realm = f"http://localhost:{self.server.server_address[1]}/token"
+            self.send_response(401)
+            self.send_header(
+                "WWW-Authenticate", f'Bearer realm="{realm}",service="stand-in"'
+            )
+            self.end_headers()
+            return
+        repository, _, tag = self.path[len("/v2/") :].rpartition("/manifests/")
+        manifest = MANIFESTS.get(f"{repository}:{tag}")
+        if manifest is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header(
+            "Docker-Content-Digest", "sha256:" + hashlib.sha256(manifest).hexdigest()
+        )
+        self.end_headers()
+
+    def do_GET(self):
+        body = json.dumps({"token": TOKEN}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def check(name, condition):
+    print(f"{'ok' if condition else 'FAILED':<8}{name}", flush=True)
+    return condition
+
+
+def main():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RegistryHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    registry = f"localhost:{server.server_address[1]}"
+    samtools, samtools_latest, ubuntu = (
+        f"{registry}/biocontainers/samtools:1.9",
+        f"{registry}/biocontainers/samtools:latest",
+        f"{registry}/ubuntu:18.04",
+    )
+
+    workdir = tempfile.mkdtemp(prefix="check-imagecache-")
+    container_dir = os.path.join(workdir, "containers")
+    log = os.path.join(workdir, "conversions.log")
+    converter = os.path.join(workdir, "convert.py")
+    with open(converter, "w") as f:
+        f.write(CONVERTER)
+    open(log, "w").close()
+
+    def imagecache(*args):
+        return subprocess.Popen(
+            [
+                sys.executable, os.path.join(__dir, "imagecache.py"),
+                "--container-dir", container_dir,
+                "--builder", f"{sys.executable} {converter} {{output}} {{image}} {log}",
+                *args,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+
+    def conversions():
+        with open(log) as f:
+            return f.read().splitlines()
+
+    results = []
+    try:
+        # separate processes, like concurrent workflow runs
+        runs = [imagecache("get", image) for image in [samtools, samtools_latest] * 2]
+        codes = [run.wait() for run in runs]
+        results.append(
+            check(
+                "4 concurrent gets of two tags of one digest convert once",
+                codes == [0] * 4
+                and len(conversions()) == 1
+                and "@sha256:" in conversions()[0],
+            )
+        )
+        results.append(
+            check(
+                "both tags are linked under janis' names",
+                all(
+                    os.path.isfile(os.path.join(container_dir, name))
+                    for name in [
+                        f"{registry.replace(':', '_')}_biocontainers_samtools_1.9.sif",
+                        f"{registry.replace(':', '_')}_biocontainers_samtools_latest.sif",
+                    ]
+                ),
+            )
+        )
+
+        workflow = os.path.join(workdir, "workflow.py")
+        with open(workflow, "w") as f:
+            # the shape of a janis workflow, as far as prefetch looks
+            f.write(
+                "class Tool:\n"
+                "    def __init__(self, container): self._container = container\n"
+                "    def container(self): return self._container\n"
+                "class Step:\n"
+                "    def __init__(self, tool): self.tool = tool\n"
+                "class Workflow:\n"
+                "    def __init__(self, *tools):\n"
+                "        self.step_nodes = {str(i): Step(t) for i, t in enumerate(tools)}\n"
+                f"w = Workflow(Tool({samtools!r}), "
+                f"Workflow(Tool({ubuntu!r}), Tool({samtools!r})))\n"
+            )
+        run = imagecache("prefetch", workflow)
+        run.wait()
+        results.append(
+            check(
+                "prefetch walks subworkflows and converts only the new image",
+                run.returncode == 0 and len(conversions()) == 2,
+            )
+        )
+
+        run = imagecache("evict", "--max-size", "150K")
+        run.wait()
+        names = sorted(n for n in os.listdir(container_dir) if n.endswith(".sif"))
+        results.append(
+            check(
+                "evict removes the least recently used image and its links",
+                run.returncode == 0
+                and names == [f"{registry.replace(':', '_')}_ubuntu_18.04.sif"],
+            )
+        )
+
+        run = imagecache("get", f"{registry}/nothing:1")
+        _, stderr = run.communicate()
+        results.append(
+            check("an unknown image fails", run.returncode != 0 and "HTTP 404" in stderr)
+        )
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir)
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
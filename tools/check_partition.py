@@ -0,0 +1,153 @@
+"""
+    Check partition.py by running its documented commands in a workshop
+    directory extracted from janis-data.tar, on a SAM of reads placed along
+    the reference (bwa isn't needed) plus some unmapped ones.
+
+    Usage: python3 check_partition.py [../janis-data.tar]
+
+    Exits non-zero if any check fails.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+from partition import read_bed, read_dict
+
+__dir = os.path.dirname(os.path.abspath(__file__))
+
+READS = 5000
+UNMAPPED = 50
+
+
+def write_sam(path, contigs):
+    """
+    Writes reads at random positions of the dict's contigs, returns their
+    (contig, 1-based position) by name
+    """
+    placed = {}
+    rng = random.Random(0)
+    with open(path, "w") as f:
+        f.write("@HD\tVN:1.6\n")
+        for name, length in contigs:
+            f.write(f"@SQ\tSN:{name}\tLN:{length}\n")
+        for i in range(READS):
+            name, length = rng.choice(contigs)
+            position = rng.randint(1, length)
+            placed[f"read{i}"] = (name, position)
+            f.write(f"read{i}\t0\t{name}\t{position}\t60\t10M\t*\t0\t0\tACGTACGTAC\t*\n")
+        for i in range(UNMAPPED):
+            f.write(f"unmapped{i}\t4\t*\t0\t0\t*\t*\t0\t0\tACGTACGTAC\t*\n")
+    return placed
+
+
+def read_partitions(directory):
+    """
+    Returns [[(read name, contig, position)]] in partition order
+    """
+    partitions = []
+    for name in sorted(os.listdir(directory)):
+        if not name.startswith("partition-"):
+            continue
+        with open(os.path.join(directory, name)) as f:
+            partitions.append(
+                [
+                    (fields[0], fields[2], int(fields[3]))
+                    for fields in (line.split("\t") for line in f if not line.startswith("@"))
+                ]
+            )
+    return partitions
+
+
+def check(name, condition):
+    print(f"{'ok' if condition else 'FAILED':<8}{name}", flush=True)
+    return condition
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("tar", nargs="?", default=os.path.join(__dir, "..", "janis-data.tar"))
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="check-partition-")
+    results = []
+    try:
+        with tarfile.open(args.tar) as tar:
+            tar.extractall(workdir)
+        contigs = read_dict(os.path.join(workdir, "reference", "hg38-brca1.dict"))
+        placed = write_sam(os.path.join(workdir, "aligned.sam"), contigs)
+
+        # the usage lines of partition.py, run from the workshop directory
+        commands = {
+            "--reference": [
+                "--reference", "reference/hg38-brca1.fasta", "--partitions", "4",
+            ],
+            "--bed": [
+                "--dict", "reference/hg38-brca1.dict", "--bed", "data/BRCA1.bed", "-n", "4",
+            ],
+        }
+        for option, arguments in commands.items():
+            outdir = os.path.join(workdir, option.strip("-"))
+            run = subprocess.run(
+                [
+                    sys.executable, os.path.join(__dir, "partition.py"), "aligned.sam",
+                    *arguments, "--outdir", outdir,
+                ],
+                cwd=workdir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+            )
+            results.append(check(f"partition.py {' '.join(arguments)}", run.returncode == 0))
+            if run.returncode:
+                print(run.stderr, file=sys.stderr)
+                continue
+
+            partitions = read_partitions(outdir)
+            reads = [read for partition in partitions for read in partition]
+            results.append(
+                check(
+                    f"{option}: 4 partitions and the unplaced reads, every read once",
+                    len(partitions) == 5
+                    and sorted(name for name, _, _ in reads)
+                    == sorted(list(placed) + [f"unmapped{i}" for i in range(UNMAPPED)]),
+                )
+            )
+            order = {name: i for i, (name, _) in enumerate(contigs)}
+            keys = [
+                [(order[contig], position) for _, contig, position in partition]
+                for partition in partitions[:-1]
+            ]
+            results.append(
+                check(
+                    f"{option}: the partitions are in genomic order",
+                    all(max(a) < min(b) for a, b in zip(keys, keys[1:]) if a and b)
+                    and all(contig == "*" for _, contig, _ in partitions[-1]),
+                )
+            )
+
+        # BRCA1.bed covers all but the first base of the slice, so the
+        # weighted partitions should be about as even as the plain ones
+        [(_, start, end)] = read_bed(os.path.join(workdir, "data", "BRCA1.bed"))
+        if os.path.isdir(os.path.join(workdir, "bed")):
+            sizes = [len(p) for p in read_partitions(os.path.join(workdir, "bed"))[:-1]]
+            results.append(
+                check(
+                    f"--bed: BRCA1's {end - start} bases spread evenly ({sizes} reads)",
+                    len(sizes) == 4 and max(sizes) - min(sizes) < READS // 10,
+                )
+            )
+    finally:
+        shutil.rmtree(workdir)
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+    Split a pair of gzipped FASTQs (eg: BRCA1_R1.fastq.gz / BRCA1_R2.fastq.gz)
+    into N record-aligned, pair-synchronised shards, so bwa mem can be
+    scattered across them.
+
+    BGZF inputs (as written by bgzip) are decompressed block-parallel, plain
+    gzip falls back to a streaming read. Records are dealt to the shards in
+    batches, round-robin, and R1/R2 read names are checked to stay in step.
+
+    Usage: python3 fastqchunk.py R1.fastq.gz R2.fastq.gz --shards 4 [--outdir .]
+
+    Writes shard-000_R1.fastq.gz, shard-000_R2.fastq.gz, shard-001_R1... so
+    the shards sort lexically in order.
+"""
+
+import argparse
+import gzip
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, zip_longest
+
+# records dealt to a shard at a time
+BATCH_SIZE = 1000
+# BGZF blocks decompressed per task (each is at most 64KB)
+BLOCKS_PER_TASK = 64
+
+
+def is_bgzf(path):
+    """
+    BGZF is gzip with an extra field holding the "BC" block size subfield
+    """
+    with open(path, "rb") as f:
+        header = f.read(18)
+    return (
+        len(header) == 18
+        and header[:4] == b"\x1f\x8b\x08\x04"
+        and header[12:14] == b"BC"
+        and struct.unpack("<H", header[14:16])[0] == 2
+    )
+
+
+def bgzf_blocks(f):
+    """
+    Yields the raw deflate payload of each BGZF block
+    """
+    while True:
+        header = f.read(12)
+        if not header:
+            return
+        if len(header) < 12 or header[:4] != b"\x1f\x8b\x08\x04":
+            raise Exception("Not a BGZF block")
+        xlen = struct.unpack("<H", header[10:12])[0]
+        extra = f.read(xlen)
+        block_size = None
+        i = 0
+        while i < xlen:
+            subfield, length = extra[i : i + 2], struct.unpack("<H", extra[i + 2 : i + 4])[0]
+            if subfield == b"BC":
+                block_size = struct.unpack("<H", extra[i + 4 : i + 6])[0] + 1
+            i += 4 + length
+        if block_size is None:
+            raise Exception("BGZF block without a BC subfield")
+        payload = f.read(block_size - 12 - xlen)
+        yield payload[:-8]
+
+
+def _inflate(payloads):
+    # zlib releases the GIL, so threads decompress in parallel
+    return b"".join(zlib.decompress(p, -15) for p in payloads)
+
+
+def bgzf_chunks(path, workers):
+    """
+    Yields the decompressed stream in order, decompressing ahead in parallel
+    """
+    with open(path, "rb") as f, ThreadPoolExecutor(max_workers=workers) as pool:
+        blocks = bgzf_blocks(f)
+        pending = []
+        while True:
+            # keep a bounded window of tasks in flight
+            while len(pending) < workers * 2:
+                batch = list(islice(blocks, BLOCKS_PER_TASK))
+                if not batch:
+                    break
+                pending.append(pool.submit(_inflate, batch))
+            if not pending:
+                return
+            yield pending.pop(0).result()
+
+
+def gzip_chunks(path, size=4 * 1024 * 1024):
+    with gzip.open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(size), b""):
+            yield chunk
+
+
+def read_batches(path, batch_size, workers=4):
+    """
+    Yields lists of lines holding batch_size whole FASTQ records (4 lines each)
+    """
+    chunks = bgzf_chunks(path, workers) if is_bgzf(path) else gzip_chunks(path)
+    size = 4 * batch_size
+
+    leftover, lines = b"", []
+    for chunk in chunks:
+        new_lines = (leftover + chunk).split(b"\n")
+        leftover = new_lines.pop()
+        lines.extend(new_lines)
+        start = 0
+        while len(lines) - start >= size:
+            yield lines[start : start + size]
+            start += size
+        lines = lines[start:]
+    if leftover:
+        lines.append(leftover)
+    if len(lines) % 4:
+        raise Exception(f"{path} ends with a truncated record")
+    if lines:
+        yield lines
+
+
+def read_name(header):
+    name = header.split()[0]
+    # older Illumina names end in /1 and /2
+    if name[-2:] in (b"/1", b"/2"):
+        name = name[:-2]
+    return name
+
+
+def check_in_step(batch1, batch2):
+    headers1, headers2 = batch1[0::4], batch2[0::4]
+    if headers1 == headers2:
+        return
+    for a, b in zip(headers1, headers2):
+        if read_name(a) != read_name(b):
+            raise Exception(
+                f"Reads out of step: {read_name(a).decode()} and {read_name(b).decode()}"
+            )
+
+
+def shard_paths(outdir, shard):
+    prefix = os.path.join(outdir, f"shard-{shard:03d}")
+    return prefix + "_R1.fastq.gz", prefix + "_R2.fastq.gz"
+
+
+def chunk_pair(
+    r1, r2, shards, outdir=".", workers=4, compresslevel=1, batch_size=BATCH_SIZE
+):
+    """
+    Returns the number of read pairs written to each shard
+    """
+    os.makedirs(outdir, exist_ok=True)
+    outputs = [
+        [gzip.open(p, "wb", compresslevel=compresslevel) for p in shard_paths(outdir, i)]
+        for i in range(shards)
+    ]
+    # one writer thread per shard: each shard's writes stay in order, and the
+    # shards compress in parallel
+    writers = [ThreadPoolExecutor(max_workers=1) for _ in range(shards)]
+    counts = [0] * shards
+
+    batches1 = read_batches(r1, batch_size, workers)
+    batches2 = read_batches(r2, batch_size, workers)
+    try:
+        shard, pending = 0, []
+        for batch1, batch2 in zip_longest(batches1, batches2):
+            if batch1 is None or batch2 is None or len(batch1) != len(batch2):
+                raise Exception(f"{r1} and {r2} have a different number of reads")
+            check_in_step(batch1, batch2)
+
+            out1, out2 = outputs[shard]
+            pending.append(writers[shard].submit(out1.write, b"\n".join(batch1) + b"\n"))
+            pending.append(writers[shard].submit(out2.write, b"\n".join(batch2) + b"\n"))
+            counts[shard] += len(batch1) // 4
+            shard = (shard + 1) % shards
+            # a bounded window of batches in flight, two per shard, so a slow
+            # compressor holds back the reader instead of buffering the input
+            while len(pending) > shards * 4:
+                pending.pop(0).result()
+        for future in pending:
+            future.result()
+    finally:
+        for writer in writers:
+            writer.shutdown()
+        for out1, out2 in outputs:
+            out1.close()
+            out2.close()
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split paired FASTQs into shards")
+    parser.add_argument("r1")
+    parser.add_argument("r2")
+    parser.add_argument("--shards", type=int, required=True)
+    parser.add_argument("--outdir", default=".")
+    parser.add_argument("--workers", type=int, default=4, help="BGZF decompression threads")
+    parser.add_argument("--compresslevel", type=int, default=1)
+    parser.add_argument(
+        "--batch-size", type=int, default=BATCH_SIZE, help="Reads dealt to a shard at once"
+    )
+    args = parser.parse_args()
+
+    counts = chunk_pair(
+        args.r1,
+        args.r2,
+        args.shards,
+        outdir=args.outdir,
+        workers=args.workers,
+        compresslevel=args.compresslevel,
+        batch_size=args.batch_size,
+    )
+    for i, count in enumerate(counts):
+        print(f"{shard_paths(args.outdir, i)[0]}\t{count} pairs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+    Shared Singularity image cache for a janis container_dir (eg: the one
+    `janis init spartan --container_dir` points at), so concurrent runs
+    don't race to convert the same Docker image to a SIF.
+
+    Images are resolved to their digest with the registry's HTTP API and
+    converted once per digest, under a per-digest file lock: concurrent
+    requests for the same image (or another tag of it) wait for the one
+    conversion and reuse it. The SIF is then linked in under the name
+    janis looks for, eg:
+        quay.io/biocontainers/samtools:1.9--h8571acd_11
+        -> quay.io_biocontainers_samtools_1.9--h8571acd_11.sif
+    Image layers are downloaded once into a shared Singularity cache, and
+    SIFs are evicted least recently used first, down to a maximum size.
+
+    Usage: python3 imagecache.py get quay.io/biocontainers/samtools:1.9--h8571acd_11
+           python3 imagecache.py prefetch tutorial1/final/alignment.py [--workers 4]
+           python3 imagecache.py evict --max-size 100G
+           python3 imagecache.py list
+
+    The container_dir is --container-dir, or $JANIS_CONTAINER_DIR.
+"""
+
+import argparse
+import fcntl
+import importlib.util
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from refcache import parse_size
+
+MANIFEST_TYPES = ", ".join(
+    [
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.index.v1+json",
+        "application/vnd.docker.distribution.manifest.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+    ]
+)
+DEFAULT_BUILDER = "singularity build {output} docker://{image}"
+
+
+def parse_reference(container):
+    """
+    "quay.io/biocontainers/samtools:1.9" -> (registry, repository, tag or digest)
+    """
+    name, reference = container, "latest"
+    if "@" in container:
+        name, reference = container.split("@", 1)
+    elif ":" in container.rsplit("/", 1)[-1]:
+        name, reference = container.rsplit(":", 1)
+
+    first, _, rest = name.partition("/")
+    if rest and ("." in first or ":" in first or first == "localhost"):
+        registry, repository = first, rest
+    else:
+        registry, repository = "registry-1.docker.io", name
+        if "/" not in repository:
+            repository = "library/" + repository
+    return registry, repository, reference
+
+
+def image_name(container):
+    # how janis' singularity templates name an image in container_dir
+    return re.sub(r"[^A-Za-z0-9._-]", "_", container) + ".sif"
+
+
+def _bearer_token(challenge):
+    """
+    Anonymous token for a `WWW-Authenticate: Bearer realm=...` challenge
+    """
+    params = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+    realm = params.pop("realm")
+    with urllib.request.urlopen(f"{realm}?{urllib.parse.urlencode(params)}") as response:
+        body = json.load(response)
+    return body.get("token") or body.get("access_token")
+
+
+def resolve_digest(container):
+    registry, repository, reference = parse_reference(container)
+    if reference.startswith("sha256:"):
+        return reference
+    # like docker, plain http for a registry on this machine
+    local = registry.split(":")[0] in ("localhost", "127.0.0.1")
+    url = f"{'http' if local else 'https'}://{registry}/v2/{repository}/manifests/{reference}"
+
+    headers = {"Accept": MANIFEST_TYPES}
+    for attempt in range(2):
+        request = urllib.request.Request(url, method="HEAD", headers=headers)
+        try:
+            with urllib.request.urlopen(request) as response:
+                digest = response.headers["Docker-Content-Digest"]
+                if not digest:
+                    raise Exception(f"{registry} didn't return a digest for {container}")
+                return digest
+        except urllib.error.HTTPError as e:
+            challenge = e.headers.get("WWW-Authenticate", "")
+            if e.code != 401 or attempt or not challenge.startswith("Bearer"):
+                raise Exception(f"Couldn't resolve {container}: HTTP {e.code}")
+            headers["Authorization"] = f"Bearer {_bearer_token(challenge)}"
+
+
+def pinned(container, digest):
+    name = container.split("@", 1)[0]
+    if ":" in name.rsplit("/", 1)[-1]:
+        name = name.rsplit(":", 1)[0]
+    return f"{name}@{digest}"
+
+
+class ImageCache:
+    def __init__(self, container_dir, builder=DEFAULT_BUILDER):
+        self.container_dir = container_dir
+        self.directory = os.path.join(container_dir, ".imagecache")
+        self.sifs = os.path.join(self.directory, "sif")
+        self.locks = os.path.join(self.directory, "locks")
+        # shared layer cache, so images with common layers download them once
+        self.layers = os.path.join(self.directory, "layers")
+        self.index_path = os.path.join(self.directory, "index.json")
+        self.builder = builder
+        for directory in (self.sifs, self.locks, self.layers):
+            os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def _index(self):
+        """
+        Locked read-modify-write of the index, safe across concurrent runs
+        """
+        with open(os.path.join(self.directory, "lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            index = {"images": {}}
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    index = json.load(f)
+            yield index
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(index, f, indent=2)
+            os.replace(tmp, self.index_path)
+
+    def sif_path(self, digest):
+        return os.path.join(self.sifs, digest.replace(":", "-") + ".sif")
+
+    def _lock_path(self, digest):
+        return os.path.join(self.locks, digest.replace(":", "-") + ".lock")
+
+    def _convert(self, container, digest):
+        output = self.sif_path(digest)
+        tmp = f"{output}.{os.getpid()}.tmp"
+        command = [
+            arg.format(output=tmp, image=pinned(container, digest))
+            for arg in shlex.split(self.builder)
+        ]
+        env = dict(os.environ, SINGULARITY_CACHEDIR=self.layers, APPTAINER_CACHEDIR=self.layers)
+        try:
+            subprocess.run(command, check=True, env=env)
+            os.replace(tmp, output)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def get(self, container):
+        """
+        Returns the path janis uses for container, converting it first if
+        no image with its digest is cached yet
+        """
+        digest = resolve_digest(container)
+        sif = self.sif_path(digest)
+        converted = False
+        with open(self._lock_path(digest), "w") as lock:
+            # waits for a conversion of the same digest by any other run
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if not os.path.exists(sif):
+                self._convert(container, digest)
+                converted = True
+
+            path = os.path.join(self.container_dir, image_name(container))
+            tmp = f"{path}.{os.getpid()}.tmp"
+            os.symlink(os.path.relpath(sif, self.container_dir), tmp)
+            os.replace(tmp, path)
+
+            with self._index() as index:
+                image = index["images"].setdefault(digest, {"names": []})
+                image["size"] = os.path.getsize(sif)
+                image["last_used"] = time.time()
+                if image_name(container) not in image["names"]:
+                    image["names"].append(image_name(container))
+        return path, converted
+
+    def evict(self, max_size):
+        """
+        Removes the least recently used images until the cache fits
+        max_size, skipping any being converted. Returns the removed digests.
+        """
+        removed = []
+        with self._index() as index:
+            images = index["images"]
+            total = sum(image["size"] for image in images.values())
+            for digest in sorted(images, key=lambda d: images[d]["last_used"]):
+                if total <= max_size:
+                    break
+                with open(self._lock_path(digest), "w") as lock:
+                    try:
+                        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        continue
+                    image = images.pop(digest)
+                    for name in image["names"]:
+                        path = os.path.join(self.container_dir, name)
+                        # only the links into the cache, never someone's own file
+                        if os.path.islink(path) and os.readlink(path).endswith(
+                            os.path.basename(self.sif_path(digest))
+                        ):
+                            os.remove(path)
+                    if os.path.exists(self.sif_path(digest)):
+                        os.remove(self.sif_path(digest))
+                total -= image["size"]
+                removed.append(digest)
+        return removed
+
+
+def workflow_containers(path):
+    """
+    The container() of every tool in the workflow `w` defined in path,
+    including subworkflows
+    """
+    spec = importlib.util.spec_from_file_location("prefetched_workflow", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    containers, stack = set(), [module.w]
+    while stack:
+        tool = stack.pop()
+        if hasattr(tool, "step_nodes"):
+            stack.extend(step.tool for step in tool.step_nodes.values())
+        elif tool.container():
+            containers.add(tool.container())
+    return sorted(containers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared Singularity image cache")
+    parser.add_argument("--container-dir", default=os.environ.get("JANIS_CONTAINER_DIR"))
+    parser.add_argument(
+        "--builder",
+        default=DEFAULT_BUILDER,
+        help="Conversion command, with {output} and {image}, eg: apptainer build ...",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    get_parser = subparsers.add_parser("get", help="Convert (or reuse) images")
+    get_parser.add_argument("containers", nargs="+")
+
+    prefetch_parser = subparsers.add_parser("prefetch", help="Get a workflow's images")
+    prefetch_parser.add_argument("workflow", help="eg: tutorial1/final/alignment.py")
+    prefetch_parser.add_argument("--workers", type=int, default=4)
+
+    evict_parser = subparsers.add_parser("evict", help="LRU evict down to a size")
+    evict_parser.add_argument("--max-size", required=True, help="eg: 500M, 100G")
+
+    subparsers.add_parser("list", help="List cached images")
+
+    args = parser.parse_args()
+    if not args.container_dir:
+        parser.error("--container-dir (or $JANIS_CONTAINER_DIR) is required")
+    builder_executable = shlex.split(args.builder)[0]
+    if args.command in ("get", "prefetch") and not shutil.which(builder_executable):
+        raise SystemExit(f"{builder_executable} isn't on the PATH, see --builder")
+    cache = ImageCache(args.container_dir, args.builder)
+
+    if args.command in ("get", "prefetch"):
+        if args.command == "get":
+            containers, workers = args.containers, 1
+        else:
+            containers, workers = workflow_containers(args.workflow), args.workers
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for container, (path, converted) in zip(
+                    containers, pool.map(cache.get, containers)
+                ):
+                    print(f"{'converted' if converted else 'cached':<10}{container}  {path}")
+        except Exception as e:
+            raise SystemExit(str(e))
+
+    elif args.command == "evict":
+        removed = cache.evict(parse_size(args.max_size))
+        print(f"Evicted {len(removed)} images")
+
+    else:
+        with cache._index() as index:
+            images = index["images"]
+            for digest in sorted(images, key=lambda d: images[d]["last_used"]):
+                image = images[digest]
+                print(f"{digest[:19]}  {image['size']:>12}  {', '.join(image['names'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+    Split an aligned, unsorted SAM (eg: bwa mem's output) into N partitions
+    by genomic position, so each partition can be sorted on its own and the
+    sorted partitions concatenated in order (samtools cat) into one
+    coordinate sorted BAM, instead of one monolithic SortSam.
+
+    Partition boundaries come from the reference's .dict (contig order and
+    lengths), splitting the genome into N spans of about the same number of
+    bases. With --bed, the spans are weighted by the bases of the BED
+    regions instead, eg: BRCA1.bed, so the targeted regions are spread over
+    the partitions. BED coordinates on a whole chromosome are moved onto
+    the dict's slices of it, like hg38-brca1's 17:43044045-43125733 (cut
+    out with samtools faidx). Either way every read lands in exactly one partition, by
+    its start position, and reads without a position go in an extra, last
+    partition (like the unmapped reads at the end of a sorted BAM).
+
+    Usage: python3 partition.py aligned.sam --reference reference/hg38-brca1.fasta --partitions 4
+           python3 partition.py aligned.sam --dict reference/hg38-brca1.dict \\
+               --bed data/BRCA1.bed -n 4
+
+    Writes partition-000.sam ... partition-00N.sam, so they sort lexically
+    in order.
+"""
+
+import argparse
+import os
+from bisect import bisect_right
+
+
+def read_dict(path):
+    """
+    Returns [(contig, length)] in the order of the @SQ lines
+    """
+    contigs = []
+    with open(path) as f:
+        for line in f:
+            if not line.startswith("@SQ"):
+                continue
+            fields = dict(field.split(":", 1) for field in line.rstrip("\n").split("\t")[1:])
+            contigs.append((fields["SN"], int(fields["LN"])))
+    return contigs
+
+
+def read_bed(path):
+    regions = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip() or line.startswith(("#", "track", "browser")):
+                continue
+            contig, start, end = line.split("\t")[:3]
+            regions.append((contig, int(start), int(end)))
+    return regions
+
+
+def parse_slice(name):
+    """
+    "17:43044045-43125733" (a samtools faidx region, 1-based inclusive) ->
+    ("17", 43044044, 43125733), 0-based half-open, or None for a plain name
+    """
+    contig, _, span = name.rpartition(":")
+    start, _, end = span.partition("-")
+    if not contig or not start.isdigit() or not end.isdigit():
+        return None
+    return contig, int(start) - 1, int(end)
+
+
+def regions_on_dict(contigs, regions):
+    """
+    Moves regions on a chromosome the dict only has slices of onto those
+    slices, offset by their start and clipped to them. Regions on contigs
+    in the dict are unchanged.
+    """
+    names = {name for name, _ in contigs}
+    slices = {}
+    for name, _ in contigs:
+        parsed = parse_slice(name)
+        if parsed:
+            slices.setdefault(parsed[0], []).append((name, parsed[1], parsed[2]))
+
+    moved = []
+    for contig, start, end in regions:
+        if contig in names or contig not in slices:
+            moved.append((contig, start, end))
+            continue
+        for name, slice_start, slice_end in slices[contig]:
+            overlap_start, overlap_end = max(start, slice_start), min(end, slice_end)
+            if overlap_start < overlap_end:
+                moved.append((name, overlap_start - slice_start, overlap_end - slice_start))
+    return moved
+
+
+def plan_partitions(contigs, n, regions=None):
+    """
+    Returns the n partition start points as (contig index, 0-based position),
+    the first being (0, 0). Partition i covers [starts[i], starts[i + 1]).
+    """
+    order = {name: i for i, (name, _) in enumerate(contigs)}
+    if regions is None:
+        regions = [(name, 0, length) for name, length in contigs]
+    regions = regions_on_dict(contigs, regions)
+    if not regions:
+        raise Exception("None of the regions overlap the dict's contigs")
+    missing = sorted({contig for contig, _, _ in regions if contig not in order})
+    if missing:
+        raise Exception(f"Regions on contigs that aren't in the dict: {', '.join(missing)}")
+    regions = sorted((order[contig], start, end) for contig, start, end in regions)
+
+    total = sum(end - start for _, start, end in regions)
+    starts, covered = [(0, 0)], 0
+    for index, start, end in regions:
+        # cut wherever a multiple of total / n falls inside this region
+        while len(starts) < n:
+            cut = total * len(starts) // n - covered
+            if cut >= end - start:
+                break
+            starts.append((index, start + cut))
+        covered += end - start
+    # dedupe cuts that landed on the same base (tiny regions, large n)
+    return sorted(set(starts))
+
+
+def partition_sam(sam, contigs, starts, outdir="."):
+    """
+    Returns the number of reads written to each partition, the last one
+    holding the reads without a position
+    """
+    order = {name: i for i, (name, _) in enumerate(contigs)}
+    os.makedirs(outdir, exist_ok=True)
+    paths = [os.path.join(outdir, f"partition-{i:03d}.sam") for i in range(len(starts) + 1)]
+    outputs = [open(p, "w") for p in paths]
+    counts = [0] * len(outputs)
+    unplaced = len(outputs) - 1
+
+    try:
+        with open(sam) as f:
+            for line in f:
+                if line.startswith("@"):
+                    for out in outputs:
+                        out.write(line)
+                    continue
+                fields = line.split("\t", 4)
+                contig, position = fields[2], int(fields[3])
+                if contig == "*" or position == 0:
+                    i = unplaced
+                else:
+                    # SAM positions are 1-based
+                    i = bisect_right(starts, (order[contig], position - 1)) - 1
+                outputs[i].write(line)
+                counts[i] += 1
+    finally:
+        for out in outputs:
+            out.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partition a SAM by genomic position")
+    parser.add_argument("sam")
+    parser.add_argument("-n", "--partitions", type=int, required=True)
+    parser.add_argument("--dict", help="Sequence dictionary, default: next to --reference")
+    parser.add_argument("--reference", help="FASTA with a .dict alongside")
+    parser.add_argument("--bed", help="Weight the partitions by these regions")
+    parser.add_argument("--outdir", default=".")
+    args = parser.parse_args()
+
+    if not args.dict and not args.reference:
+        parser.error("one of --dict or --reference is required")
+    dict_path = args.dict or os.path.splitext(args.reference)[0] + ".dict"
+    contigs = read_dict(dict_path)
+    regions = read_bed(args.bed) if args.bed else None
+
+    starts = plan_partitions(contigs, args.partitions, regions)
+    counts = partition_sam(args.sam, contigs, starts, args.outdir)
+    for i, count in enumerate(counts):
+        start = f"{contigs[starts[i][0]][0]}:{starts[i][1] + 1}" if i < len(starts) else "*"
+        print(f"partition-{i:03d}.sam\t{start}\t{count} reads")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+    Content-addressed cache for reference and index files, shared between
+    runs so the same hg38-brca1.fasta (and its .bwt/.sa/.pac/.ann/.amb/.fai
+    and .dict) isn't copied into every execution directory again.
+
+    Files are stored once by SHA-256 and linked into place: a reflink where
+    the filesystem supports it, otherwise a hardlink (cached files are made
+    read-only) and only as a last resort a copy. The cache is evicted least
+    recently used first, down to a maximum size, a whole reference set (a
+    fasta with its indexes) at a time so a link never gets part of one.
+
+    Usage: python3 refcache.py prewarm janis-data.tar [--roles reference index]
+           python3 refcache.py add reference/hg38-brca1.fasta*
+           python3 refcache.py link reference/hg38-brca1 part1/
+           python3 refcache.py evict --max-size 50G
+           python3 refcache.py list
+
+    The cache lives in $JANIS_REFCACHE, or ~/.janis/refcache.
+"""
+
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tarfile
+import time
+from contextlib import contextmanager
+
+CHUNK_SIZE = 1024 * 1024
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# The roles of the files in janis-data.tar that are worth caching
+SUFFIX_ROLES = {
+    ".fasta": "reference",
+    ".fai": "reference",
+    ".dict": "reference",
+    ".amb": "index",
+    ".ann": "index",
+    ".bwt": "index",
+    ".pac": "index",
+    ".sa": "index",
+}
+
+
+def default_cache_dir():
+    return os.environ.get(
+        "JANIS_REFCACHE", os.path.join(os.path.expanduser("~"), ".janis", "refcache")
+    )
+
+
+def parse_size(value):
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    value = value.strip().upper().rstrip("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def cache_name(path):
+    """
+    The name path is cached under: relative to the working directory, or
+    the basename for a file outside of it, so it can always be linked
+    into a destination
+    """
+    name = os.path.relpath(path)
+    if name == ".." or name.startswith(".." + os.sep):
+        return os.path.basename(os.path.normpath(path))
+    return name
+
+
+def group_of(name):
+    """
+    The reference set name belongs to, eg: reference/hg38-brca1.fasta.bwt
+    -> reference/hg38-brca1
+    """
+    directory, basename = os.path.split(name)
+    return os.path.join(directory, basename.split(".", 1)[0])
+
+
+def safe_path(destination, name):
+    path = os.path.normpath(os.path.join(destination, name))
+    if os.path.isabs(name) or not path.startswith(os.path.abspath(destination) + os.sep):
+        raise Exception(f"Refusing to link {name} outside of {destination}")
+    return path
+
+
+def link_or_copy(source, destination):
+    """
+    Returns how destination was made: "reflink", "hardlink" or "copy"
+    """
+    tmp = f"{destination}.{os.getpid()}.tmp"
+    try:
+        with open(source, "rb") as src, open(tmp, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        method = "reflink"
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        try:
+            os.link(source, tmp)
+            method = "hardlink"
+        except OSError:
+            shutil.copyfile(source, tmp)
+            method = "copy"
+    os.replace(tmp, destination)
+    return method
+
+
+class RefCache:
+    def __init__(self, directory=None):
+        self.directory = directory or default_cache_dir()
+        self.objects = os.path.join(self.directory, "objects")
+        self.index_path = os.path.join(self.directory, "index.json")
+        os.makedirs(self.objects, exist_ok=True)
+
+    @contextmanager
+    def _index(self):
+        """
+        Locked read-modify-write of the index, safe across concurrent runs
+        """
+        with open(os.path.join(self.directory, "lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            index = {"objects": {}, "names": {}}
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    index = json.load(f)
+            yield index
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(index, f, indent=2)
+            os.replace(tmp, self.index_path)
+
+    def object_path(self, sha256):
+        return os.path.join(self.objects, sha256[:2], sha256)
+
+    def _store(self, stream, name):
+        """
+        Hash stream while writing it into the cache, returns its sha256
+        """
+        tmp = os.path.join(self.objects, f".incoming.{os.getpid()}.{time.time_ns()}")
+        sha256, size = hashlib.sha256(), 0
+        with open(tmp, "wb") as f:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                sha256.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+        digest = sha256.hexdigest()
+
+        path = self.object_path(digest)
+        with self._index() as index:
+            if os.path.exists(path):
+                os.remove(tmp)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # read-only, as hardlinks share the cached inode
+                os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                os.replace(tmp, path)
+            index["objects"][digest] = {"size": size, "last_used": time.time()}
+            index["names"][name] = digest
+        return digest
+
+    def add(self, path, name=None):
+        with open(path, "rb") as f:
+            return self._store(f, name or cache_name(path))
+
+    def prewarm(self, tar_path, roles=("reference", "index")):
+        """
+        Caches the members of a data tar (eg: janis-data.tar) by role
+        """
+        added = {}
+        with tarfile.open(tar_path) as tar:
+            for member in tar:
+                name = member.name
+                role = SUFFIX_ROLES.get(os.path.splitext(name)[1])
+                if not member.isfile() or os.path.basename(name).startswith("._"):
+                    continue
+                if role not in roles:
+                    continue
+                added[name] = self._store(tar.extractfile(member), name)
+        return added
+
+    def link(self, prefix, destination):
+        """
+        Links prefix and every cached name starting with prefix + "." into
+        destination, keeping its relative path, eg: reference/hg38-brca1
+        links the fasta, its bwa index, .fai and .dict (but not those of
+        reference/hg38-brca10). Returns {name: method}.
+        """
+        destination = os.path.abspath(destination)
+        with self._index() as index:
+            names = {
+                n: s
+                for n, s in index["names"].items()
+                if n == prefix or n.startswith(prefix + ".")
+            }
+            for digest in set(names.values()):
+                index["objects"][digest]["last_used"] = time.time()
+            missing = [n for n, s in names.items() if not os.path.exists(self.object_path(s))]
+            if missing:
+                raise Exception(f"Cached files are missing: {', '.join(sorted(missing))}")
+
+        linked = {}
+        for name, digest in names.items():
+            path = safe_path(destination, name)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            linked[name] = link_or_copy(self.object_path(digest), path)
+        return linked
+
+    def evict(self, max_size):
+        """
+        Removes the least recently used reference sets (see group_of) until
+        the cache fits max_size, returns the removed objects
+        """
+        removed = []
+        with self._index() as index:
+            objects, names = index["objects"], index["names"]
+            groups = {}
+            for name, digest in names.items():
+                groups.setdefault(group_of(name), set()).add(digest)
+            # objects no name refers to any more (a re-added file's old content) go first
+            groups[""] = set(objects) - set(names.values())
+
+            def last_used(group):
+                if not group:
+                    return 0
+                return max((objects[d]["last_used"] for d in groups[group]), default=0)
+
+            total = sum(o["size"] for o in objects.values())
+            for group in sorted(groups, key=last_used):
+                if total <= max_size:
+                    break
+                names = {n: d for n, d in names.items() if group_of(n) != group}
+                # the same content can be cached under another set's name too
+                for digest in groups[group] - set(names.values()):
+                    # existing hardlinks in execution directories keep their data
+                    os.remove(self.object_path(digest))
+                    total -= objects.pop(digest)["size"]
+                    removed.append(digest)
+            index["names"] = {n: d for n, d in names.items() if d in objects}
+        return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed reference cache")
+    parser.add_argument("--cache-dir", default=default_cache_dir())
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    prewarm_parser = subparsers.add_parser("prewarm", help="Cache files from a data tar")
+    prewarm_parser.add_argument("tar")
+    prewarm_parser.add_argument("--roles", nargs="+", default=["reference", "index"])
+
+    add_parser = subparsers.add_parser("add", help="Cache files, named by their path")
+    add_parser.add_argument("files", nargs="+")
+
+    link_parser = subparsers.add_parser("link", help="Link cached files into a directory")
+    link_parser.add_argument("prefix", help="eg: reference/hg38-brca1")
+    link_parser.add_argument("destination")
+
+    evict_parser = subparsers.add_parser("evict", help="LRU evict down to a size")
+    evict_parser.add_argument("--max-size", required=True, help="eg: 500M, 50G")
+
+    subparsers.add_parser("list", help="List cached names")
+
+    args = parser.parse_args()
+    cache = RefCache(args.cache_dir)
+
+    if args.command == "prewarm":
+        added = cache.prewarm(args.tar, roles=args.roles)
+        print(f"Cached {len(added)} files from {args.tar}")
+    elif args.command == "add":
+        for path in args.files:
+            print(f"{cache.add(path)}  {path}")
+    elif args.command == "link":
+        linked = cache.link(cache_name(args.prefix), args.destination)
+        if not linked:
+            raise SystemExit(f"Nothing cached matches {args.prefix}")
+        for name, method in sorted(linked.items()):
+            print(f"{method:<9}{os.path.join(args.destination, name)}")
+    elif args.command == "evict":
+        removed = cache.evict(parse_size(args.max_size))
+        print(f"Evicted {len(removed)} objects")
+    else:
+        with cache._index() as index:
+            for name, digest in sorted(index["names"].items()):
+                size = index["objects"][digest]["size"]
+                print(f"{digest[:12]}  {size:>12}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+    Random access into a FastaWithDict reference (eg: hg38-brca1.fasta) via
+    its existing .fai index and mmap, so Python-side steps (interval checks,
+    GC content, BRCA1 region extraction) don't read the whole FASTA again.
+
+    Usage: python3 reference.py reference/hg38-brca1.fasta 17:43044045-43125733:1000-1100
+           python3 reference.py reference/hg38-brca1.fasta --gc 17:43044045-43125733
+
+    Regions on the command line are 1-based and inclusive, like samtools
+    faidx. Contig names (like the one above) may contain colons: a region
+    that matches a contig name is the whole contig, otherwise the last ":"
+    separates the contig from the range.
+"""
+
+import argparse
+import mmap
+from collections import namedtuple
+
+FaiEntry = namedtuple("FaiEntry", ["length", "offset", "line_bases", "line_width"])
+
+
+def read_fai(path):
+    entries = {}
+    with open(path) as f:
+        for line in f:
+            name, length, offset, line_bases, line_width = line.split("\t")[:5]
+            entries[name] = FaiEntry(
+                int(length), int(offset), int(line_bases), int(line_width)
+            )
+    return entries
+
+
+class FastaReference:
+    """
+    Regions use 0-based, half-open coordinates (like pysam's fetch).
+    """
+
+    def __init__(self, fasta, fai=None):
+        self.fasta = fasta
+        self.index = read_fai(fai or fasta + ".fai")
+        with open(fasta, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # a segment is still held, the mapping is unmapped once it's freed
+            pass
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def contigs(self):
+        return {name: entry.length for name, entry in self.index.items()}
+
+    def _bounds(self, contig, start, end):
+        if contig not in self.index:
+            raise KeyError(f"{contig} isn't in {self.fasta}")
+        entry = self.index[contig]
+        end = entry.length if end is None else min(end, entry.length)
+        if not 0 <= start <= end:
+            raise ValueError(f"Invalid region {contig}:{start}-{end}")
+        return entry, start, end
+
+    def _offset(self, entry, position):
+        line, column = divmod(position, entry.line_bases)
+        return entry.offset + line * entry.line_width + column
+
+    def segments(self, contig, start=0, end=None):
+        """
+        Yields zero-copy memoryviews of the region, one per FASTA line.
+        They point into the mapped file, so use or copy them before the
+        reference is closed.
+        """
+        entry, start, end = self._bounds(contig, start, end)
+        position = start
+        while position < end:
+            line_end = min(end, (position // entry.line_bases + 1) * entry.line_bases)
+            offset = self._offset(entry, position)
+            yield self._view[offset : offset + line_end - position]
+            position = line_end
+
+    def fetch(self, contig, start=0, end=None):
+        """
+        The region's bases as bytes, see segments() for zero-copy access
+        """
+        return b"".join(self.segments(contig, start, end))
+
+    def gc_content(self, contig, start=0, end=None):
+        gc = total = 0
+        for segment in self.segments(contig, start, end):
+            data = segment.tobytes().upper()
+            gc += data.count(b"G") + data.count(b"C")
+            total += len(data) - data.count(b"N")
+        return gc / total if total else 0.0
+
+
+def parse_region(region, contigs=()):
+    """
+    "contig:start-end" (1-based, inclusive) or "contig" -> (contig, start, end)
+    """
+    if region in contigs:
+        return region, 0, None
+    contig, _, span = region.rpartition(":")
+    if contig and "-" in span and span.replace("-", "").replace(",", "").isdigit():
+        start, end = span.replace(",", "").split("-")
+        return contig, int(start) - 1, int(end)
+    return region, 0, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch regions from an indexed FASTA")
+    parser.add_argument("fasta")
+    parser.add_argument("regions", nargs="+", help="contig:start-end, 1-based")
+    parser.add_argument("--gc", action="store_true", help="Print GC content instead")
+    args = parser.parse_args()
+
+    with FastaReference(args.fasta) as reference:
+        for region in args.regions:
+            contig, start, end = parse_region(region, reference.contigs)
+            if args.gc:
+                print(f"{region}\t{reference.gc_content(contig, start, end):.4f}")
+            else:
+                print(f">{region}")
+                print(reference.fetch(contig, start, end).decode())
+
+
+if __name__ == "__main__":
+    main()
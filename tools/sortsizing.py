@@ -0,0 +1,137 @@
+"""
+    Size the sort step of alignment.py from its inputs, instead of the
+    hard-coded maxRecordsInRam=5000000.
+
+    The number of reads is estimated from the FASTQ sizes and a sample of
+    the first records (compressed bytes per record), so it's fast on large
+    inputs. From that, SortSam gets:
+      - maxRecordsInRam: every record if it fits the memory cap, so small
+        inputs sort without spilling, otherwise as many as fit,
+      - the memory request: just enough heap for those records,
+      - tmpDir: the local scratch directory when it has to spill, with a
+        warning when the spill files get too many for one merge.
+
+    Usage: python3 sortsizing.py data/BRCA1_R1.fastq.gz data/BRCA1_R2.fastq.gz \\
+               [--max-memory 32] [--scratch /scratch] [-o sort-resources.json]
+           janis run -i sort-resources.json tutorial1/final/alignment.py
+
+    The output is JSON, which janis reads as a YAML inputs file.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import zlib
+
+# Rule of thumb for SortSam: records held per GB of Java heap
+RECORDS_PER_GB = 250000
+# Heap is 3/4 of the memory request (the Gatk4 tools pass -Xmx that way)
+HEAP_FRACTION = 0.75
+MIN_MEMORY_GB = 2
+# bwa mem also writes supplementary alignments, a few percent more records
+SUPPLEMENTARY = 1.05
+# Picard opens every spill file in the final merge
+MAX_SPILL_FILES = 1000
+SAMPLE_RECORDS = 10000
+CHUNK_SIZE = 64 * 1024
+
+
+def sample_fastq(path, records=SAMPLE_RECORDS):
+    """
+    Returns (records read, compressed bytes consumed, whether that was the
+    whole file), decompressing only until `records` FASTQ records are seen.
+    Handles multi-member gzip (eg: BGZF) and uncompressed FASTQ.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+        f.seek(0)
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16) if compressed else None
+        lines, consumed = 0, 0
+        while lines < 4 * records:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            consumed += len(chunk)
+            while chunk and decompressor:
+                data = decompressor.decompress(chunk)
+                lines += data.count(b"\n")
+                chunk = decompressor.unused_data
+                if chunk:
+                    # the next gzip member
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            if not decompressor:
+                lines += chunk.count(b"\n")
+    return lines // 4, consumed, consumed >= size
+
+
+def estimate_reads(path, records=SAMPLE_RECORDS):
+    sampled, consumed, complete = sample_fastq(path, records)
+    if complete or not sampled:
+        return sampled
+    return round(os.path.getsize(path) * sampled / consumed)
+
+
+def plan_sort(n_records, max_memory_gb=32, scratch=None):
+    """
+    Returns the SortSam settings for sorting n_records alignments
+    """
+    heap_cap = max_memory_gb * HEAP_FRACTION
+    fits = n_records <= heap_cap * RECORDS_PER_GB
+    max_records = n_records if fits else int(heap_cap * RECORDS_PER_GB)
+    # room for the records plus the JVM's own overhead
+    memory = max(MIN_MEMORY_GB, math.ceil(max_records / RECORDS_PER_GB / HEAP_FRACTION) + 1)
+    spill_files = 0 if fits else math.ceil(n_records / max_records)
+
+    plan = {
+        "records": n_records,
+        "maxRecordsInRam": max(1, max_records),
+        "memory": min(memory, max_memory_gb),
+        "spillFiles": spill_files,
+        "tmpDir": scratch or tempfile.gettempdir(),
+    }
+    if spill_files > MAX_SPILL_FILES:
+        plan["warning"] = (
+            f"{spill_files} spill files, more than {MAX_SPILL_FILES}: raise --max-memory "
+            "or sort by interval (tutorial1/final/alignment_scattersort.py)"
+        )
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Size SortSam from the FASTQ inputs")
+    parser.add_argument("fastqs", nargs="+")
+    parser.add_argument("--max-memory", type=int, default=32, help="GB, the node's limit")
+    parser.add_argument("--scratch", help="Local disk for spill files, default: $TMPDIR")
+    parser.add_argument("--sample", type=int, default=SAMPLE_RECORDS, help="Records sampled")
+    parser.add_argument("-o", "--output", help="Inputs file to write, default: stdout")
+    args = parser.parse_args()
+
+    reads = sum(estimate_reads(fastq, args.sample) for fastq in args.fastqs)
+    plan = plan_sort(int(reads * SUPPLEMENTARY), args.max_memory, args.scratch)
+    if "warning" in plan:
+        print(f"Warning: {plan['warning']}", file=sys.stderr)
+    print(
+        f"~{plan['records']} records: maxRecordsInRam={plan['maxRecordsInRam']}, "
+        f"{plan['memory']}GB, {plan['spillFiles']} spill files",
+        file=sys.stderr,
+    )
+
+    # workflow inputs of alignment.py, and the sortsam step's memory override
+    inputs = {
+        "sortMaxRecordsInRam": plan["maxRecordsInRam"],
+        "sortTmpDir": plan["tmpDir"],
+        "sortsam_runtime_memory": plan["memory"],
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(inputs, f, indent=2)
+    else:
+        print(json.dumps(inputs, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,19 @@ w = janis.Workflow("alignmentWorkflow")
 
 # Inputs
 w.input("readGroup", janis.String, value="'@RG\\tID:NA12878\\tSM:NA12878\\tLB:NA12878\\tPL:ILLUMINA'")
+# Paths are relative to the workshop directory (the layout of janis-data.tar). The
+# reference and its indexes can be linked in from the shared cache, instead of copied:
+#   python3 tools/refcache.py link reference/hg38-brca1 .
 w.input("fastq", Fastq, value=[
-    "/Users/franklinmichael/source/janis-workshops/workshop2/data/BRCA1_R1.fastq.gz",
-    "/Users/franklinmichael/source/janis-workshops/workshop2/data/BRCA1_R2.fastq.gz",
+    "data/BRCA1_R1.fastq.gz",
+    "data/BRCA1_R2.fastq.gz",
 ])
-w.input("reference", FastaWithDict, 
-value="/Users/franklinmichael/reference/hg38/assembly_contigs_renamed/Homo_sapiens_assembly38.fasta")
+w.input("reference", FastaWithDict, value="reference/hg38-brca1.fasta")
+# Sized from the FASTQs by tools/sortsizing.py, eg:
+#   python3 tools/sortsizing.py data/BRCA1_R*.fastq.gz -o sort-resources.json
+#   janis run -i sort-resources.json tutorial1/final/alignment.py
+w.input("sortMaxRecordsInRam", janis.Int, value=5000000)
+w.input("sortTmpDir", janis.String, value="/tmp/")
 
 # Steps
 w.step(
@@ -32,7 +39,8 @@ w.step(
     sortOrder="coordinate",
     createIndex=True,
     validationStringency="SILENT",
-    maxRecordsInRam=5000000,
+    maxRecordsInRam=w.sortMaxRecordsInRam,
+    tmpDir=w.sortTmpDir,
 )
 
 # Outputs
@@ -0,0 +1,80 @@
+"""
+    The alignment workflow with bwa mem, BAM encoding and coordinate sorting
+    fused into one streaming step.
+
+    alignment.py writes an uncompressed SAM (bwamem), reads it back to write
+    a BAM (samtoolsview), then reads that BAM again to sort it (sortsam).
+    Here bwa mem is piped straight into samtools sort, which reads SAM on
+    stdin, so only the final sorted, indexed BAM is written.
+
+    Run from the workshop directory (the layout of janis-data.tar), eg:
+        janis run -o fused tutorial1/final/alignment_fused.py
+    and compare against the three-step version with tools/bench_alignment.py
+"""
+
+import janis
+from janis_core import CommandToolBuilder, ToolArgument, ToolInput, ToolOutput
+
+from janis_bioinformatics.data_types import Fastq, FastaWithDict, BamBai
+
+BwaMemSortSam = CommandToolBuilder(
+    tool="bwamemsortsam",
+    base_command=None,
+    arguments=[
+        # A pipeline's status is only its last command's, and /bin/sh may not
+        # have pipefail, so a bwa failure is recorded and checked after the
+        # sort: a truncated SAM must not become a "successful" BAM.
+        ToolArgument("{ bwa mem", position=0, shell_quote=False),
+        # samtools sort reads the SAM from stdin ("-"), and spills sorted runs
+        # of sortMemory per thread to temporary files when it has to
+        ToolArgument(
+            "|| echo $? > bwa.failed; } | samtools sort", position=4, shell_quote=False
+        ),
+        ToolArgument(
+            "-o aligned.bam - && test ! -e bwa.failed && samtools index aligned.bam",
+            position=7,
+            shell_quote=False,
+        ),
+    ],
+    inputs=[
+        ToolInput("readGroupHeaderLine", janis.String, prefix="-R", position=1),
+        ToolInput("threads", janis.Int(optional=True), prefix="-t", position=1),
+        ToolInput("reference", FastaWithDict, position=2),
+        ToolInput("reads", Fastq, position=3),
+        ToolInput("sortThreads", janis.Int(optional=True), prefix="-@", position=5),
+        ToolInput(
+            "sortMemory",
+            janis.String(optional=True),
+            default="768M",
+            prefix="-m",
+            position=6,
+            doc="Memory per sort thread, eg: 768M",
+        ),
+    ],
+    outputs=[ToolOutput("out", BamBai, glob="aligned.bam")],
+    # bwa 0.7.17 and samtools 1.9 in one image, so they can share a pipe
+    container="michaelfranklin/bwasamtools:0.7.17-1.9",
+    version="v0.7.17-1.9",
+)
+
+w = janis.Workflow("alignmentWorkflowFused")
+
+# Inputs
+w.input("readGroup", janis.String, value="'@RG\\tID:NA12878\\tSM:NA12878\\tLB:NA12878\\tPL:ILLUMINA'")
+w.input("fastq", Fastq, value=[
+    "data/BRCA1_R1.fastq.gz",
+    "data/BRCA1_R2.fastq.gz",
+])
+w.input("reference", FastaWithDict, value="reference/hg38-brca1.fasta")
+
+# Steps
+w.step(
+    "bwamemsortsam",
+    BwaMemSortSam,
+    reads=w.fastq,
+    readGroupHeaderLine=w.readGroup,
+    reference=w.reference,
+)
+
+# Outputs
+w.output("out", source=w.bwamemsortsam.out)
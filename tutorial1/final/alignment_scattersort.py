@@ -0,0 +1,109 @@
+"""
+    The alignment workflow with a scatter-gather sort instead of one SortSam.
+
+    bwa mem's SAM is split into N partitions by genomic position (the
+    contig boundaries in the reference's .dict, see tools/partition.py),
+    each partition is converted and sorted in parallel, and as the
+    partitions are in genomic order, the sorted BAMs are concatenated with
+    samtools cat (no merge) and indexed. Each SortSam only holds about 1/N
+    of the reads.
+
+    Run from the workshop directory (the layout of janis-data.tar), eg:
+        janis run -o scattersort tutorial1/final/alignment_scattersort.py --partitions 8
+"""
+
+import janis
+from janis_core import (
+    CommandToolBuilder,
+    ToolArgument,
+    ToolInput,
+    ToolOutput,
+    WildcardSelector,
+)
+
+from janis_bioinformatics.tools.bwa.mem.latest import BwaMemLatest
+from janis_bioinformatics.tools.samtools.view.view import SamToolsView_1_9
+from janis_bioinformatics.tools.gatk4 import Gatk4SortSam_4_1_3
+from janis_bioinformatics.data_types import Fastq, FastaWithDict, Sam, Bam, BamBai, Bed
+
+PartitionSam = CommandToolBuilder(
+    tool="partitionsam",
+    base_command=["python3"],
+    inputs=[
+        ToolInput("script", janis.File, position=0, doc="tools/partition.py"),
+        ToolInput("sam", Sam, position=1),
+        ToolInput("partitions", janis.Int, prefix="--partitions", position=2),
+        # partition.py finds the .dict next to the fasta
+        ToolInput("reference", FastaWithDict, prefix="--reference", position=3),
+        ToolInput("intervals", Bed(optional=True), prefix="--bed", position=4),
+    ],
+    arguments=[ToolArgument(".", prefix="--outdir", position=5)],
+    outputs=[
+        # zero padded, so these sort in genomic order, unplaced reads last
+        ToolOutput("out", janis.Array(Sam), glob=WildcardSelector("partition-*.sam"))
+    ],
+    container="python:3.7",
+    version="v0.1.0",
+)
+
+SamToolsCat = CommandToolBuilder(
+    tool="samtoolscat",
+    base_command=["samtools", "cat"],
+    inputs=[
+        ToolInput("bams", janis.Array(Bam), position=2, doc="Sorted BAMs, in genomic order"),
+    ],
+    arguments=[
+        ToolArgument("-o cat.bam", position=1, shell_quote=False),
+        ToolArgument("&& samtools index cat.bam", position=3, shell_quote=False),
+    ],
+    outputs=[ToolOutput("out", BamBai, glob="cat.bam")],
+    container="quay.io/biocontainers/samtools:1.9--h8571acd_11",
+    version="v1.9.0",
+)
+
+w = janis.Workflow("alignmentWorkflowScatterSort")
+
+# Inputs
+w.input("readGroup", janis.String, value="'@RG\\tID:NA12878\\tSM:NA12878\\tLB:NA12878\\tPL:ILLUMINA'")
+w.input("fastq", Fastq, value=[
+    "data/BRCA1_R1.fastq.gz",
+    "data/BRCA1_R2.fastq.gz",
+])
+w.input("reference", FastaWithDict, value="reference/hg38-brca1.fasta")
+w.input("partitions", janis.Int, value=4)
+# Optionally weight the partitions by target regions, eg: data/BRCA1.bed
+w.input("intervals", Bed(optional=True))
+w.input("partitionScript", janis.File, value="tools/partition.py")
+
+# Steps
+w.step(
+    "bwamem",
+    BwaMemLatest,
+    reads=w.fastq,
+    readGroupHeaderLine=w.readGroup,
+    reference=w.reference,
+)
+w.step(
+    "partition",
+    PartitionSam,
+    script=w.partitionScript,
+    sam=w.bwamem.out,
+    partitions=w.partitions,
+    reference=w.reference,
+    intervals=w.intervals,
+)
+w.step("samtoolsview", SamToolsView_1_9, scatter="sam", sam=w.partition.out)
+w.step(
+    "sortsam",
+    Gatk4SortSam_4_1_3,
+    scatter="bam",
+    bam=w.samtoolsview.out,
+    sortOrder="coordinate",
+    createIndex=True,
+    validationStringency="SILENT",
+    maxRecordsInRam=5000000,
+)
+w.step("cat", SamToolsCat, bams=w.sortsam.out)
+
+# Outputs
+w.output("out", source=w.cat.out)
@@ -0,0 +1,107 @@
+"""
+    The alignment workflow, with bwa mem scattered over shards of the reads.
+
+    The paired FASTQs are split into N record-aligned, pair-synchronised
+    shards by tools/fastqchunk.py, each shard is aligned and sorted on its
+    own, and the sorted shards are merged into one indexed BAM.
+
+    Run from the workshop directory (the layout of janis-data.tar), eg:
+        janis run -o sharded tutorial1/final/alignment_sharded.py --shards 4
+"""
+
+import janis
+from janis_core import (
+    CommandToolBuilder,
+    ToolArgument,
+    ToolInput,
+    ToolOutput,
+    WildcardSelector,
+)
+
+from janis_bioinformatics.tools.samtools.view.view import SamToolsView_1_9
+from janis_bioinformatics.tools.gatk4 import Gatk4SortSam_4_1_3, Gatk4MergeSamFiles_4_1_3
+from janis_bioinformatics.data_types import Fastq, FastqGz, FastaWithDict, Sam
+
+FastqChunk = CommandToolBuilder(
+    tool="fastqchunk",
+    base_command=["python3"],
+    inputs=[
+        ToolInput("script", janis.File, position=0, doc="tools/fastqchunk.py"),
+        ToolInput("reads", Fastq, position=1, doc="Paired R1 and R2 FASTQs"),
+        ToolInput("shards", janis.Int, prefix="--shards", position=2),
+    ],
+    arguments=[ToolArgument(".", prefix="--outdir", position=3)],
+    outputs=[
+        # shard numbers are zero padded, so these sort in shard order
+        ToolOutput(
+            "out_R1", janis.Array(FastqGz), glob=WildcardSelector("shard-*_R1.fastq.gz")
+        ),
+        ToolOutput(
+            "out_R2", janis.Array(FastqGz), glob=WildcardSelector("shard-*_R2.fastq.gz")
+        ),
+    ],
+    container="python:3.7",
+    version="v0.1.0",
+)
+
+# bwa mem with the mates as separate inputs, so a step can dot-scatter over R1 / R2 shards
+BwaMemShard = CommandToolBuilder(
+    tool="bwamemshard",
+    base_command=["bwa", "mem"],
+    inputs=[
+        ToolInput("reference", FastaWithDict, position=1),
+        ToolInput("reads1", FastqGz, position=2),
+        ToolInput("reads2", FastqGz, position=3),
+        ToolInput("readGroupHeaderLine", janis.String, prefix="-R", position=0),
+        ToolInput("threads", janis.Int(optional=True), prefix="-t", position=0),
+    ],
+    outputs=[ToolOutput("out", janis.Stdout(Sam()))],
+    container="biocontainers/bwa:v0.7.15_cv3",
+    version="v0.7.15",
+)
+
+w = janis.Workflow("alignmentWorkflowSharded")
+
+# Inputs
+w.input("readGroup", janis.String, value="'@RG\\tID:NA12878\\tSM:NA12878\\tLB:NA12878\\tPL:ILLUMINA'")
+w.input("fastq", Fastq, value=[
+    "data/BRCA1_R1.fastq.gz",
+    "data/BRCA1_R2.fastq.gz",
+])
+w.input("reference", FastaWithDict, value="reference/hg38-brca1.fasta")
+w.input("shards", janis.Int, value=4)
+w.input("chunkScript", janis.File, value="tools/fastqchunk.py")
+
+# Steps
+w.step("chunk", FastqChunk, script=w.chunkScript, reads=w.fastq, shards=w.shards)
+w.step(
+    "bwamem",
+    BwaMemShard,
+    scatter=["reads1", "reads2"],
+    reads1=w.chunk.out_R1,
+    reads2=w.chunk.out_R2,
+    readGroupHeaderLine=w.readGroup,
+    reference=w.reference,
+)
+w.step("samtoolsview", SamToolsView_1_9, scatter="sam", sam=w.bwamem.out)
+w.step(
+    "sortsam",
+    Gatk4SortSam_4_1_3,
+    scatter="bam",
+    bam=w.samtoolsview.out,
+    sortOrder="coordinate",
+    createIndex=True,
+    validationStringency="SILENT",
+    maxRecordsInRam=5000000,
+)
+# the shards are already coordinate sorted, merging keeps that order
+w.step(
+    "merge",
+    Gatk4MergeSamFiles_4_1_3,
+    bams=w.sortsam.out,
+    createIndex=True,
+    validationStringency="SILENT",
+)
+
+# Outputs
+w.output("out", source=w.merge.out)